@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Benchmark ``memote.support.annotation``."""
+
+from __future__ import absolute_import
+
+import memote.support.annotation as annotation
+
+from benchmarks.models import ModelBenchmark
+
+
+class Annotation(ModelBenchmark):
+    """Benchmark the annotation checks on metabolites and reactions."""
+
+    params = (ModelBenchmark.params, ["metabolites", "reactions"])
+    param_names = ["model", "components"]
+
+    def time_find_components_without_annotation(self, filenames, name,
+                                                components):
+        annotation.find_components_without_annotation(self.model, components)
+
+    def peakmem_find_components_without_annotation(self, filenames, name,
+                                                   components):
+        annotation.find_components_without_annotation(self.model, components)
+
+    def time_generate_component_annotation_miriam_match_overview(
+            self, filenames, name, components):
+        annotation.generate_component_annotation_miriam_match_overview(
+            getattr(self.model, components), components)
+
+    def peakmem_generate_component_annotation_miriam_match_overview(
+            self, filenames, name, components):
+        annotation.generate_component_annotation_miriam_match_overview(
+            getattr(self.model, components), components)
+
+    def time_generate_component_id_namespace_overview(self, filenames, name,
+                                                      components):
+        annotation.generate_component_id_namespace_overview(
+            self.model, components)
+
+    def peakmem_generate_component_id_namespace_overview(
+            self, filenames, name, components):
+        annotation.generate_component_id_namespace_overview(
+            self.model, components)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Benchmark ``memote.support.basic``."""
+
+from __future__ import absolute_import
+
+import memote.support.basic as basic
+
+from benchmarks.models import SMALL, ModelBenchmark, clear_caches
+
+
+class Basic(ModelBenchmark):
+    """Benchmark the basic checks that scale with the model size."""
+
+    def time_check_metabolites_formula_presence(self, *args):
+        basic.check_metabolites_formula_presence(self.model)
+
+    def peakmem_check_metabolites_formula_presence(self, *args):
+        basic.check_metabolites_formula_presence(self.model)
+
+    def time_check_gene_protein_reaction_rule_presence(self, *args):
+        basic.check_gene_protein_reaction_rule_presence(self.model)
+
+    def peakmem_check_gene_protein_reaction_rule_presence(self, *args):
+        basic.check_gene_protein_reaction_rule_presence(self.model)
+
+    def time_find_ngam(self, *args):
+        basic.find_ngam(self.model)
+
+    def peakmem_find_ngam(self, *args):
+        basic.find_ngam(self.model)
+
+    def time_calculate_metabolic_coverage(self, *args):
+        basic.calculate_metabolic_coverage(self.model)
+
+    def peakmem_calculate_metabolic_coverage(self, *args):
+        basic.calculate_metabolic_coverage(self.model)
+
+    def time_find_enzyme_complexes(self, *args):
+        clear_caches()
+        basic.find_enzyme_complexes(self.model)
+
+    def peakmem_find_enzyme_complexes(self, *args):
+        clear_caches()
+        basic.find_enzyme_complexes(self.model)
+
+    def time_find_unique_metabolites(self, *args):
+        basic.find_unique_metabolites(self.model)
+
+    def peakmem_find_unique_metabolites(self, *args):
+        basic.find_unique_metabolites(self.model)
+
+
+class BasicTransport(ModelBenchmark):
+    """Benchmark the basic checks that depend on the transport reactions."""
+
+    params = SMALL
+    number = 1
+    repeat = 3
+
+    def time_find_pure_metabolic_reactions(self, *args):
+        basic.find_pure_metabolic_reactions(self.model)
+
+    def peakmem_find_pure_metabolic_reactions(self, *args):
+        basic.find_pure_metabolic_reactions(self.model)
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Benchmark ``memote.support.biomass``."""
+
+from __future__ import absolute_import
+
+import memote.support.biomass as biomass
+import memote.support.helpers as helpers
+
+from benchmarks.models import SMALL, ModelBenchmark, clear_caches
+
+
+class Biomass(ModelBenchmark):
+    """Benchmark the functions that inspect the biomass reaction."""
+
+    def setup(self, *args):
+        super(Biomass, self).setup(*args)
+        self.reaction = helpers.find_biomass_reaction(self.model)[0]
+
+    def time_sum_biomass_weight(self, *args):
+        clear_caches()
+        biomass.sum_biomass_weight(self.reaction)
+
+    def peakmem_sum_biomass_weight(self, *args):
+        clear_caches()
+        biomass.sum_biomass_weight(self.reaction)
+
+    def time_find_biomass_precursors(self, *args):
+        biomass.find_biomass_precursors(self.reaction)
+
+    def peakmem_find_biomass_precursors(self, *args):
+        biomass.find_biomass_precursors(self.reaction)
+
+    def time_gam_in_biomass(self, *args):
+        biomass.gam_in_biomass(self.reaction)
+
+    def peakmem_gam_in_biomass(self, *args):
+        biomass.gam_in_biomass(self.reaction)
+
+
+class BiomassOptimization(ModelBenchmark):
+    """Benchmark the functions that optimize the biomass precursors."""
+
+    params = SMALL
+    number = 1
+    repeat = 3
+
+    def setup(self, *args):
+        super(BiomassOptimization, self).setup(*args)
+        self.reaction = helpers.find_biomass_reaction(self.model)[0]
+
+    def time_find_blocked_biomass_precursors(self, *args):
+        biomass.find_blocked_biomass_precursors(self.reaction, self.model)
+
+    def peakmem_find_blocked_biomass_precursors(self, *args):
+        biomass.find_blocked_biomass_precursors(self.reaction, self.model)
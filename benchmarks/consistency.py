@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Benchmark ``memote.support.consistency``."""
+
+from __future__ import absolute_import
+
+import memote.support.consistency as consistency
+
+from benchmarks.models import SMALL, ModelBenchmark, clear_caches
+
+
+class Consistency(ModelBenchmark):
+    """Benchmark the functions that scale with the model size."""
+
+    def time_find_mass_imbalanced_reactions(self, *args):
+        clear_caches()
+        consistency.find_mass_imbalanced_reactions(self.model)
+
+    def peakmem_find_mass_imbalanced_reactions(self, *args):
+        clear_caches()
+        consistency.find_mass_imbalanced_reactions(self.model)
+
+    def time_find_charge_imbalanced_reactions(self, *args):
+        consistency.find_charge_imbalanced_reactions(self.model)
+
+    def peakmem_find_charge_imbalanced_reactions(self, *args):
+        consistency.find_charge_imbalanced_reactions(self.model)
+
+    def time_find_metabolite_connectivity_issues(self, *args):
+        consistency.find_metabolite_connectivity_issues(self.model)
+
+    def peakmem_find_metabolite_connectivity_issues(self, *args):
+        consistency.find_metabolite_connectivity_issues(self.model)
+
+
+class ConsistencyOptimization(ModelBenchmark):
+    """Benchmark the functions that solve (MI)LP problems."""
+
+    params = SMALL
+    number = 1
+    repeat = 3
+
+    def time_check_stoichiometric_consistency(self, *args):
+        consistency.check_stoichiometric_consistency(self.model)
+
+    def peakmem_check_stoichiometric_consistency(self, *args):
+        consistency.check_stoichiometric_consistency(self.model)
+
+    def time_find_unconserved_metabolites(self, *args):
+        consistency.find_unconserved_metabolites(self.model)
+
+    def peakmem_find_unconserved_metabolites(self, *args):
+        consistency.find_unconserved_metabolites(self.model)
+
+    def time_find_inconsistent_min_stoichiometry(self, *args):
+        consistency.find_inconsistent_min_stoichiometry(self.model)
+
+    def peakmem_find_inconsistent_min_stoichiometry(self, *args):
+        consistency.find_inconsistent_min_stoichiometry(self.model)
+
+    def time_find_blocked_reactions(self, *args):
+        consistency.find_blocked_reactions(self.model)
+
+    def peakmem_find_blocked_reactions(self, *args):
+        consistency.find_blocked_reactions(self.model)
+
+    def time_find_stoichiometrically_balanced_cycles(self, *args):
+        consistency.find_stoichiometrically_balanced_cycles(self.model)
+
+    def peakmem_find_stoichiometrically_balanced_cycles(self, *args):
+        consistency.find_stoichiometrically_balanced_cycles(self.model)
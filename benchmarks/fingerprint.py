@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark ``memote.support.fingerprint``."""
+
+from __future__ import absolute_import
+
+import memote.support.fingerprint as fingerprint
+
+from benchmarks.models import ModelBenchmark
+
+
+class Fingerprint(ModelBenchmark):
+    """Benchmark hashing the model components."""
+
+    def time_fingerprint(self, *args):
+        fingerprint.fingerprint(self.model)
+
+    def peakmem_fingerprint(self, *args):
+        fingerprint.fingerprint(self.model)
+
+    def time_hash_reactions(self, *args):
+        fingerprint.hash_components(self.model, "reactions")
+
+    def time_hash_metabolites(self, *args):
+        fingerprint.hash_components(self.model, "metabolites")
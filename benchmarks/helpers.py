@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Benchmark ``memote.support.helpers``."""
+
+from __future__ import absolute_import
+
+import memote.support.helpers as helpers
+
+from benchmarks.models import SMALL, ModelBenchmark, clear_caches
+
+
+class Helpers(ModelBenchmark):
+    """Benchmark the helpers that scale with the model size."""
+
+    def time_find_biomass_reaction(self, *args):
+        helpers.find_biomass_reaction(self.model)
+
+    def peakmem_find_biomass_reaction(self, *args):
+        helpers.find_biomass_reaction(self.model)
+
+    def time_find_exchange_rxns(self, *args):
+        helpers.find_exchange_rxns(self.model)
+
+    def peakmem_find_exchange_rxns(self, *args):
+        helpers.find_exchange_rxns(self.model)
+
+    def time_find_demand_reactions(self, *args):
+        helpers.find_demand_reactions(self.model)
+
+    def peakmem_find_demand_reactions(self, *args):
+        helpers.find_demand_reactions(self.model)
+
+    def time_find_sink_reactions(self, *args):
+        helpers.find_sink_reactions(self.model)
+
+    def peakmem_find_sink_reactions(self, *args):
+        helpers.find_sink_reactions(self.model)
+
+    def _functional_units(self):
+        clear_caches()
+        for rxn in self.model.reactions:
+            if rxn.gene_reaction_rule:
+                list(helpers.find_functional_units(rxn.gene_reaction_rule))
+
+    def time_find_functional_units(self, *args):
+        self._functional_units()
+
+    def peakmem_find_functional_units(self, *args):
+        self._functional_units()
+
+    def time_formula_cache(self, *args):
+        helpers.FormulaCache().weights(self.model.metabolites)
+
+    def peakmem_formula_cache(self, *args):
+        helpers.FormulaCache().weights(self.model.metabolites)
+
+
+class HelpersTransport(ModelBenchmark):
+    """Benchmark the identification of transport reactions."""
+
+    params = SMALL
+    number = 1
+    repeat = 3
+
+    def time_find_transport_reactions(self, *args):
+        helpers.find_transport_reactions(self.model)
+
+    def peakmem_find_transport_reactions(self, *args):
+        helpers.find_transport_reactions(self.model)
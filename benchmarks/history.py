@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark reading the results of a long commit history."""
+
+from __future__ import absolute_import
+
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+from os.path import abspath, join
+
+from memote.suite.results import dump_result
+from memote.suite.reporting.bag import ResultBagWrapper
+from memote.suite.reporting.store import ResultStore
+
+#: The number of synthetic commits.
+COMMITS = 5000
+
+#: The length of the identifier lists in every result.
+LENGTH = 2000
+
+
+def result_document(num):
+    """Create a result with the metrics that the history report reads."""
+    commit = "{:040x}".format(num)
+    ids = ["R{:d}".format(i) for i in range(LENGTH)]
+    return {
+        "meta": {
+            "commit_hash": commit,
+            "timestamp": (datetime(2017, 1, 1) +
+                          timedelta(hours=num)).isoformat(" ")
+        },
+        "tests": {
+            "test_model_id_presence": {"data": "model"},
+            "test_genes_presence": {"data": ids[:num % LENGTH]},
+            "test_reactions_presence": {"data": ids},
+            "test_metabolites_presence": {"data": ids},
+            "test_metabolites_formula_presence": {"data": ids[:num % LENGTH]},
+            "test_metabolites_charge_presence": {"data": ids},
+            "test_gene_protein_reaction_rule_presence": {"data": ids},
+            "test_ngam_presence": {"data": ["ATPM"]},
+            "test_stoichiometric_consistency": {"data": ids},
+            "test_detect_energy_generating_cycles": {
+                "data": {"atp_c": [], "nadh_c": []}},
+            "test_reaction_mass_balance": {"data": ids},
+            "test_reaction_charge_balance": {"data": ids},
+            "test_blocked_reactions": {"data": ids},
+            "test_biomass_presence": {"data": ["BIOMASS"]},
+            "test_biomass_consistency": {"data": {"BIOMASS": 1.0}},
+            "test_biomass_default_production": {"data": {"BIOMASS": 0.8}},
+            "test_biomass_precursors_default_production": {
+                "data": {"BIOMASS": []}},
+            "test_biomass_precursors_open_production": {
+                "data": {"BIOMASS": []}},
+            "test_gam_in_biomass": {"data": {"BIOMASS": True}}
+        }
+    }
+
+
+class History(object):
+    """
+    Benchmark the data frames of the history report.
+
+    ``setup_cache`` writes one result per synthetic commit and ingests them
+    into a ``ResultStore`` once. Each benchmark then builds the index and
+    the basic and consistency data frames from either representation. The
+    bag is read by a pool of processes (on several CPUs) or in one thread.
+
+    """
+
+    timeout = 1800
+    number = 1
+    repeat = 3
+
+    def setup_cache(self):
+        """Write the result files and a store of their metrics."""
+        directory = abspath("results")
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        files = list()
+        for num in range(COMMITS):
+            files.append(join(directory, "{:040x}.json".format(num)))
+            dump_result(result_document(num), files[-1])
+        store = abspath("store")
+        ResultStore(store).ingest(files)
+        return files, store
+
+    def setup(self, cache):
+        """Provide an empty directory for a new store."""
+        self.tmpdir = tempfile.mkdtemp()
+
+    def teardown(self, cache):
+        """Remove the new store."""
+        shutil.rmtree(self.tmpdir)
+
+    def time_bag_dataframes(self, cache):
+        bag = ResultBagWrapper(cache[0])
+        bag.build_index()
+        bag.get_basic_dataframe()
+        bag.get_consistency_dataframe()
+
+    def time_bag_dataframes_sync(self, cache):
+        bag = ResultBagWrapper(cache[0], scheduler="sync")
+        bag.build_index()
+        bag.get_basic_dataframe()
+        bag.get_consistency_dataframe()
+
+    def time_store_ingest(self, cache):
+        ResultStore(join(self.tmpdir, "store")).ingest(cache[0])
+
+    def time_store_dataframes(self, cache):
+        store = ResultStore(cache[1])
+        store.build_index()
+        store.get_basic_dataframe()
+        store.get_consistency_dataframe()
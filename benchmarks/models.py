@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Provide the models that the benchmarks are run on."""
+
+from __future__ import absolute_import
+
+import re
+import warnings
+from builtins import dict
+from os.path import dirname, join
+
+from cobra import Metabolite, Model, Reaction
+from cobra.io import read_sbml_model
+from six import iteritems
+from six.moves import cPickle as pickle
+
+import memote.support.helpers as helpers
+
+__all__ = ("SMALL", "ALL", "LARGE", "load_model", "tile_model",
+           "clear_caches", "ModelBenchmark", "LargeModelBenchmark")
+
+DATA = join(dirname(dirname(__file__)), "tests", "data")
+
+#: The bundled models.
+FILES = {
+    "EcoliCore": "EcoliCore.xml.gz",
+    "iJR904": "iJR904.xml.gz"
+}
+
+#: Names of models that even expensive (FBA-heavy) functions finish on.
+SMALL = ("EcoliCore", "iJR904")
+
+#: Names of all models including synthetic ones of genome-scale size. A name
+#: 'tiled-<model>-<copies>' denotes independent copies of a bundled model and
+#: 'synthetic-<reactions>' a generated model of the given size.
+ALL = SMALL + ("tiled-iJR904-10", "synthetic-10000")
+
+#: Sizes of generated models that only the cheapest functions are run on.
+LARGE = ("synthetic-10000", "synthetic-50000", "synthetic-200000")
+
+GENE_TOKEN = re.compile(r"[^\s()]+")
+
+
+def _rename(identifier, copy, compartments):
+    """Insert the copy number before a compartment suffix if present."""
+    base, _, suffix = identifier.rpartition("_")
+    if base and suffix in compartments:
+        return "{}_{:d}_{}".format(base, copy, suffix)
+    return "{}_{:d}".format(identifier, copy)
+
+
+def tile_model(model, copies):
+    """
+    Combine independent copies of a model into one large model.
+
+    The copies share no metabolites such that the structure of the network,
+    e.g., the number of reactions per metabolite, stays realistic while the
+    size grows linearly. Identifiers keep their compartment suffix. The
+    objective is the biomass reaction of the first copy.
+
+    Parameters
+    ----------
+    model : cobra.Model
+        The metabolic model to tile.
+    copies : int
+        The number of copies.
+
+    Returns
+    -------
+    cobra.Model
+        A new model with ``copies`` times as many components.
+
+    """
+    tiled = Model("{}_x{:d}".format(model.id, copies))
+    compartments = set(model.compartments)
+    keywords = frozenset(["and", "or"])
+    reactions = list()
+    objective = None
+    for num in range(copies):
+        mets = dict()
+        for met in model.metabolites:
+            new = Metabolite(
+                _rename(met.id, num, compartments), formula=met.formula,
+                name=met.name, charge=met.charge,
+                compartment=met.compartment)
+            new.annotation = dict(met.annotation)
+            mets[met] = new
+
+        def rename_gene(match, num=num):
+            token = match.group(0)
+            if token in keywords:
+                return token
+            return "{}_{:d}".format(token, num)
+
+        for rxn in model.reactions:
+            new = Reaction(
+                _rename(rxn.id, num, compartments), name=rxn.name,
+                lower_bound=rxn.lower_bound, upper_bound=rxn.upper_bound)
+            new.add_metabolites(dict(
+                (mets[met], coef) for met, coef in iteritems(rxn.metabolites)))
+            new.gene_reaction_rule = GENE_TOKEN.sub(
+                rename_gene, rxn.gene_reaction_rule)
+            new.annotation = dict(rxn.annotation)
+            if num == 0 and rxn.objective_coefficient != 0:
+                objective = new
+            reactions.append(new)
+    tiled.add_reactions(reactions)
+    if objective is not None:
+        tiled.objective = objective.id
+    return tiled
+
+
+def load_model(name):
+    """
+    Load a bundled model or build a synthetic one by name.
+
+    Parameters
+    ----------
+    name : str
+        One of the names in ``ALL`` or ``LARGE``.
+
+    """
+    if name.startswith("tiled-"):
+        _, base, copies = name.split("-")
+        return tile_model(load_model(base), int(copies))
+    if name.startswith("synthetic-"):
+        # Imported here such that benchmarks of earlier commits still load.
+        from memote.synthetic import generate_model
+        return generate_model(int(name.split("-")[1]))
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        return read_sbml_model(join(DATA, FILES[name]))
+
+
+def clear_caches():
+    """
+    Empty memote's memoized functional units and formula caches.
+
+    Benchmarks of functions that use these caches call this first such that
+    every repetition measures the computation rather than the look-up.
+    Earlier commits lack the caches.
+
+    """
+    functional_units = getattr(helpers, "_functional_units", None)
+    if functional_units is not None:
+        functional_units.cache_clear()
+    formula_caches = getattr(helpers, "_FORMULA_CACHES", None)
+    if formula_caches is not None:
+        formula_caches.clear()
+
+
+def _pickle_models(names):
+    """Pickle the named models into the current working directory."""
+    filenames = dict()
+    for name in names:
+        filenames[name] = "{}.pickle".format(name)
+        with open(filenames[name], "wb") as file_h:
+            pickle.dump(load_model(name), file_h,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+    return filenames
+
+
+class ModelBenchmark(object):
+    """
+    Provide one model per benchmark parameter.
+
+    Loading SBML and building the synthetic models is expensive, therefore,
+    asv builds all of them once in ``setup_cache``, which all subclasses
+    share, and stores them as pickles. Each benchmark process only unpickles
+    the model that it needs such that the peak memory reflects that model
+    alone.
+
+    """
+
+    params = ALL
+    param_names = ["model"]
+    timeout = 300
+
+    def setup_cache(self):
+        """Pickle each model into the benchmark's working directory."""
+        return _pickle_models(ALL)
+
+    def setup(self, filenames, name, *args):
+        """Load the model of the first parameter."""
+        with open(filenames[name], "rb") as file_h:
+            self.model = pickle.load(file_h)
+
+
+class LargeModelBenchmark(ModelBenchmark):
+    """Provide generated models of up to 200,000 reactions."""
+
+    params = LARGE
+    timeout = 3600
+
+    def setup_cache(self):
+        """Pickle each model into the benchmark's working directory."""
+        return _pickle_models(LARGE)
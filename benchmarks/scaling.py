@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Benchmark how ``memote.support`` scales to 200,000 reactions."""
+
+from __future__ import absolute_import
+
+import memote.support.annotation as annotation
+import memote.support.basic as basic
+import memote.support.consistency as consistency
+import memote.support.fingerprint as fingerprint
+import memote.support.helpers as helpers
+
+from benchmarks.models import LargeModelBenchmark, clear_caches
+
+
+class Scaling(LargeModelBenchmark):
+    """
+    Benchmark the functions that are linear in the model size.
+
+    Unpickling the largest model alone takes minutes, so each benchmark is
+    measured once. Use ``asv run --bench Scaling`` to run only these.
+
+    """
+
+    number = 1
+    repeat = 1
+
+    def time_find_mass_imbalanced_reactions(self, *args):
+        clear_caches()
+        consistency.find_mass_imbalanced_reactions(self.model)
+
+    def peakmem_find_mass_imbalanced_reactions(self, *args):
+        clear_caches()
+        consistency.find_mass_imbalanced_reactions(self.model)
+
+    def time_find_charge_imbalanced_reactions(self, *args):
+        consistency.find_charge_imbalanced_reactions(self.model)
+
+    def peakmem_find_charge_imbalanced_reactions(self, *args):
+        consistency.find_charge_imbalanced_reactions(self.model)
+
+    def time_find_metabolite_connectivity_issues(self, *args):
+        consistency.find_metabolite_connectivity_issues(self.model)
+
+    def peakmem_find_metabolite_connectivity_issues(self, *args):
+        consistency.find_metabolite_connectivity_issues(self.model)
+
+    def time_metabolite_annotation_miriam_match_overview(self, *args):
+        annotation.generate_component_annotation_miriam_match_overview(
+            self.model.metabolites, "metabolites")
+
+    def peakmem_metabolite_annotation_miriam_match_overview(self, *args):
+        annotation.generate_component_annotation_miriam_match_overview(
+            self.model.metabolites, "metabolites")
+
+    def time_reaction_id_namespace_overview(self, *args):
+        annotation.generate_component_id_namespace_overview(
+            self.model, "reactions")
+
+    def peakmem_reaction_id_namespace_overview(self, *args):
+        annotation.generate_component_id_namespace_overview(
+            self.model, "reactions")
+
+    def time_find_enzyme_complexes(self, *args):
+        clear_caches()
+        basic.find_enzyme_complexes(self.model)
+
+    def peakmem_find_enzyme_complexes(self, *args):
+        clear_caches()
+        basic.find_enzyme_complexes(self.model)
+
+    def time_find_exchange_rxns(self, *args):
+        helpers.find_exchange_rxns(self.model)
+
+    def peakmem_find_exchange_rxns(self, *args):
+        helpers.find_exchange_rxns(self.model)
+
+    def time_fingerprint(self, *args):
+        fingerprint.fingerprint(self.model)
+
+    def peakmem_fingerprint(self, *args):
+        fingerprint.fingerprint(self.model)
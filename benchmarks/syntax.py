@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Benchmark ``memote.support.syntax``."""
+
+from __future__ import absolute_import
+
+import memote.support.syntax as syntax
+
+from benchmarks.models import SMALL, ModelBenchmark
+
+
+class Syntax(ModelBenchmark):
+    """Benchmark the identifier checks that scale with the model size."""
+
+    def time_find_upper_case_mets(self, *args):
+        syntax.find_upper_case_mets(self.model)
+
+    def peakmem_find_upper_case_mets(self, *args):
+        syntax.find_upper_case_mets(self.model)
+
+    def time_find_untagged_demand_rxns(self, *args):
+        syntax.find_untagged_demand_rxns(self.model)
+
+    def peakmem_find_untagged_demand_rxns(self, *args):
+        syntax.find_untagged_demand_rxns(self.model)
+
+    def time_find_false_demand_rxns(self, *args):
+        syntax.find_false_demand_rxns(self.model)
+
+    def peakmem_find_false_demand_rxns(self, *args):
+        syntax.find_false_demand_rxns(self.model)
+
+    def time_find_untagged_sink_rxns(self, *args):
+        syntax.find_untagged_sink_rxns(self.model)
+
+    def peakmem_find_untagged_sink_rxns(self, *args):
+        syntax.find_untagged_sink_rxns(self.model)
+
+    def time_find_false_sink_rxns(self, *args):
+        syntax.find_false_sink_rxns(self.model)
+
+    def peakmem_find_false_sink_rxns(self, *args):
+        syntax.find_false_sink_rxns(self.model)
+
+    def time_find_untagged_exchange_rxns(self, *args):
+        syntax.find_untagged_exchange_rxns(self.model)
+
+    def peakmem_find_untagged_exchange_rxns(self, *args):
+        syntax.find_untagged_exchange_rxns(self.model)
+
+    def time_find_false_exchange_rxns(self, *args):
+        syntax.find_false_exchange_rxns(self.model)
+
+    def peakmem_find_false_exchange_rxns(self, *args):
+        syntax.find_false_exchange_rxns(self.model)
+
+
+class SyntaxTransport(ModelBenchmark):
+    """
+    Benchmark the checks that depend on the transport reactions.
+
+    Identifying transport reactions currently scales quadratically with the
+    number of reactions which is prohibitive for the synthetic models.
+
+    """
+
+    params = SMALL
+    number = 1
+    repeat = 3
+
+    def time_find_rxn_id_compartment_suffix(self, *args):
+        syntax.find_rxn_id_compartment_suffix(self.model, "c")
+
+    def peakmem_find_rxn_id_compartment_suffix(self, *args):
+        syntax.find_rxn_id_compartment_suffix(self.model, "c")
+
+    def time_find_rxn_id_suffix_compartment(self, *args):
+        syntax.find_rxn_id_suffix_compartment(self.model, "c")
+
+    def peakmem_find_rxn_id_suffix_compartment(self, *args):
+        syntax.find_rxn_id_suffix_compartment(self.model, "c")
+
+    def time_find_reaction_tag_transporter(self, *args):
+        syntax.find_reaction_tag_transporter(self.model)
+
+    def peakmem_find_reaction_tag_transporter(self, *args):
+        syntax.find_reaction_tag_transporter(self.model)
+
+    def time_find_abc_tag_transporter(self, *args):
+        syntax.find_abc_tag_transporter(self.model)
+
+    def peakmem_find_abc_tag_transporter(self, *args):
+        syntax.find_abc_tag_transporter(self.model)
@@ -12,6 +12,7 @@ import { StatisticsComponent } from './dashboard/statistics/statistics.component
 import { ReportDataService } from './report-data.service';
 import { KeysPipe } from './keys.pipe';
 import { SystemInformationComponent } from './dashboard/system-information/system-information.component';
+import { PerformanceComponent } from './dashboard/performance/performance.component';
 import { TabularizeComponent } from './tabularize/tabularize.component';
 import { ColouredScoreComponent } from './coloured-score/coloured-score.component';
 
@@ -25,6 +26,7 @@ import { ColouredScoreComponent } from './coloured-score/coloured-score.componen
     StatisticsComponent,
     KeysPipe,
     SystemInformationComponent,
+    PerformanceComponent,
     TabularizeComponent,
     ColouredScoreComponent
   ],
@@ -0,0 +1,23 @@
+import { Component, OnInit, ViewEncapsulation } from '@angular/core';
+import { ReportDataService } from './../../report-data.service';
+
+@Component({
+  selector: 'app-performance',
+  templateUrl: './performance.component.html',
+  styleUrls: ['./performance.component.scss'],
+  encapsulation: ViewEncapsulation.None
+})
+export class PerformanceComponent implements OnInit {
+  // The number of slowest tests that are shown.
+  limit = 10;
+
+  constructor(private data: ReportDataService) {}
+
+  ngOnInit() {
+  }
+
+  public mebibytes(bytes: number): number {
+    return bytes / 1048576;
+  }
+
+}
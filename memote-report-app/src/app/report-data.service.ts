@@ -9,6 +9,7 @@ export class ReportDataService {
   allTests: TestResult[] = [];
   scoredCard: Object;
   statisticsCards: ResultCard[] = [];
+  performance: TestResult[] = [];
 
   constructor(private http:HttpClient){
   }
@@ -34,6 +35,10 @@ export class ReportDataService {
           test,
           data["tests"][test]))
     };
+    // Rank the tests by their wall time for the performance card.
+    this.performance = this.allTests
+      .filter(test => test.profile)
+      .sort((a, b) => b.profile.wall_time - a.profile.wall_time);
     // Extract metaddata information to be used in the metadata card
     this.metaData = data["meta"];
     for (const card of Object.keys(data["cards"])){
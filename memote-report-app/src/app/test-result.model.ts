@@ -4,23 +4,42 @@ export class TestResult {
   public duration: number;
   public message: string;
   public metric: number;
+  public profile: any;
   public result: string;
   public summary: string;
   public title: string;
   public type: string;
 
-  constructor(id: string, {data, duration, message, metric, result, summary, title, type}: {
+  constructor(id: string, {data, duration, message, metric, profile, result, summary, title, type}: {
       data: any, duration: number, message: string, metric: number,
-      result: string, summary: string, title: string, type: string
+      profile: any, result: string, summary: string, title: string,
+      type: string
     }) {
         this.id = id;
         this.data = data;
         this.duration= duration;
         this.message= message;
         this.metric= metric;
+        this.profile= TestResult.totalProfile(profile);
         this.result= result;
         this.summary= summary;
         this.title= title;
         this.type= type;
        }
+
+  // Parametrized tests have one profile per parameter which are summed up.
+  private static totalProfile(profile: any): any {
+    if (!profile || 'wall_time' in profile) {
+      return profile;
+    }
+    const total = {
+      wall_time: 0, cpu_time: 0, solves: 0, solve_time: 0, copies: 0,
+      peak_rss_delta: 0};
+    for (const param of Object.keys(profile)) {
+      for (const key of Object.keys(total)) {
+        total[key] += profile[param][key] || 0;
+      }
+    }
+    return total;
+  }
 }
@@ -24,8 +24,27 @@ genome-scale metabolic models.
 
 from __future__ import absolute_import
 
+import sys
+
 from memote.version_info import show_versions
-from memote.suite.api import *
+
+#: The functions of ``memote.suite.api`` that are available from the package.
+_API = ("test_model", "snapshot_report", "diff_report", "history_report")
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        """Import the test suite (and thus pytest) only on first use."""
+        if name in _API:
+            import memote.suite.api as api
+            return getattr(api, name)
+        raise AttributeError(
+            "module '{}' has no attribute '{}'".format(__name__, name))
+
+    def __dir__():
+        """Include the lazily imported functions."""
+        return sorted(set(globals()) | set(_API))
+else:
+    from memote.suite.api import *
 
 __author__ = "Moritz E. Beber"
 __email__ = "morbeb@biosustain.dtu.dk"
@@ -21,17 +21,21 @@ from __future__ import absolute_import
 
 import io
 import logging
-try:
-    import simplejson as json
-except ImportError:
-    import json
 
 import pytest
 from six import iteritems
 
 from memote.suite import TEST_DIRECTORY
 from memote.suite.collect import ResultCollectionPlugin
-from memote.suite.reporting.reports import SnapshotReport, HistoryReport
+from memote.suite.incremental import Incremental, IncrementalPlugin
+from memote.suite.monitor import MonitorPlugin
+from memote.suite.profiling import ItemProfiler, ProfilingPlugin
+from memote.suite.results import dump_result
+from memote.suite.reporting.reports import (
+    SnapshotReport, HistoryReport, DiffReport)
+from memote.suite.schedule import WorkerPlugin
+from memote.suite.supervise import BudgetPlugin
+from memote.suite.workspace import LPWorkspacePlugin
 
 __all__ = ("test_model", "snapshot_report", "diff_report", "history_report")
 
@@ -39,7 +43,9 @@ LOGGER = logging.getLogger(__name__)
 
 
 def test_model(model, filename=None, results=False, pytest_args=None,
-               exclusive=None, skip=None, solver=None):
+               exclusive=None, skip=None, solver=None, profile=None,
+               profile_out="profiles", budgets=None, previous=None, workers=1,
+               history=None):
     """
     Test a model and optionally store results as JSON.
 
@@ -48,7 +54,8 @@ def test_model(model, filename=None, results=False, pytest_args=None,
     model : cobra.Model
         The metabolic model under investigation.
     filename : str or pathlib.Path, optional
-        A filename if JSON output of the results is desired.
+        A filename if JSON output of the results is desired. A filename
+        ending in ``.json.gz`` selects compact, compressed JSON.
     results : bool, optional
         Whether to return the results in addition to the return code.
     pytest_args : list, optional
@@ -58,6 +65,28 @@ def test_model(model, filename=None, results=False, pytest_args=None,
         precedence over ``skip``.
     skip : iterable, optional
         Names of test cases or modules to skip.
+    profile : {"cprofile", "pyinstrument"}, optional
+        Profile each test item with the given profiler.
+    profile_out : str, optional
+        The directory for one profile per test item and a summary table of
+        the hottest functions (default 'profiles').
+    budgets : dict, optional
+        Time budgets in seconds. The keys "total" and "default" limit the
+        whole session and each test case while test case names set
+        individual budgets. They take precedence over the budgets in
+        ``test_config.yml``. Test cases that exceed their budget are stopped
+        and recorded with the result "timeout".
+    previous : dict, optional
+        The results of a previous run of the same model. Only the checks and
+        components affected by changes since then are computed again.
+    workers : int, optional
+        The number of processes that run test cases in parallel. Test cases
+        are assigned longest expected duration first to the least busy
+        process.
+    history : iterable, optional
+        Further results of previous runs. The expected duration of a test
+        case is its mean duration in these and the ``previous`` result or,
+        without any record, an estimate from the model size.
 
     Returns
     -------
@@ -74,28 +103,39 @@ def test_model(model, filename=None, results=False, pytest_args=None,
     if TEST_DIRECTORY not in pytest_args:
         pytest_args.append(TEST_DIRECTORY)
     plugin = ResultCollectionPlugin(model, exclusive=exclusive, skip=skip)
-    code = pytest.main(pytest_args, plugins=[plugin])
+    incremental = Incremental(model, plugin.fingerprints, previous)
+    monitor = MonitorPlugin(model)
+    # The model fixture of the LP workspace replaces the collector's.
+    plugins = [plugin, LPWorkspacePlugin(plugin), monitor,
+               IncrementalPlugin(plugin, incremental)]
+    if profile is None:
+        profiler = None
+    else:
+        profiler = ItemProfiler(profile, profile_out)
+        plugins.append(ProfilingPlugin(profiler))
+    plugins.append(BudgetPlugin(plugin, budgets, monitor, profiler))
+    if workers > 1:
+        plugins.append(WorkerPlugin(
+            plugin, model, workers,
+            [res for res in [previous] + list(history or []) if res],
+            incremental))
+    code = pytest.main(pytest_args, plugins=plugins)
     if filename is not None:
-        with open(filename, "w") as file_h:
-            LOGGER.info("Writing JSON output '%s'.", filename)
-            try:
-                json.dump(plugin.results, file_h, sort_keys=True, indent=4,
-                          separators=(",", ": "))
-            except TypeError:
-                # Log information to easily find the culprit.
-                json_types = (type(None), int, float, str, list, dict)
-                for mod, functions in iteritems(plugin.results["report"]):
-                    LOGGER.debug("%s:", mod)
-                    for name, annotation in iteritems(functions):
-                        data = annotation.get("data")
-                        try:
-                            for key, value in iteritems(data):
-                                if not isinstance(value, json_types):
-                                    LOGGER.debug(
-                                        "  %s - %s: %s", name, key, type(value))
-                        except AttributeError:
-                            if not isinstance(data, json_types):
-                                LOGGER.debug("  %s: %s", name, type(data))
+        try:
+            dump_result(plugin.results, filename)
+        except TypeError:
+            # Log information to easily find the culprit.
+            json_types = (type(None), int, float, str, list, dict)
+            for name, case in iteritems(plugin.results["tests"]):
+                data = case.get("data")
+                try:
+                    for key, value in iteritems(data):
+                        if not isinstance(value, json_types):
+                            LOGGER.debug(
+                                "%s - %s: %s", name, key, type(value))
+                except AttributeError:
+                    if not isinstance(data, json_types):
+                        LOGGER.debug("%s: %s", name, type(data))
 
     if results:
         return code, plugin.results
@@ -144,6 +184,21 @@ def history_report(repository, directory, filename, index="hash"):
         file_h.write(report.render_html())
 
 
-def diff_report():
-    u"""Coming soon™."""
-    raise NotImplementedError(u"Coming soon™.")
+def diff_report(results, filename, labels=None):
+    """
+    Compare the results of two models and save a diff report.
+
+    Parameters
+    ----------
+    results : sequence
+        The results of the two models as returned from the test suite.
+    filename : str or pathlib.Path
+        A filename for the HTML report.
+    labels : sequence, optional
+        Names for the two models, e.g., their file names.
+
+    """
+    report = DiffReport(results, labels=labels)
+    LOGGER.info("Writing diff report '%s'.", filename)
+    with io.open(filename, "w") as file_h:
+        file_h.write(report.render_html())
@@ -25,14 +25,14 @@ import logging
 import warnings
 
 import click
-import git
-from cobra.io import read_sbml_model
 
 LOGGER = logging.getLogger(__name__)
 
 
 def _load_model(filename):
     """Load the model defined in SBML."""
+    from cobra.io import read_sbml_model
+
     # TODO: Record the SBML warnings and add them to the report.
     with warnings.catch_warnings():
         warnings.simplefilter("ignore", UserWarning)
@@ -83,6 +83,8 @@ def validate_username(context, param, value):
 
 def probe_git():
     """Return a git repository instance if it exists."""
+    import git
+
     try:
         repo = git.Repo()
     except git.InvalidGitRepositoryError:
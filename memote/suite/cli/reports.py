@@ -21,17 +21,27 @@ from __future__ import absolute_import
 
 import logging
 import sys
+from multiprocessing import Pool
 
 import click
-import git
 
-import memote.suite.api as api
 from memote.suite.cli import CONTEXT_SETTINGS
 import memote.suite.cli.callbacks as callbacks
 
 LOGGER = logging.getLogger(__name__)
 
 
+def _test_diff(filename, pytest_args, solver):
+    """Run the test suite on a model file and return the results."""
+    import memote.suite.api as api
+
+    model = callbacks._load_model(filename)
+    model.solver = solver
+    _, results = api.test_model(model, results=True,
+                                pytest_args=list(pytest_args))
+    return results
+
+
 @click.group()
 @click.help_option("--help", "-h")
 def report():
@@ -60,6 +70,8 @@ def snapshot(model, filename, pytest_args, solver):
     MODEL: Path to model file. Can also be supplied via the environment variable
     MEMOTE_MODEL or configured in 'setup.cfg' or 'memote.ini'.
     """
+    import memote.suite.api as api
+
     if not any(a.startswith("--tb") for a in pytest_args):
         pytest_args = ["--tb", "short"] + pytest_args
     if not any(a.startswith("-v") for a in pytest_args):
@@ -88,6 +100,9 @@ def history(directory, filename, index):
     to be found here. Can also be supplied via the environment variable
     MEMOTE_DIRECTORY or configured in 'setup.cfg' or 'memote.ini'.
     """
+    import git
+    import memote.suite.api as api
+
     try:
         repo = git.Repo()
     except git.InvalidGitRepositoryError:
@@ -105,6 +120,30 @@ def history(directory, filename, index):
 @click.option("--filename", type=click.Path(exists=False, writable=True),
               default="index.html", show_default=True,
               help="Path for the HTML report output.")
-def diff(model1, model2, filename):
-    """Compare two metabolic models against each other."""
-    raise NotImplementedError(u"Coming soon™.")
+@click.option("--pytest-args", "-a", callback=callbacks.validate_pytest_args,
+              help="Any additional arguments you want to pass to pytest. "
+                   "Should be given as one continuous string.")
+@click.option("--solver", type=click.Choice(["cplex", "glpk", "gurobi"]),
+              default="glpk", show_default=True,
+              help="Set the solver to be used.")
+def diff(model1, model2, filename, pytest_args, solver):
+    """
+    Compare two metabolic models against each other.
+
+    The test suite runs on both models concurrently in separate processes.
+    The report shows only the components and the test results that differ.
+
+    MODEL1, MODEL2: Paths to the model files.
+    """
+    import memote.suite.api as api
+
+    if not any(a.startswith("--tb") for a in pytest_args):
+        pytest_args = ["--tb", "short"] + pytest_args
+    # Every test suite run needs a fresh process since test modules keep state.
+    pool = Pool(processes=2, maxtasksperchild=1)
+    tasks = [pool.apply_async(_test_diff, args=(path, pytest_args, solver))
+             for path in (model1, model2)]
+    pool.close()
+    results = [task.get() for task in tasks]
+    pool.join()
+    api.diff_report(results, filename, labels=(model1, model2))
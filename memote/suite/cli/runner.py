@@ -22,28 +22,25 @@ from __future__ import absolute_import
 import io
 import os
 import sys
+import gzip
 import logging
-from os.path import join
-from multiprocessing import Process
+from os.path import join, exists, abspath, relpath
+from multiprocessing import Pool, cpu_count
 from getpass import getpass
 from time import sleep
+from builtins import dict
+from collections import OrderedDict
 
 import click
 import click_log
-import git
-import ruamel.yaml as yaml
-from cookiecutter.main import cookiecutter, get_user_config
-from github import (
-    Github, BadCredentialsException, UnknownObjectException, GithubException)
-from travispy import TravisPy
-from travispy.errors import TravisError
-from travis.encrypt import encrypt_key, retrieve_public_key
-
-import memote.suite.api as api
+from six import itervalues
+
 import memote.suite.cli.callbacks as callbacks
 from memote import __version__
 from memote.suite.cli import CONTEXT_SETTINGS
 from memote.suite.cli.reports import report
+from memote.suite.results import (
+    EXTENSIONS, load_result, dump_result, find_result)
 
 LOGGER = logging.getLogger()
 click_log.basic_config(LOGGER)
@@ -75,12 +72,17 @@ def cli():
                    "generating a report.")
 @click.option("--filename", type=click.Path(exists=False, writable=True),
               default="result.json", show_default=True,
-              help="Path for the collected results as JSON.")
+              help="Path for the collected results as JSON. Use the "
+                   "extension '.json.gz' for compact, compressed output.")
 @click.option("--directory", type=click.Path(exists=True, file_okay=False,
                                              writable=True),
               envvar="MEMOTE_DIRECTORY",
               help="If invoked inside a git repository, write the test results "
               "to this directory using the commit hash as the filename.")
+@click.option("--extension", type=click.Choice(EXTENSIONS),
+              default=EXTENSIONS[0], show_default=True,
+              help="The format of results written to the directory. "
+                   "'.json.gz' is compact, compressed JSON.")
 @click.option("--ignore-git", is_flag=True, show_default=True,
               help="Avoid checking the git repository status.")
 @click.option("--pytest-args", "-a", callback=callbacks.validate_pytest_args,
@@ -96,17 +98,51 @@ def cli():
 @click.option("--solver", type=click.Choice(["cplex", "glpk", "gurobi"]),
               default="glpk", show_default=True,
               help="Set the solver to be used.")
+@click.option("--profile", type=click.Choice(["cprofile", "pyinstrument"]),
+              help="Profile each test separately. pyinstrument has to be "
+                   "installed separately, e.g., with "
+                   "'pip install memote[profile]'.")
+@click.option("--profile-out", type=click.Path(file_okay=False, writable=True),
+              default="profiles", show_default=True,
+              help="Directory for one profile per test and a summary table "
+                   "of the hottest functions.")
+@click.option("--time-budget", type=click.FloatRange(min=0),
+              help="The time in seconds after which a single test is stopped "
+                   "and recorded as 'timeout'. Overrides the default budget "
+                   "in the test configuration.")
+@click.option("--total-budget", type=click.FloatRange(min=0),
+              help="The time in seconds for the whole test suite. Tests "
+                   "are stopped or skipped once it is exhausted such that "
+                   "results are always available in time.")
+@click.option("--previous", type=click.Path(exists=True, dir_okay=False),
+              help="A previous result of the same model. Only the checks "
+                   "affected by the changes since then are computed again; "
+                   "checks that require optimization only if the "
+                   "stoichiometry, the bounds, or the objective changed.")
+@click.option("--workers", type=click.IntRange(min=1), default=1,
+              show_default=True,
+              help="The number of processes that run tests in parallel. "
+                   "Tests are distributed by their expected duration.")
+@click.option("--history", type=click.Path(exists=True, dir_okay=False),
+              multiple=True,
+              help="A previous result whose test durations inform the "
+                   "distribution across workers. This option can be used "
+                   "multiple times. Defaults to the most recent results in "
+                   "the results directory.")
 @click.argument("model", type=click.Path(exists=True, dir_okay=False),
                 envvar="MEMOTE_MODEL",
                 callback=callbacks.validate_model)
-def run(model, collect, filename, directory, ignore_git, pytest_args, exclusive,
-        skip, solver):
+def run(model, collect, filename, directory, extension, ignore_git,
+        pytest_args, exclusive, skip, solver, profile, profile_out,
+        time_budget, total_budget, previous, workers, history):
     """
     Run the test suite and collect results.
 
     MODEL: Path to model file. Can also be supplied via the environment variable
     MEMOTE_MODEL or configured in 'setup.cfg' or 'memote.ini'.
     """
+    import memote.suite.api as api
+
     if ignore_git:
         repo = None
     else:
@@ -116,26 +152,52 @@ def run(model, collect, filename, directory, ignore_git, pytest_args, exclusive,
     if not any(a.startswith("-v") for a in pytest_args):
         pytest_args.append("-vv")
     model.solver = solver
+    budgets = dict()
+    if time_budget is not None:
+        budgets["default"] = time_budget
+    if total_budget is not None:
+        budgets["total"] = total_budget
+    if previous is not None:
+        previous = load_result(previous)
+    if workers > 1 and len(history) == 0 and directory is not None:
+        history = _recent_results(directory)
+    history = [load_result(name) for name in history]
     if collect:
         if repo is not None and directory is not None:
-            filename = join(directory,
-                            "{}.json".format(repo.active_branch.commit.hexsha))
+            filename = join(directory, repo.active_branch.commit.hexsha +
+                            extension)
         code = api.test_model(model, filename, pytest_args=pytest_args,
-                              skip=skip, exclusive=exclusive)
+                              skip=skip, exclusive=exclusive,
+                              profile=profile, profile_out=profile_out,
+                              budgets=budgets, previous=previous,
+                              workers=workers, history=history)
     else:
         code = api.test_model(model, pytest_args=pytest_args, skip=skip,
-                              exclusive=exclusive)
+                              exclusive=exclusive, profile=profile,
+                              profile_out=profile_out, budgets=budgets,
+                              previous=previous, workers=workers,
+                              history=history)
     sys.exit(code)
 
 
+def _recent_results(directory, number=5):
+    """Return the file names of the most recent results in a directory."""
+    if not os.path.isdir(directory):
+        return []
+    names = [join(directory, name) for name in os.listdir(directory)
+             if name.endswith(EXTENSIONS)]
+    names.sort(key=os.path.getmtime, reverse=True)
+    return names[:number]
+
+
 @cli.command(context_settings=CONTEXT_SETTINGS)
 @click.help_option("--help", "-h")
 @click.option("--replay", is_flag=True,
               help="Create a memote repository using the exact same answers "
               "as before. This will not overwrite existing directories. If "
               "you want to adjust the answers, edit the template "
-              "'{}'.".format(join(get_user_config()["replay_dir"],
-                                  "cookiecutter-memote.json")))
+              "'cookiecutter-memote.json' in cookiecutter's replay directory "
+              "(by default '~/.cookiecutter_replay').")
 @click.option("--directory", type=click.Path(exists=True, file_okay=False,
                                              writable=True),
               envvar="MEMOTE_DIRECTORY",
@@ -149,17 +211,71 @@ def new(directory, replay):
     new directory will be placed in the current directory or respect the given
     --directory option.
     """
+    from cookiecutter.main import cookiecutter
+
     if directory is None:
         directory = os.getcwd()
     cookiecutter("gh:opencobra/cookiecutter-memote", output_dir=directory,
                  replay=replay)
 
 
-def _test_history(model, filename, pytest_args, skip):
-    model = callbacks.validate_model(None, "model", model)
+def _load_blob_model(repo, hexsha, path):
+    """Load the model as stored in a commit from the git object database."""
+    data = (repo.commit(hexsha).tree / path).data_stream.read()
+    if path.endswith(".gz"):
+        data = gzip.GzipFile(fileobj=io.BytesIO(data)).read()
+    return callbacks.validate_model(
+        None, "model", io.StringIO(data.decode("utf-8")))
+
+
+def _test_history(repo_dir, hexsha, path, filename, pytest_args, skip):
+    """
+    Test the model of one commit and store its results.
+
+    Runs in a worker process of the history pool and thus receives only
+    picklable arguments.
+
+    Parameters
+    ----------
+    repo_dir : str
+        The working tree directory of the git repository.
+    hexsha : str
+        The hash of the commit to test.
+    path : str
+        The path of the model file as stored in the git tree.
+    filename : str
+        The file name for the results.
+    pytest_args : list
+        Additional arguments for the pytest suite.
+    skip : iterable
+        Names of test cases or modules to skip.
+
+    """
+    import git
+    import memote.suite.api as api
+
+    model = _load_blob_model(git.Repo(repo_dir), hexsha, path)
     api.test_model(model, filename, pytest_args=pytest_args, skip=skip)
 
 
+def _model_blob(commit, path):
+    """Return the git blob hash of the model file in a commit (if any)."""
+    try:
+        return (commit.tree / path).hexsha
+    except KeyError:
+        return None
+
+
+def _reuse_result(source, filename, commit):
+    """Copy the results of an unchanged model and update the commit meta."""
+    result = load_result(source)
+    meta = result.setdefault("meta", dict())
+    meta["commit_author"] = commit.author.name
+    meta["timestamp"] = commit.committed_datetime.isoformat(" ")
+    meta["commit_hash"] = commit.hexsha
+    dump_result(result, filename)
+
+
 @cli.command(context_settings=CONTEXT_SETTINGS)
 @click.help_option("--help", "-h")
 @click.option("--yes", "-y", is_flag=True, callback=callbacks.abort_if_false,
@@ -170,6 +286,19 @@ def _test_history(model, filename, pytest_args, skip):
               envvar="MEMOTE_DIRECTORY",
               help="Generated JSON files from the commit history will be "
                    "written to this directory.")
+@click.option("--rewrite/--no-rewrite", default=False, show_default=True,
+              help="Whether to re-compute results for commits that already "
+                   "have a JSON file in the directory.")
+@click.option("--extension", type=click.Choice(EXTENSIONS),
+              default=EXTENSIONS[0], show_default=True,
+              help="The format of new results. Existing results keep their "
+                   "format. '.json.gz' is compact, compressed JSON.")
+@click.option("--processes", type=click.IntRange(min=1),
+              default=min(4, cpu_count()), show_default=True,
+              help="The number of commits to test concurrently. Every "
+                   "process loads its own copy of the model, so the default "
+                   "is at most four to avoid exhausting memory on large "
+                   "models.")
 @click.option("--pytest-args", "-a", callback=callbacks.validate_pytest_args,
               help="Any additional arguments you want to pass to pytest. "
                    "Should be given as one continuous string.")
@@ -177,7 +306,8 @@ def _test_history(model, filename, pytest_args, skip):
                 envvar="MEMOTE_MODEL")
 @click.argument("commits", metavar="[COMMIT] ...", nargs=-1)
 @click.pass_context
-def history(context, model, directory, pytest_args, commits):
+def history(context, model, directory, rewrite, extension, processes,
+            pytest_args, commits):
     """
     Re-compute test results for the git branch history.
 
@@ -193,7 +323,14 @@ def history(context, model, directory, pytest_args, commits):
        model repositories.
     2. By giving memote specific commit hashes, it will re-compute test results
        for those only.
+
+    Commits that already have results are skipped unless --rewrite is given.
+    Commits in which the model file did not change re-use the results of a
+    commit with the identical model file. The model is read directly from the
+    git history such that the working tree is never modified.
     """
+    import git
+
     if "--tb" not in pytest_args:
         pytest_args = ["--tb", "no"] + pytest_args
     try:
@@ -207,23 +344,73 @@ def history(context, model, directory, pytest_args, commits):
             "the current branch's commit history.")
         sys.exit(1)
     if len(commits) > 0:
-        # TODO: Convert hashes to `git.Commit` instances.
-        raise NotImplementedError(u"Coming soon™.")
+        try:
+            commits = [repo.commit(rev) for rev in commits]
+        except (git.BadName, ValueError) as err:
+            LOGGER.critical("Unknown commit: %s", str(err))
+            sys.exit(1)
     else:
         commits = list(branch.commit.iter_parents())
         commits.insert(0, branch.commit)
+    # The model path as it is stored in the git tree.
+    model_path = relpath(abspath(model), repo.working_tree_dir).replace(
+        os.sep, "/")
     skip = context.default_map.get("skip", [])
+    # Map git blob hashes of the model file to existing result files.
+    previous = dict()
+    if not rewrite:
+        for commit in commits:
+            blob = _model_blob(commit, model_path)
+            filename = find_result(join(directory, commit.hexsha))
+            if blob is not None and exists(filename):
+                previous.setdefault(blob, filename)
+    # Group the remaining commits by the model blob such that each distinct
+    # model is tested only once.
+    pending = OrderedDict()
     for commit in commits:
-        repo.git.checkout(commit)
+        filename = find_result(join(directory, commit.hexsha), extension)
+        if not rewrite and exists(filename):
+            LOGGER.info(
+                "Skipping commit '%s' which already has results.",
+                commit.hexsha)
+            continue
+        blob = _model_blob(commit, model_path)
+        if blob is None:
+            LOGGER.warning(
+                "The model '%s' is not part of commit '%s'.", model_path,
+                commit.hexsha)
+        elif blob in previous:
+            LOGGER.info(
+                "The model is unchanged in commit '%s'. Re-using results from "
+                "'%s'.", commit.hexsha, previous[blob])
+            _reuse_result(previous[blob], filename, commit)
+        else:
+            pending.setdefault(blob, list()).append(commit)
+    # Every test suite run needs a fresh process since test modules keep state.
+    pool = Pool(processes=processes, maxtasksperchild=1)
+    tasks = list()
+    for group in itervalues(pending):
         LOGGER.info(
-            "Running the test suite for commit '{}'.".format(commit.hexsha))
-        filename = join(directory, "{}.json".format(commit.hexsha))
-        proc = Process(target=_test_history,
-                       args=(model, filename, pytest_args, skip))
-        proc.start()
-        proc.join()
-    repo.git.checkout(branch)
-    # repo.head.reset(index=True, working_tree=True)  # superfluous?
+            "Running the test suite for commit '{}'.".format(group[0].hexsha))
+        filename = find_result(join(directory, group[0].hexsha), extension)
+        tasks.append((group, filename, pool.apply_async(
+            _test_history, args=(repo.working_tree_dir, group[0].hexsha,
+                                 model_path, filename, pytest_args, skip))))
+    pool.close()
+    for group, filename, task in tasks:
+        try:
+            task.get()
+        except Exception as err:
+            # A single broken commit should not abort the entire history.
+            LOGGER.error(
+                "Testing commit '%s' failed: %s", group[0].hexsha, str(err))
+            continue
+        if not exists(filename):
+            continue
+        for commit in group[1:]:
+            _reuse_result(filename, find_result(
+                join(directory, commit.hexsha), extension), commit)
+    pool.join()
 
 
 @cli.command(context_settings=CONTEXT_SETTINGS)
@@ -238,6 +425,15 @@ def history(context, model, directory, pytest_args, commits):
               help="The GitHub username. Usually this is configured for you.")
 def online(note, github_repository, github_username):
     """Upload the repository to GitHub and enable testing on Travis CI."""
+    import git
+    import ruamel.yaml as yaml
+    from github import (
+        Github, BadCredentialsException, UnknownObjectException,
+        GithubException)
+    from travispy import TravisPy
+    from travispy.errors import TravisError
+    from travis.encrypt import encrypt_key, retrieve_public_key
+
     try:
         repo = git.Repo()
     except git.InvalidGitRepositoryError:
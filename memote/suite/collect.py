@@ -27,10 +27,13 @@ from builtins import dict, open
 from datetime import datetime
 
 import pytest
-import pip
 import ruamel.yaml as yaml
 
+import memote.suite.hooks as hooks
+from memote.support.fingerprint import fingerprint
 from memote.support.helpers import find_biomass_reaction
+from memote.suite.incremental import environment
+from memote.version_info import get_pkg_info
 
 LOGGER = logging.getLogger(__name__)
 
@@ -44,6 +47,10 @@ class ResultCollectionPlugin(object):
     the module so within a module the same keys should not be re-used
     (unless intended).
 
+    Time budgets, profiling, resource monitoring, reuse of previous results,
+    the shared LP workspace, and parallel workers are separate plugins that
+    add to the results through this one (see ``memote.suite.hooks``).
+
     """
 
     def __init__(self, model, repository=None, branch=None, commit=None,
@@ -81,16 +88,15 @@ class ResultCollectionPlugin(object):
         self._skip = frozenset() if skip is None else frozenset(skip)
         self._collect_meta_info()
         self._read_organization()
+        self._store["fingerprints"] = fingerprint(model)
 
     def _collect_meta_info(self):
         """Record environment information."""
         self._meta["platform"] = platform.system()
         self._meta["release"] = platform.release()
         self._meta["python"] = platform.python_version()
-        self._meta["packages"] = dict(
-            (dist.project_name, dist.version) for dist in
-            pip.get_installed_distributions())
         self._meta["timestamp"] = datetime.utcnow().isoformat(" ")
+        self._meta.update(environment(self._model))
         if self.repo is not None:
             self._collect_git_info()
 
@@ -141,6 +147,10 @@ class ResultCollectionPlugin(object):
             }
         }
 
+    def pytest_collection_modifyitems(self, items):
+        """Run the test cases that do not need a solver first."""
+        items.sort(key=lambda item: bool(getattr(item.obj, "solver", False)))
+
     @pytest.hookimpl(tryfirst=True)
     def pytest_runtest_call(self, item):
         """Either run a test exclusively or skip it."""
@@ -165,11 +175,12 @@ class ResultCollectionPlugin(object):
             LOGGER.debug("Test case '%s' has no annotation (%s).",
                          item.obj.__name__, item.nodeid)
 
-    def pytest_report_teststatus(self, report):
+    def pytest_runtest_logreport(self, report):
         """
         Log pytest results for each test.
 
         The categories are passed, failed, error, skipped and marked to fail.
+        Other plugins may replace the result afterwards, e.g., by "timeout".
 
         Parameters
         ----------
@@ -179,29 +190,48 @@ class ResultCollectionPlugin(object):
         """
         if report.when != "call":
             return
-        item_name = report.location[2]
-
-        # Check for a parametrized test.
-        match = self._param.search(item_name)
-        if match is not None:
-            param = match.group("param")
-            item_name = item_name[:match.start()]
+        item_name, param = self.split_name(report.location[2])
+        if param is not None:
             LOGGER.debug(
                 "%s with parameter %s %s", item_name, param, report.outcome)
         else:
             LOGGER.debug(
                 "%s %s", item_name, report.outcome)
+        self.record(item_name, param, "duration", report.duration)
+        self.record(item_name, param, "result", report.outcome)
 
-        case = self._cases.setdefault(item_name, dict())
+    def pytest_addhooks(self, pluginmanager):
+        """Add the hooks through which the other plugins contribute."""
+        pluginmanager.add_hookspecs(hooks)
+
+    def pytest_memote_measured(self, item, usage):
+        """Store the resources of a test item as its "profile"."""
+        item_name, param = self.split_name(item.name)
+        self.record(item_name, param, "profile", usage)
+
+    def pytest_memote_worker_state(self, names):
+        """Hand over the results of a worker's test cases."""
+        return {"cases": dict((name, self._cases[name]) for name in names
+                              if name in self._cases)}
+
+    def pytest_memote_worker_merge(self, state):
+        """Take over the results of a worker's test cases."""
+        self._cases.update(state["cases"])
+
+    def split_name(self, item_name):
+        """Separate the name of a test case from its parameter (if any)."""
+        match = self._param.search(item_name)
+        if match is None:
+            return item_name, None
+        return item_name[:match.start()], match.group("param")
 
-        if match is not None:
-            case["duration"] = case.setdefault("duration", dict())
-            case["duration"][param] = report.duration
-            case["result"] = case.setdefault("result", dict())
-            case["result"][param] = report.outcome
+    def record(self, item_name, param, key, value):
+        """Store a value for a test case or one of its parameters."""
+        case = self._cases.setdefault(item_name, dict())
+        if param is not None:
+            case.setdefault(key, dict())[param] = value
         else:
-            case["duration"] = report.duration
-            case["result"] = report.outcome
+            case[key] = value
 
     def _determine_tests_not_on_cards(self):
         """
@@ -243,10 +273,32 @@ class ResultCollectionPlugin(object):
         )
         self._store['cards']['misc']['title'] = 'Misc. Tests'
 
+    @property
+    def meta(self):
+        """Return the meta information of the results."""
+        return self._meta
+
+    @property
+    def cases(self):
+        """Return the results of the test cases by their name."""
+        return self._cases
+
+    @property
+    def fingerprints(self):
+        """Return the fingerprint of the model."""
+        return self._store["fingerprints"]
+
+    @property
+    def budgets(self):
+        """Return the time budgets of the test organization."""
+        return self._store.setdefault("budgets", dict())
+
     @property
     def results(self):
         """Return the test results as a nested dictionary."""
         self._determine_tests_not_on_cards()
+        if "packages" not in self._meta:
+            self._meta["packages"] = get_pkg_info()
         return self._store
 
     @pytest.fixture(scope="session")
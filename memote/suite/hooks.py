@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Hooks through which the plugins of the test suite cooperate.
+
+The ``ResultCollectionPlugin`` adds these specifications to pytest. The
+plugins that budget, profile, monitor, reuse, or distribute test cases
+implement them as optional hooks such that each of them can be left out.
+"""
+
+from __future__ import absolute_import
+
+
+def pytest_memote_measured(item, usage):
+    """
+    Receive the resources that a test item consumed.
+
+    Parameters
+    ----------
+    item : pytest.Item
+        The test item including the set up and tear down of its fixtures.
+    usage : dict
+        The measurement of a ``memote.suite.monitor.ResourceMonitor``.
+
+    """
+
+
+def pytest_memote_worker_state(names):
+    """
+    Return what a plugin collected in a worker process.
+
+    Parameters
+    ----------
+    names : list
+        The names of the test cases that the worker ran.
+
+    Returns
+    -------
+    dict
+        Picklable state under keys that are unique to the plugin.
+
+    """
+
+
+def pytest_memote_worker_merge(state):
+    """
+    Merge the state that a worker process collected.
+
+    Parameters
+    ----------
+    state : dict
+        The combined return values of ``pytest_memote_worker_state``.
+
+    """
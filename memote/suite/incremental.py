@@ -0,0 +1,414 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Reuse the results of a previous run for unchanged parts of a model.
+
+Every result stores a fingerprint of the model (see
+``memote.support.fingerprint``), i.e., one hash per reaction, metabolite, and
+gene plus hashes of the whole stoichiometry, the bounds, and the objective.
+Comparing the fingerprints of two runs yields the changed components. Local
+checks, e.g., of mass balance or annotation, then only examine the affected
+components and keep the previous verdict for all others. Test cases that
+declare the parts of the model they read (``depends``) and none of which
+changed are not run at all; the result collection plugin reuses their
+complete previous results instead.
+"""
+
+from __future__ import absolute_import
+
+import logging
+from builtins import dict
+from copy import deepcopy
+
+import pytest
+from cobra.util.solver import interface_to_str
+from six import iteritems, itervalues
+
+import memote
+from memote.support.fingerprint import ASPECTS, PARTS, VERSION
+
+__all__ = ("compatible", "environment", "compare", "changed_parts",
+           "Incremental", "IncrementalPlugin")
+
+LOGGER = logging.getLogger(__name__)
+
+#: The model components that are fingerprinted individually.
+COMPONENTS = ("reactions", "metabolites", "genes")
+
+#: The global hashes that checks based on linear programming depend on.
+STRUCTURE = ("stoichiometry", "bounds", "objective")
+
+#: The results whose data can be reused.
+REUSABLE = frozenset(["passed", "failed"])
+
+
+#: The meta information that has to agree for previous verdicts to be valid.
+ENVIRONMENT = ("memote_version", "solver")
+
+
+def compatible(old, new):
+    """Return whether two fingerprints were computed in the same way."""
+    return old is not None and new is not None and \
+        old.get("version") == new.get("version") == VERSION
+
+
+def environment(model):
+    """
+    Return what determines the outcome of the checks besides the model.
+
+    Parameters
+    ----------
+    model : cobra.Model
+        The metabolic model under investigation.
+
+    Returns
+    -------
+    dict
+        The version of memote ("memote_version") and the name of the
+        model's solver interface ("solver").
+
+    """
+    return {
+        "memote_version": memote.__version__,
+        "solver": interface_to_str(model.problem)
+    }
+
+
+def compare(old, new):
+    """
+    Compare the fingerprints of two models in linear time.
+
+    Parameters
+    ----------
+    old : dict
+        The fingerprint of the first model.
+    new : dict
+        The fingerprint of the second model.
+
+    Returns
+    -------
+    dict
+        The sorted identifiers of "added", "removed", and "changed"
+        components per component type and, for each of "stoichiometry",
+        "bounds", and "objective", whether it changed.
+
+    """
+    difference = dict()
+    for kind in COMPONENTS:
+        before = old.get(kind, dict())
+        after = new.get(kind, dict())
+        difference[kind] = {
+            "added": sorted(key for key in after if key not in before),
+            "removed": sorted(key for key in before if key not in after),
+            "changed": sorted(key for key, value in iteritems(after)
+                              if key in before and before[key] != value)
+        }
+    for key in STRUCTURE:
+        difference[key] = old.get(key) != new.get(key)
+    return difference
+
+
+def _part(fingerprints, name):
+    """Return the value that represents one part of a model."""
+    if name in ASPECTS:
+        return frozenset(fingerprints.get(name, dict()))
+    if name == "objective":
+        return fingerprints.get(name)
+    kind, aspect = name.split(".", 1)
+    return fingerprints.get("aspects", dict()).get(kind, dict()).get(aspect)
+
+
+def changed_parts(old, new):
+    """
+    Determine which parts of a model differ between two fingerprints.
+
+    Parameters
+    ----------
+    old : dict
+        The fingerprint of the first model.
+    new : dict
+        The fingerprint of the second model.
+
+    Returns
+    -------
+    set
+        The names of the changed parts from
+        ``memote.support.fingerprint.PARTS``.
+
+    """
+    return set(name for name in PARTS
+               if _part(old, name) is None or
+               _part(old, name) != _part(new, name))
+
+
+class Incremental(object):
+    """
+    Decide which checks and components have to be examined again.
+
+    Without a previous result, or if it lacks a compatible fingerprint or
+    was computed by another version of memote or with another solver, every
+    check is computed from scratch.
+
+    Attributes
+    ----------
+    active : bool
+        Whether results of a previous run are reused.
+    changed : dict
+        The identifiers of added or modified components per component type.
+    structure_changed : bool
+        Whether the stoichiometry, the bounds, or the objective changed.
+    parts : set
+        The names of the model parts that changed.
+
+    """
+
+    def __init__(self, model, fingerprints, previous=None, **kwargs):
+        """
+        Compare the model with the one of a previous result.
+
+        Parameters
+        ----------
+        model : cobra.Model
+            The metabolic model under investigation.
+        fingerprints : dict
+            The fingerprint of the model as returned by
+            ``memote.support.fingerprint.fingerprint``.
+        previous : dict, optional
+            The results of a previous run as returned by the test suite.
+
+        """
+        super(Incremental, self).__init__(**kwargs)
+        self.model = model
+        old = None if previous is None else previous.get("fingerprints")
+        self.active = compatible(old, fingerprints)
+        if old is not None and not self.active:
+            LOGGER.warning("The previous result was fingerprinted "
+                           "differently and cannot be reused.")
+        elif self.active:
+            meta = previous.get("meta", dict())
+            current = environment(model)
+            differences = [key for key in ENVIRONMENT
+                           if meta.get(key) != current[key]]
+            if differences:
+                self.active = False
+                LOGGER.warning(
+                    "The previous result was computed with a different %s "
+                    "and cannot be reused.", " and ".join(
+                        key.replace("_", " ") for key in differences))
+        self._tests = dict() if previous is None else previous.get(
+            "tests", dict())
+        self.changed = dict()
+        self.structure_changed = True
+        self.parts = set(PARTS)
+        if not self.active:
+            return
+        self.parts = changed_parts(old, fingerprints)
+        difference = compare(old, fingerprints)
+        for kind in COMPONENTS:
+            self.changed[kind] = set(difference[kind]["added"]).union(
+                difference[kind]["changed"])
+        self.structure_changed = any(difference[key] for key in STRUCTURE)
+        LOGGER.info(
+            "Reusing previous results. Changed: %s. Stoichiometry, bounds, "
+            "or objective changed: %s.",
+            ", ".join("{} {}".format(len(ids), kind)
+                      for kind, ids in iteritems(self.changed)),
+            self.structure_changed)
+
+    @property
+    def summary(self):
+        """Return the number of changed components."""
+        if not self.active:
+            return None
+        summary = dict((kind, len(ids)) for kind, ids in
+                       iteritems(self.changed))
+        summary["structure_changed"] = self.structure_changed
+        return summary
+
+    def _affected(self, kind):
+        """Return the identifiers of components whose checks may change."""
+        affected = set(self.changed[kind])
+        if kind == "reactions":
+            # Balance checks depend on the formulae and charges, too.
+            for met_id in self.changed["metabolites"]:
+                met = self.model.metabolites.get_by_id(met_id)
+                affected.update(rxn.id for rxn in met.reactions)
+        return affected
+
+    def _previous(self, name, param=None):
+        """Return the reusable data of a previous check or ``None``."""
+        case = self._tests.get(name)
+        if case is None:
+            return None
+        result = case.get("result")
+        data = case.get("data")
+        if param is not None:
+            if not isinstance(result, dict) or not isinstance(data, dict):
+                return None
+            result = result.get(param)
+            data = data.get(param)
+        if result not in REUSABLE:
+            return None
+        return data
+
+    def update(self, name, kind, compute, param=None):
+        """
+        Examine only affected components and reuse the previous verdict.
+
+        Parameters
+        ----------
+        name : str
+            The name of the test case.
+        kind : {"reactions", "metabolites", "genes"}
+            The type of components that the check reports.
+        compute : callable
+            Receives a list of components and returns the identifiers of
+            those that do not pass the check.
+        param : str, optional
+            The parameter of a parametrized test case.
+
+        Returns
+        -------
+        list
+            The identifiers of all components in the model that do not pass
+            the check in the order of the model.
+
+        """
+        components = getattr(self.model, kind)
+        previous = self._previous(name, param) if self.active else None
+        if not isinstance(previous, list):
+            found = set(compute(list(components)))
+            return [elem.id for elem in components if elem.id in found]
+        affected = self._affected(kind)
+        found = set(previous) - affected
+        found.update(compute([components.get_by_id(key)
+                              for key in affected]))
+        return [elem.id for elem in components if elem.id in found]
+
+    def reuse(self, name, depends):
+        """
+        Return the complete previous result of a test case if still valid.
+
+        Parameters
+        ----------
+        name : str
+            The name of the test case.
+        depends : set
+            The parts of the model that the test case reads.
+
+        Returns
+        -------
+        dict
+            A copy of the previous result or ``None`` if the test case has
+            to be run.
+
+        """
+        if not self.active or not depends.isdisjoint(self.parts):
+            return None
+        case = self._tests.get(name)
+        if case is None:
+            return None
+        result = case.get("result")
+        outcomes = itervalues(result) if isinstance(result, dict) else \
+            [result]
+        if not all(outcome in REUSABLE for outcome in outcomes):
+            return None
+        return deepcopy(case)
+
+
+class IncrementalPlugin(object):
+    """
+    Reuse the results of test cases whose model dependencies persist.
+
+    Test cases that declare the parts of the model that they read
+    (``depends``) are not run if none of them changed since the previous
+    result. They fail again if they failed previously such that the return
+    code reflects the reused results, and are skipped otherwise. The plugin
+    also provides the ``incremental`` fixture to the checks that examine
+    only the changed components.
+
+    """
+
+    def __init__(self, collector, incremental, **kwargs):
+        """
+        Reuse previous results according to the given comparison.
+
+        Parameters
+        ----------
+        collector : memote.suite.collect.ResultCollectionPlugin
+            Receives the previous results of the reused test cases.
+        incremental : memote.suite.incremental.Incremental
+            The comparison of the model with the previous one.
+
+        """
+        super(IncrementalPlugin, self).__init__(**kwargs)
+        self._collector = collector
+        self._incremental = incremental
+        self._previous = dict()
+        self._reused = set()
+
+    @pytest.fixture(scope="session")
+    def incremental(self):
+        """Provide the comparison with a previous result (if any)."""
+        return self._incremental
+
+    def pytest_runtest_call(self, item):
+        """Reuse the previous result of a test case instead of running it."""
+        name = item.obj.__name__
+        depends = getattr(item.obj, "depends", None)
+        if depends is None:
+            return
+        if name not in self._previous:
+            case = self._incremental.reuse(name, depends)
+            if case is None:
+                return
+            self._previous[name] = case
+            self._reused.add(name)
+        _, param = self._collector.split_name(item.name)
+        outcome = self._previous[name].get("result")
+        if isinstance(outcome, dict):
+            outcome = outcome.get(param)
+        if outcome == "failed":
+            pytest.fail("Reused the previous result: failed.",
+                        pytrace=False)
+        pytest.skip("Reused the previous result.")
+
+    def pytest_runtest_logreport(self, report):
+        """Keep the previous result, duration, and data of reused cases."""
+        if report.when != "teardown":
+            return
+        name, _ = self._collector.split_name(report.location[2])
+        if name in self._previous:
+            self._collector.cases[name] = deepcopy(self._previous[name])
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_memote_worker_state(self, names):
+        """Hand over the names of the test cases that a worker reused."""
+        return {"reused": list(self._reused)}
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_memote_worker_merge(self, state):
+        """Add the names of the test cases that a worker reused."""
+        self._reused.update(state["reused"])
+
+    def pytest_sessionfinish(self):
+        """Store the changes and the reused test cases in the results."""
+        if self._incremental.active:
+            summary = self._incremental.summary
+            summary["reused"] = sorted(self._reused)
+            self._collector.meta["incremental"] = summary
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure the resources that individual test items consume."""
+
+from __future__ import absolute_import
+
+import logging
+import os
+import sys
+from builtins import dict
+from contextlib import contextmanager
+from time import time
+
+import pytest
+from cobra import Model
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+__all__ = ("ResourceMonitor", "MonitorPlugin", "peak_rss")
+
+LOGGER = logging.getLogger(__name__)
+
+
+def peak_rss():
+    """
+    Return the peak resident set size of the process in bytes.
+
+    Returns ``None`` on platforms without the ``resource`` module.
+
+    """
+    if resource is None:
+        return None
+    return _bytes(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def _bytes(maxrss):
+    """Convert the peak resident set size of ``getrusage`` into bytes."""
+    # Linux reports kibibytes while macOS reports bytes.
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def _cpu_time():
+    """Return the user and system time of the process in seconds."""
+    times = os.times()
+    return times[0] + times[1]
+
+
+class ResourceMonitor(object):
+    """
+    Measure time, solver usage, model copies, and memory of test items.
+
+    While a measurement is active, the ``optimize`` method of the solver
+    interface and ``cobra.Model.copy`` are replaced by counting versions.
+    Since the replacement happens on the classes, optimizations of models
+    copied within a test and of problems that support functions construct
+    directly with the solver interface are counted, too.
+
+    """
+
+    def __init__(self, model, **kwargs):
+        """
+        Prepare measurements for the given model's solver interface.
+
+        Parameters
+        ----------
+        model : cobra.Model
+            The metabolic model under investigation.
+
+        """
+        super(ResourceMonitor, self).__init__(**kwargs)
+        self.interface = type(model.solver)
+
+    @contextmanager
+    def measure(self):
+        """
+        Measure the resources used within the context.
+
+        Yields
+        ------
+        dict
+            Receives the wall time ("wall_time") and the CPU time
+            ("cpu_time") in seconds, the number of optimizations ("solves"),
+            the time spent in them ("solve_time"), the number of model copies
+            ("copies"), and the increase of the peak resident set size in
+            bytes ("peak_rss_delta") when the context is left. Child
+            processes are included if they are added with ``add_child``.
+
+        """
+        usage = dict(solves=0, solve_time=0.0, copies=0, cpu_time=0.0)
+        interface = self.interface
+        optimize = interface.optimize
+        copy = Model.copy
+
+        def counted_optimize(*args, **kwargs):
+            start = time()
+            try:
+                return optimize(*args, **kwargs)
+            finally:
+                usage["solves"] += 1
+                usage["solve_time"] += time() - start
+
+        def counted_copy(*args, **kwargs):
+            usage["copies"] += 1
+            return copy(*args, **kwargs)
+
+        own = vars(interface).get("optimize")
+        interface.optimize = counted_optimize
+        Model.copy = counted_copy
+        peak = peak_rss()
+        cpu = _cpu_time()
+        start = time()
+        try:
+            yield usage
+        finally:
+            usage["wall_time"] = time() - start
+            usage["cpu_time"] += _cpu_time() - cpu
+            child_peak = usage.pop("child_peak_rss", 0)
+            if peak is None:
+                usage["peak_rss_delta"] = None
+            else:
+                usage["peak_rss_delta"] = max(peak_rss(), child_peak) - peak
+            if own is None:
+                del interface.optimize
+            else:
+                interface.optimize = own
+            Model.copy = copy
+
+    @staticmethod
+    def add_child(usage, rusage):
+        """
+        Include a terminated child process in an active measurement.
+
+        A child's CPU time is added. Its peak resident set size, which starts
+        at the size of the parent when forked, counts towards the peak of the
+        measurement.
+
+        Parameters
+        ----------
+        usage : dict
+            The dictionary yielded by ``measure``.
+        rusage : resource.struct_rusage
+            The resources of the child, e.g., as returned by ``os.wait4``.
+
+        """
+        usage["cpu_time"] += rusage.ru_utime + rusage.ru_stime
+        usage["child_peak_rss"] = max(usage.get("child_peak_rss", 0),
+                                      _bytes(rusage.ru_maxrss))
+
+
+class MonitorPlugin(object):
+    """
+    Measure the resources that each test item consumes.
+
+    The measurement includes the set up and tear down of the item's fixtures
+    and is passed to the ``pytest_memote_measured`` hook.
+
+    Attributes
+    ----------
+    usage : dict
+        The measurement of the running test item or ``None``.
+
+    """
+
+    def __init__(self, model, **kwargs):
+        """
+        Prepare measurements for the given model's solver interface.
+
+        Parameters
+        ----------
+        model : cobra.Model
+            The metabolic model under investigation.
+
+        """
+        super(MonitorPlugin, self).__init__(**kwargs)
+        self._monitor = ResourceMonitor(model)
+        self.usage = None
+
+    def add_child(self, rusage):
+        """Include a terminated child process in the running measurement."""
+        if self.usage is not None:
+            self._monitor.add_child(self.usage, rusage)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        """Measure a test item and report the measurement."""
+        with self._monitor.measure() as usage:
+            self.usage = usage
+            yield
+        self.usage = None
+        item.config.hook.pytest_memote_measured(item=item, usage=usage)
@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Profile test items individually.
+
+Each test item's profile is written to its own file. In addition, the time
+spent per function is accumulated over all items and summarized in a table
+of the hottest functions which attributes every function to a category such
+as ``memote.support``, cobrapy, optlang, or the solver.
+"""
+
+from __future__ import absolute_import
+
+import cProfile
+import io
+import logging
+import os
+import re
+from builtins import dict
+from contextlib import contextmanager
+from os.path import join
+
+import pytest
+from six import iteritems
+
+__all__ = ("ItemProfiler", "ProfilingPlugin", "PROFILERS", "categorize")
+
+LOGGER = logging.getLogger(__name__)
+
+#: The supported profilers.
+PROFILERS = ("cprofile", "pyinstrument")
+
+#: Patterns of file paths or function names and their category in order of
+#: precedence.
+CATEGORIES = (
+    ("memote.support", re.compile(r"memote[\\/]support[\\/]")),
+    ("memote", re.compile(r"memote[\\/]")),
+    ("solver", re.compile(r"glpk|cplex|gurobi|mosek", re.IGNORECASE)),
+    ("optlang", re.compile(r"optlang[\\/]")),
+    ("cobra", re.compile(r"cobra[\\/]")),
+    ("sympy", re.compile(r"sympy[\\/]")),
+    ("pandas/numpy", re.compile(r"(pandas|numpy)[\\/]")),
+    ("pytest", re.compile(r"(_pytest|pluggy)[\\/]"))
+)
+
+UNSAFE = re.compile(r"[^A-Za-z0-9_.\-\[\]]+")
+
+
+def categorize(location):
+    """
+    Return the category of a function.
+
+    Parameters
+    ----------
+    location : str
+        The file path and function name, e.g., as given by
+        ``pstats.func_std_string``.
+
+    """
+    for category, pattern in CATEGORIES:
+        if pattern.search(location) is not None:
+            return category
+    return "other"
+
+
+class ItemProfiler(object):
+    """
+    Profile test items with cProfile or pyinstrument.
+
+    Attributes
+    ----------
+    method : {"cprofile", "pyinstrument"}
+        The profiler to use.
+    directory : str
+        Where to write the profiles and the summary table.
+    top : int
+        The number of functions in the summary table.
+
+    """
+
+    def __init__(self, method="cprofile", directory="profiles", top=30,
+                 **kwargs):
+        """
+        Prepare the output directory.
+
+        Parameters
+        ----------
+        method : {"cprofile", "pyinstrument"}, optional
+            The profiler to use. cProfile records every function call and
+            writes ``.prof`` files that can be inspected with ``pstats`` or
+            snakeviz. pyinstrument is a sampling profiler with less overhead
+            that writes an HTML page per item.
+        directory : str, optional
+            Where to write the profiles and the summary table.
+        top : int, optional
+            The number of functions in the summary table.
+
+        """
+        super(ItemProfiler, self).__init__(**kwargs)
+        if method not in PROFILERS:
+            raise ValueError("Unknown profiler '{}'. Choose one of: {}."
+                             "".format(method, ", ".join(PROFILERS)))
+        if method == "pyinstrument":
+            # Fail early rather than after the first test item.
+            import pyinstrument  # noqa: F401
+        self.method = method
+        self.directory = directory
+        self.top = top
+        # Function location mapped to [calls, self time, cumulative time].
+        self._functions = dict()
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    @contextmanager
+    def profile(self, name):
+        """
+        Profile the code within the context.
+
+        Parameters
+        ----------
+        name : str
+            The pytest node ID of the item which is also used for the file
+            name.
+
+        Yields
+        ------
+        dict
+            Receives the statistics per function location of this profile
+            alone when the context is left. They are also added to the
+            accumulated ``functions``.
+
+        """
+        filename = join(self.directory, UNSAFE.sub("_", name.replace(
+            "::", ".").replace(".py.", ".")))
+        functions = dict()
+        if self.method == "cprofile":
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                yield functions
+            finally:
+                profiler.disable()
+                profiler.dump_stats(filename + ".prof")
+                self._add_cprofile(profiler, functions)
+                self.merge(functions)
+        else:
+            from pyinstrument import Profiler
+            profiler = Profiler()
+            profiler.start()
+            try:
+                yield functions
+            finally:
+                profiler.stop()
+                with io.open(filename + ".html", "w", encoding="utf-8") as \
+                        file_h:
+                    file_h.write(profiler.output_html())
+                self._add_frame(profiler.last_session.root_frame(),
+                                functions)
+                self.merge(functions)
+
+    @staticmethod
+    def _accumulate(functions, location, calls, own, cumulative):
+        """Add the measurements of one function."""
+        stats = functions.setdefault(location, [0, 0.0, 0.0])
+        stats[0] += calls
+        stats[1] += own
+        stats[2] += cumulative
+
+    def _add_cprofile(self, profiler, functions):
+        """Accumulate the function statistics of a cProfile run."""
+        profiler.create_stats()
+        for (path, line, func), (_, calls, own, cumulative, _) in \
+                iteritems(profiler.stats):
+            if path == "~":
+                location = func
+            else:
+                location = "{}:{}({})".format(path, line, func)
+            self._accumulate(functions, location, calls, own, cumulative)
+
+    def _add_frame(self, frame, functions):
+        """Accumulate the function statistics of a pyinstrument frame tree."""
+        if frame is None:
+            return
+        stack = [frame]
+        while stack:
+            frame = stack.pop()
+            total = frame.time() if callable(frame.time) else frame.time
+            children = list(frame.children)
+            own = total - sum(
+                child.time() if callable(child.time) else child.time
+                for child in children)
+            location = "{}:{}({})".format(
+                frame.file_path, frame.line_no, frame.function)
+            # Samples do not count calls; one frame is one call site.
+            self._accumulate(functions, location, 1, own, total)
+            stack.extend(children)
+
+    @property
+    def functions(self):
+        """Return the accumulated statistics per function location."""
+        return self._functions
+
+    def merge(self, functions):
+        """
+        Add the statistics of another profiler, e.g., of a worker process.
+
+        Parameters
+        ----------
+        functions : dict
+            The ``functions`` attribute of the other profiler.
+
+        """
+        for location, (calls, own, cumulative) in iteritems(functions):
+            self._accumulate(self._functions, location, calls, own,
+                             cumulative)
+
+    def summary(self):
+        """
+        Return the hottest functions and the time per category.
+
+        Returns
+        -------
+        list
+            Tuples of category, location, calls, self time and cumulative
+            time of the ``top`` functions with the largest self time.
+        dict
+            The self time summed per category.
+
+        """
+        categories = dict()
+        rows = list()
+        for location, (calls, own, cumulative) in iteritems(self._functions):
+            category = categorize(location)
+            categories[category] = categories.get(category, 0.0) + own
+            rows.append((category, location, calls, own, cumulative))
+        rows.sort(key=lambda row: row[3], reverse=True)
+        return rows[:self.top], categories
+
+    def write_summary(self, filename="hot_functions.txt"):
+        """Write the summary table into the output directory."""
+        rows, categories = self.summary()
+        total = sum(categories.values()) or 1.0
+        path = join(self.directory, filename)
+        with io.open(path, "w", encoding="utf-8") as file_h:
+            file_h.write(u"Self time per category\n\n")
+            for category, own in sorted(
+                    iteritems(categories), key=lambda pair: -pair[1]):
+                file_h.write(u"{:<16} {:>10.3f} s {:>6.1%}\n".format(
+                    category, own, own / total))
+            file_h.write(u"\nTop {} functions by self time\n\n".format(
+                len(rows)))
+            file_h.write(u"{:<16} {:>10} {:>10} {:>10}  {}\n".format(
+                "category", "calls", "self [s]", "cum. [s]", "function"))
+            for category, location, calls, own, cumulative in rows:
+                file_h.write(u"{:<16} {:>10d} {:>10.3f} {:>10.3f}  {}\n"
+                             u"".format(category, calls, own, cumulative,
+                                        location))
+        LOGGER.info("Wrote the profile summary '%s'.", path)
+        return path
+
+
+class ProfilingPlugin(object):
+    """Profile each test item and summarize the hottest functions."""
+
+    def __init__(self, profiler, **kwargs):
+        """
+        Profile test items with the given profiler.
+
+        Parameters
+        ----------
+        profiler : memote.suite.profiling.ItemProfiler
+            Writes the profiles of the items and the summary.
+
+        """
+        super(ProfilingPlugin, self).__init__(**kwargs)
+        self._profiler = profiler
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        """Profile a test item including its fixtures."""
+        with self._profiler.profile(item.nodeid):
+            yield
+
+    def pytest_sessionfinish(self):
+        """Summarize the profiles of all test items."""
+        self._profiler.write_summary()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_memote_worker_state(self, names):
+        """Hand over the statistics of a worker's test items."""
+        return {"functions": self._profiler.functions}
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_memote_worker_merge(self, state):
+        """Add the statistics of a worker's test items."""
+        self._profiler.merge(state["functions"])
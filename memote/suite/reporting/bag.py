@@ -19,62 +19,79 @@
 
 from __future__ import absolute_import
 
-from builtins import dict, zip
+from builtins import dict
 
-import io
 import logging
-from operator import itemgetter
+from multiprocessing import cpu_count
 from os.path import exists
 
-try:
-    import simplejson as json
-except ImportError:
-    import json
-
 import pandas as pd
 import dask.bag as db
+from six import iteritems
+
+from memote.suite.results import load_result
 
 LOGGER = logging.getLogger(__name__)
 
+#: The rows that are extracted from every result document.
+_TABLES = ("index", "model_ids", "basic", "consistency", "syntax", "biomass")
+
 
 class ResultBagWrapper(object):
     """Report-specific wrapper around a `dask.bag`."""
 
-    def __init__(self, files, **kwargs):
+    def __init__(self, files, npartitions=None, scheduler=None, **kwargs):
         """
-        Load (JSON) documents into memory managed by a `dask.bag`.
+        Lazily load (JSON) documents managed by a partitioned `dask.bag`.
 
         The order of the `files` argument determines the order of rows in data
-        frames returned by other methods.
+        frames returned by other methods. Documents are only read when the
+        index is built. Each partition of documents is then parsed and
+        reduced to the rows of all data frames in its own worker process such
+        that only the rows are transferred back.
 
         Parameters
         ----------
         files : iterable
-            A list of filenames that should contain valid JSON.
+            A list of filenames that should contain valid JSON (optionally
+            compressed).
+        npartitions : int, optional
+            The number of partitions. By default, this is determined by
+            `dask`.
+        scheduler : str, optional
+            The `dask` scheduler that processes the partitions. By default,
+            a pool of processes if there are several partitions and CPUs and
+            the calling thread otherwise.
 
         """
         super(ResultBagWrapper, self).__init__(**kwargs)
-        # load all into memory and avoid strange dask JSON object expectations
-        objects = list()
+        existing = list()
         for filename in files:
             if not exists(filename):
-                LOGGER.warning("Expected file %s is missing.")
+                LOGGER.warning("Expected file %s is missing.", filename)
                 continue
-            with io.open(filename) as file_h:
-                objects.append(json.load(file_h))
-        if len(objects) == 0:
+            existing.append(filename)
+        if len(existing) == 0:
             raise RuntimeError("None of the expected JSON files were found!")
-        self._bag = db.from_sequence(objects, npartitions=1)
+        self._bag = db.from_sequence(existing, npartitions=npartitions)
+        if scheduler is None:
+            scheduler = "processes" if self._bag.npartitions > 1 and \
+                cpu_count() > 1 else "sync"
+        self._scheduler = scheduler
+        self._tables = None
         self._index = None
 
     def build_index(self):
         """Build a data index either from timestamps and commit hashes."""
         LOGGER.debug("Building index...")
-        expected = pd.DataFrame({
-            "timestamp": pd.Series(dtype="datetime64[ns]"),
-            "commit_hash": pd.Series(dtype="str")
-        })
-        df = self._bag.pluck("meta", dict()).to_dataframe(expected).compute()
+        self._tables = dict((name, list()) for name in _TABLES)
+        for tables in self._bag.map_partitions(_extract_partition).compute(
+                scheduler=self._scheduler):
+            for name, rows in iteritems(tables):
+                self._tables[name].extend(rows)
+        df = pd.DataFrame(self._tables["index"],
+                          columns=("timestamp", "commit_hash"))
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
         df.set_index(
             "commit_hash", drop=True, inplace=True, verify_integrity=True)
         trunc = 5
@@ -95,8 +112,8 @@ class ResultBagWrapper(object):
 
     def get_model_ids(self):
         """Get unique model IDs. Should typically be of length one."""
-        return self._bag.pluck("report").pluck("test_basic").\
-            pluck("model_id").distinct().compute()
+        self._assert_index_presence()
+        return list(pd.unique(pd.Series(self._tables["model_ids"])))
 
     def get_basic_dataframe(self):
         """Create basic information data frame."""
@@ -107,7 +124,7 @@ class ResultBagWrapper(object):
                    "reactions_no_GPR",
 #                   "metabolic_coverage",  # noqa
                    "ngam_reaction")
-        data = pd.DataFrame(list(self._bag.map(_get_basics)), columns=columns)
+        data = pd.DataFrame(self._tables["basic"], columns=columns)
         data.set_index("commit", inplace=True)
         return self._index.join(data)
 
@@ -118,8 +135,7 @@ class ResultBagWrapper(object):
         columns = ("commit", "is_consistent", "unconserved_metabolites",
                    "magic_atp_production", "imbalanced_reactions",
                    "blocked_reactions", "looped_reactions")
-        data = pd.DataFrame(list(self._bag.map(_get_consistency)),
-                            columns=columns)
+        data = pd.DataFrame(self._tables["consistency"], columns=columns)
         data.set_index("commit", inplace=True)
         return self._index.join(data)
 
@@ -136,8 +152,7 @@ class ResultBagWrapper(object):
                    "untagged_demand",
                    "false_demand", "untagged_sink", "false_sink",
                    "untagged_exchange", "false_exchange")
-        data = pd.DataFrame(list(self._bag.map(_get_syntax)),
-                            columns=columns)
+        data = pd.DataFrame(self._tables["syntax"], columns=columns)
         data.set_index("commit", inplace=True)
         return self._index.join(data)
 
@@ -149,68 +164,95 @@ class ResultBagWrapper(object):
                    "biomass_default_flux", "num_default_blocked_precursors",
                    "num_open_blocked_precursors",
                    "gam_in_biomass")
-        data = pd.DataFrame(self._bag.map(_get_biomass).fold(
-            list.__iadd__, initial=list()).compute(), columns=columns)
+        data = pd.DataFrame(self._tables["biomass"], columns=columns)
         data.set_index("commit", inplace=True)
         return self._index.join(data)
 
 
+def _get_index_entry(meta):
+    """Collect the timestamp and commit hash of a result."""
+    return meta.get("timestamp"), meta.get("commit_hash")
+
+
+def _extract_partition(files):
+    """Parse the result files of a partition and extract all rows."""
+    tables = dict((name, list()) for name in _TABLES)
+    for filename in files:
+        elem = load_result(filename)
+        tables["index"].append(_get_index_entry(elem.get("meta", dict())))
+        tables["model_ids"].append(_data(elem, "test_model_id_presence"))
+        tables["basic"].append(_get_basics(elem))
+        tables["consistency"].append(_get_consistency(elem))
+        tables["syntax"].append(_get_syntax(elem))
+        tables["biomass"].extend(_get_biomass(elem))
+    return [tables]
+
+
+def _data(elem, name, param=None):
+    """Return the data of a test case (and parameter) or ``None``."""
+    data = elem["tests"].get(name, dict()).get("data")
+    if param is not None:
+        data = data.get(param) if isinstance(data, dict) else None
+    return data
+
+
+def _count(data):
+    """Return the number of elements or ``None`` if data is missing."""
+    return None if data is None else len(data)
+
+
 def _get_basics(elem):
     """Collect results from `test_basic`."""
-    tmp = elem["report"]["test_basic"]
     return (elem["meta"]["commit_hash"],
-            tmp["num_genes"],
-            tmp["num_reactions"],
-            tmp["num_metabolites"],
-            len(tmp["metabolites_no_formula"]),
-            len(tmp["metabolites_no_charge"]),
-            len(tmp["reactions_no_GPR"]),
-#            tmp["metabolic_coverage"],  # noqa
-            tmp["ngam_reaction"])
+            _count(_data(elem, "test_genes_presence")),
+            _count(_data(elem, "test_reactions_presence")),
+            _count(_data(elem, "test_metabolites_presence")),
+            _count(_data(elem, "test_metabolites_formula_presence")),
+            _count(_data(elem, "test_metabolites_charge_presence")),
+            _count(_data(elem, "test_gene_protein_reaction_rule_presence")),
+#            _data(elem, "test_metabolic_coverage"),  # noqa
+            _count(_data(elem, "test_ngam_presence")))
 
 
 def _get_consistency(elem):
-    """Collect results from `test_basic`."""
-    tmp = elem["report"]["test_consistency"]
-    looped = tmp["looped_reactions"] if "looped_reactions" in tmp else \
-        float("nan")
+    """Collect results from `test_consistency`."""
+    unconserved = _data(elem, "test_stoichiometric_consistency")
+    cycles = _data(elem, "test_detect_energy_generating_cycles")
+    if isinstance(cycles, dict):
+        cycles = any(len(rxns) > 0 for rxns in cycles.values() if rxns)
+    imbalanced = [_data(elem, "test_reaction_mass_balance"),
+                  _data(elem, "test_reaction_charge_balance")]
+    imbalanced = [rxns for rxns in imbalanced if rxns is not None]
     return (elem["meta"]["commit_hash"],
-            tmp["is_consistent"],
-            len(tmp["unconserved_metabolites"]),
-            tmp["magic_atp_production"],
-            len(tmp["imbalanced_reactions"]),
-            len(tmp["blocked_reactions"]),
-            looped)
+            None if unconserved is None else len(unconserved) == 0,
+            _count(unconserved),
+            cycles,
+            len(set().union(*imbalanced)) if imbalanced else None,
+            _count(_data(elem, "test_blocked_reactions")),
+            _count(_data(elem,
+                         "test_find_stoichiometrically_balanced_cycles")))
 
 
 def _get_syntax(elem):
-    """Collect results from `test_basic`."""
-    tmp = elem["report"]["test_consistency"]
-    return (elem["meta"]["commit_hash"],
-#            len(tmp["reaction_compartment_suffix"]),  # noqa
-            len(tmp["reaction_metabolite_compartment"]),
-#            len(tmp["untagged_normal_transport"]),  # noqa
-#            len(tmp["untagged_abc_transport"]),  # noqa
-#            len(tmp["uppercase_metabolites"]),  # noqa
-            len(tmp["untagged_demand"]),
-            len(tmp["false_demand"]),
-            len(tmp["untagged_sink"]),
-            len(tmp["false_sink"]),
-            len(tmp["untagged_exchange"]),
-            len(tmp["false_exchange"]))
+    """Collect results from the syntax checks."""
+    # The test suite does not check the syntax of identifiers (yet).
+    return (elem["meta"]["commit_hash"],) + (None,) * 7
 
 
 def _get_biomass(elem):
     """Collect results from `test_biomass`."""
-    tmp = elem["report"]["test_biomass"]
     commit = elem["meta"]["commit_hash"]
-    columns = itemgetter(
-        "biomass_ids", "biomass_sum", "biomass_default_flux",
-        "default_blocked_precursors", "open_blocked_precursors",
-        "gam_in_biomass")
-    res = [
-        (commit, rxn, bio_sum, def_flux, len(def_blocked), len(open_blocked),
-         gam)
-        for (rxn, bio_sum, def_flux, def_blocked, open_blocked, gam)
-        in zip(*columns(tmp))]
+    res = list()
+    for rxn in _data(elem, "test_biomass_presence") or []:
+        default_blocked = _data(
+            elem, "test_biomass_precursors_default_production", rxn)
+        open_blocked = _data(
+            elem, "test_biomass_precursors_open_production", rxn)
+        res.append((
+            commit, rxn,
+            _data(elem, "test_biomass_consistency", rxn),
+            _data(elem, "test_biomass_default_production", rxn),
+            _count(default_blocked),
+            _count(open_blocked),
+            _data(elem, "test_gam_in_biomass", rxn)))
     return res
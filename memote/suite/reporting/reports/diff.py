@@ -19,16 +19,134 @@
 
 from __future__ import absolute_import
 
+import json
+import logging
+from builtins import dict
+
+from memote.suite.incremental import compare, compatible
 from memote.suite.reporting.reports.report import Report
 
+LOGGER = logging.getLogger(__name__)
+
+
+def _units(case):
+    """Return the parameters of a test case or ``[None]``."""
+    result = case.get("result")
+    if isinstance(result, dict):
+        return list(result)
+    return [None]
+
+
+def _value(case, key, param):
+    """Return the value of a test case for one of its parameters."""
+    value = case.get(key)
+    if param is not None and isinstance(value, dict):
+        return value.get(param)
+    return value
+
+
+def _key(value):
+    """
+    Return a canonical, hashable form of a JSON value.
+
+    Nested lists, as found in results loaded from files, become comparable
+    and ``NaN`` equals ``NaN``.
+
+    """
+    return json.dumps(value, sort_keys=True)
+
+
+def _difference(first, second):
+    """Return the elements of ``second`` missing from ``first`` in order."""
+    known = set(_key(elem) for elem in first)
+    missing = dict((_key(elem), elem) for elem in second)
+    return [missing[key] for key in sorted(missing) if key not in known]
+
 
 class DiffReport(Report):
-    """Render a report from the comparison of two models."""
+    """
+    Render a report from the comparison of two models.
+
+    Only the components and the test results that differ between the two
+    models are shown. Components are compared by their fingerprints, which
+    the test suite stores with every result, such that the comparison takes
+    linear time in the size of the models.
+
+    Attributes
+    ----------
+    components : dict or None
+        The added, removed, and changed components per component type as
+        returned by ``memote.suite.incremental.compare``. ``None`` if one of
+        the results lacks a compatible fingerprint.
+    tests : list
+        One entry per test case (and parameter) whose result, metric, or
+        data differ.
 
-    def __init__(self, **kwargs):
-        """Initialize the data."""
+    """
+
+    def __init__(self, results, labels=None, **kwargs):
+        """
+        Compare two test results.
+
+        Parameters
+        ----------
+        results : sequence
+            The results of the first and of the second model as returned
+            by the test suite.
+        labels : sequence, optional
+            Names for the two models, e.g., their file names.
+
+        """
         super(DiffReport, self).__init__(**kwargs)
+        self.results = list(results)
+        if len(self.results) != 2:
+            raise ValueError("Exactly two results can be compared.")
+        self.labels = ["Model 1", "Model 2"] if labels is None else \
+            list(labels)
+        old, new = [res.get("fingerprints") for res in self.results]
+        if not compatible(old, new):
+            LOGGER.warning("At least one result lacks a compatible model "
+                           "fingerprint. Only test results are compared.")
+            self.components = None
+        else:
+            self.components = compare(old, new)
+        self.tests = self._compare_tests()
+
+    def _compare_tests(self):
+        """Return the differences in test results."""
+        old, new = [res.get("tests", dict()) for res in self.results]
+        entries = list()
+        for name in sorted(set(old) | set(new)):
+            before = old.get(name, dict())
+            after = new.get(name, dict())
+            params = _units(after)
+            params.extend(p for p in _units(before) if p not in params)
+            for param in params:
+                entry = {
+                    "test": name,
+                    "param": param,
+                    "title": after.get("title", before.get("title", name)),
+                    "result": [_value(before, "result", param),
+                               _value(after, "result", param)],
+                    "metric": [_value(before, "metric", param),
+                               _value(after, "metric", param)]
+                }
+                data = [_value(before, "data", param),
+                        _value(after, "data", param)]
+                if all(isinstance(value, list) for value in data):
+                    entry["added"] = _difference(data[0], data[1])
+                    entry["removed"] = _difference(data[1], data[0])
+                    changed = len(entry["added"]) + len(entry["removed"]) > 0
+                else:
+                    changed = _key(data[0]) != _key(data[1])
+                if changed or any(_key(pair[0]) != _key(pair[1]) for pair in
+                                  (entry["result"], entry["metric"])):
+                    entries.append(entry)
+        return entries
 
     def render_html(self):
-        """Render an HTML report for a model."""
-        raise NotImplementedError(u"Coming soon™.")
+        """Render an HTML report of the differences."""
+        template = self.env.get_template("diff_report.html")
+        return template.render(
+            name=u" vs. ".join(self.labels), labels=self.labels,
+            components=self.components, tests=self.tests)
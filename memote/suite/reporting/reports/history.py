@@ -25,7 +25,8 @@ from builtins import dict, str
 
 from memote.suite.reporting.reports.report import Report
 import memote.suite.reporting.plot as plt
-from memote.suite.reporting.bag import ResultBagWrapper
+from memote.suite.results import find_result
+from memote.suite.reporting.store import ResultStore
 
 LOGGER = logging.getLogger(__name__)
 
@@ -35,9 +36,10 @@ class HistoryReport(Report):
 
     _valid_indexes = frozenset(["time", "hash"])
 
-    def __init__(self, repository, directory, index="time", **kwargs):
+    def __init__(self, repository, directory, index="time", store=None,
+                 **kwargs):
         """
-        Initialize the git interaction and dask bag.
+        Initialize the git interaction and the result store.
 
         Parameters
         ----------
@@ -48,6 +50,9 @@ class HistoryReport(Report):
         index : {'time', 'hash'}, optional
             Whether to use time (the default) or commit hashes as the default
             axis in plots.
+        store : str or path, optional
+            Where the extracted metrics are kept. Defaults to a directory
+            ``store`` inside of ``directory``.
 
         """
         super(HistoryReport, self).__init__(**kwargs)
@@ -61,12 +66,14 @@ class HistoryReport(Report):
         self.history = [commit.hexsha for commit in self.latest.iter_parents()]
         self.history.insert(0, self.latest.hexsha)
         self.directory = directory
-        self.files = [join(self.directory, "{}.json".format(commit))
+        self.files = [find_result(join(self.directory, commit))
                       for commit in self.history]
         if len(self.files) == 0:
             raise RuntimeError("There is no git branch history!")
-        self.bag = ResultBagWrapper(self.files)
-        self.bag.build_index()
+        self.store = ResultStore(
+            join(self.directory, "store") if store is None else store)
+        self.store.ingest(self.files)
+        self.store.build_index(self.history)
         self.index = {
             "time": "timestamp",
             "hash": "commit_hash"
@@ -85,7 +92,10 @@ class HistoryReport(Report):
 
     def _collect_basic_plots(self):
         """Create plots from the basic info data frame."""
-        df = self.bag.get_basic_dataframe()
+        df = self.store.get_basic_dataframe([
+            "num_genes", "num_reactions", "num_metabolites",
+            "num_metabolites_no_formula", "metabolites_no_charge",
+            "reactions_no_GPR", "ngam_reaction"])
         plots = dict()
         # create genes plot
         plots["genes"] = plt.scatter_line_chart(
@@ -117,7 +127,10 @@ class HistoryReport(Report):
 
     def _collect_consistency_plots(self):
         """Create plots from the consistency info data frame."""
-        df = self.bag.get_consistency_dataframe()
+        df = self.store.get_consistency_dataframe([
+            "is_consistent", "unconserved_metabolites",
+            "magic_atp_production", "imbalanced_reactions",
+            "blocked_reactions"])
         plots = dict()
         plots["is_consistent"] = plt.boolean_chart(
             df[[self.index, "is_consistent"]],
@@ -142,7 +155,9 @@ class HistoryReport(Report):
 
     def _collect_syntax_plots(self):
         """Create plots from the syntax info data frame."""
-        df = self.bag.get_consistency_dataframe()
+        df = self.store.get_syntax_dataframe([
+            "untagged_demand", "false_demand", "untagged_sink", "false_sink",
+            "untagged_exchange", "false_exchange"])
         plots = dict()
 #        plots["reaction_compartment_suffix"] = plt.scatter_line_chart(
 #            df[[self.index, "reaction_compartment_suffix"]],
@@ -178,7 +193,10 @@ class HistoryReport(Report):
 
     def _collect_biomass_plots(self):
         """Create plots from the biomass info data frame."""
-        df = self.bag.get_biomass_dataframe()
+        df = self.store.get_biomass_dataframe([
+            "biomass_ids", "biomass_sum", "biomass_default_flux",
+            "num_default_blocked_precursors", "num_open_blocked_precursors",
+            "gam_in_biomass"])
         plots = dict()
         # components sum
         factor = "biomass_ids"
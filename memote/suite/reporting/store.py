@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Provide an append-only, columnar store of test result metrics."""
+
+from __future__ import absolute_import
+
+import io
+import logging
+from builtins import dict
+from glob import glob
+from os import makedirs, stat
+from os.path import basename, exists, isdir, join
+
+import pandas as pd
+from six import iteritems
+
+from memote.suite.results import load_result
+from memote.suite.reporting.bag import (
+    _get_basics, _get_consistency, _get_syntax, _get_biomass)
+
+__all__ = ("ResultStore",)
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _get_meta(elem):
+    """Collect the meta information needed for the index."""
+    return [(elem["meta"]["commit_hash"], elem["meta"]["timestamp"])]
+
+
+def _as_rows(func):
+    """Wrap an extraction function that returns a single row."""
+    def wrapped(elem):
+        return [func(elem)]
+    return wrapped
+
+
+def _signature(filename):
+    """Return the size and modification time of a file as text."""
+    info = stat(filename)
+    return u"{:d}\t{!r}".format(info.st_size, info.st_mtime)
+
+
+class ResultStore(object):
+    """
+    Store the scalar metrics of many test results in Parquet tables.
+
+    Each result document is read once, its metrics are extracted into one
+    table per report section, and the document is discarded again. Every
+    ingestion appends new part files such that existing data is never
+    rewritten. A result file whose size or modification time changed, e.g.,
+    by ``memote history --rewrite``, is ingested again and its newer rows
+    take precedence. Reading a table only loads the requested columns.
+
+    """
+
+    #: Table name, extraction function, and the columns of its rows.
+    TABLES = {
+        "meta": (_get_meta, ("commit", "timestamp")),
+        "basic": (_as_rows(_get_basics), (
+            "commit", "num_genes", "num_reactions", "num_metabolites",
+            "num_metabolites_no_formula", "metabolites_no_charge",
+            "reactions_no_GPR", "ngam_reaction")),
+        "consistency": (_as_rows(_get_consistency), (
+            "commit", "is_consistent", "unconserved_metabolites",
+            "magic_atp_production", "imbalanced_reactions",
+            "blocked_reactions", "looped_reactions")),
+        "syntax": (_as_rows(_get_syntax), (
+            "commit", "reaction_metabolite_compartment", "untagged_demand",
+            "false_demand", "untagged_sink", "false_sink",
+            "untagged_exchange", "false_exchange")),
+        "biomass": (_get_biomass, (
+            "commit", "biomass_ids", "biomass_sum", "biomass_default_flux",
+            "num_default_blocked_precursors", "num_open_blocked_precursors",
+            "gam_in_biomass"))
+    }
+
+    def __init__(self, path, batch_size=1000, **kwargs):
+        """
+        Open (or create) a result store.
+
+        Parameters
+        ----------
+        path : str
+            The directory that contains the store's tables.
+        batch_size : int, optional
+            The number of result documents whose metrics are held in memory
+            before they are written to a new part file.
+
+        """
+        super(ResultStore, self).__init__(**kwargs)
+        self.path = path
+        self.batch_size = batch_size
+        self._index = None
+        for table in self.TABLES:
+            directory = join(self.path, table)
+            if not isdir(directory):
+                makedirs(directory)
+
+    def _read_table(self, table, columns=None):
+        """Read the given columns of a table in the order of ingestion."""
+        parts = sorted(glob(join(self.path, table, "*.parquet")))
+        if len(parts) == 0:
+            all_columns = self.TABLES[table][1]
+            df = pd.DataFrame(columns=all_columns if columns is None
+                              else columns)
+            df["part"] = pd.Series(dtype=int)
+            return df
+        frames = list()
+        for number, part in enumerate(parts):
+            df = pd.read_parquet(part, columns=columns)
+            df["part"] = number
+            frames.append(df)
+        return pd.concat(frames, ignore_index=True)
+
+    def _write_batch(self, rows):
+        """Append one part file per table."""
+        for table, data in iteritems(rows):
+            if len(data) == 0:
+                continue
+            directory = join(self.path, table)
+            number = len(glob(join(directory, "*.parquet")))
+            df = pd.DataFrame(data, columns=self.TABLES[table][1])
+            df.to_parquet(join(directory, "part-{:06d}.parquet".format(
+                number)), index=False)
+
+    def _sources(self):
+        """Return the signature of each file that was ingested already."""
+        filename = join(self.path, "sources.txt")
+        if not exists(filename):
+            return dict()
+        sources = dict()
+        with io.open(filename) as file_h:
+            for line in file_h:
+                name, _, signature = line.rstrip("\n").partition("\t")
+                # Later entries of a re-ingested file replace earlier ones.
+                sources[name] = signature
+        return sources
+
+    def _flush(self, rows, names):
+        """Write a batch of rows and record the files they came from."""
+        self._write_batch(rows)
+        with io.open(join(self.path, "sources.txt"), "a") as file_h:
+            for name, signature in names:
+                file_h.write(u"{}\t{}\n".format(name, signature))
+
+    def ingest(self, files):
+        """
+        Extract the metrics from result files that are new or changed.
+
+        Parameters
+        ----------
+        files : iterable
+            A list of filenames that should contain valid JSON (optionally
+            compressed).
+
+        Returns
+        -------
+        int
+            The number of newly or again ingested result files.
+
+        """
+        known = self._sources()
+        rows = dict((table, list()) for table in self.TABLES)
+        names = list()
+        total = 0
+        for filename in files:
+            name = basename(filename)
+            if not exists(filename):
+                LOGGER.warning("Expected file %s is missing.", filename)
+                continue
+            signature = _signature(filename)
+            if known.get(name) == signature:
+                continue
+            elem = load_result(filename)
+            for table, (extract, _) in iteritems(self.TABLES):
+                try:
+                    rows[table].extend(extract(elem))
+                except KeyError as err:
+                    LOGGER.warning(
+                        "File %s lacks %s information: %s", filename, table,
+                        str(err))
+            known[name] = signature
+            names.append((name, signature))
+            if len(names) == self.batch_size:
+                self._flush(rows, names)
+                total += len(names)
+                rows = dict((table, list()) for table in self.TABLES)
+                names = list()
+        self._flush(rows, names)
+        total += len(names)
+        LOGGER.debug("Ingested %d new result files.", total)
+        return total
+
+    def build_index(self, commits=None):
+        """
+        Build a data index from timestamps and commit hashes.
+
+        Parameters
+        ----------
+        commits : iterable, optional
+            Restrict the index to these commit hashes, for example, the
+            current branch's history.
+
+        """
+        LOGGER.debug("Building index...")
+        df = self._read_table("meta").drop("part", axis=1)
+        df.rename(columns={"commit": "commit_hash"}, inplace=True)
+        if commits is not None:
+            df = df.loc[df["commit_hash"].isin(commits)]
+        if len(df) == 0:
+            raise RuntimeError("The store contains no matching results!")
+        df = df.drop_duplicates("commit_hash", keep="last")
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+        df.set_index(
+            "commit_hash", drop=True, inplace=True, verify_integrity=True)
+        trunc = 5
+        res = df.index.str[:trunc]
+        while len(res.unique()) < len(df):
+            trunc += 1
+            res = df.index.str[:trunc]
+        df["commit_hash"] = res.copy()
+        df.sort_values("timestamp", inplace=True, kind="mergesort")
+        self._index = df
+
+    def _assert_index_presence(self):
+        """Ensure that the index was built."""
+        if self._index is None:
+            raise ValueError(
+                "No index present. Please call method `build_index` first.")
+
+    def _get_dataframe(self, table, columns):
+        """Join the requested columns of a table with the index."""
+        self._assert_index_presence()
+        if columns is not None:
+            columns = ["commit"] + [col for col in columns if col != "commit"]
+        data = self._read_table(table, columns)
+        data = data.loc[data["commit"].isin(self._index.index)]
+        if table == "biomass":
+            # A commit has one row per biomass reaction. Keep those of the
+            # most recent ingestion.
+            latest = data.groupby("commit")["part"].transform("max")
+            data = data.loc[data["part"] == latest]
+        else:
+            data = data.drop_duplicates("commit", keep="last")
+        data = data.drop("part", axis=1)
+        data.set_index("commit", inplace=True)
+        return self._index.join(data)
+
+    def get_basic_dataframe(self, columns=None):
+        """Create basic information data frame."""
+        LOGGER.debug("Collecting basic information from store.")
+        return self._get_dataframe("basic", columns)
+
+    def get_consistency_dataframe(self, columns=None):
+        """Create consistency information data frame."""
+        LOGGER.debug("Collecting consistency information from store.")
+        return self._get_dataframe("consistency", columns)
+
+    def get_syntax_dataframe(self, columns=None):
+        """Create syntax information data frame."""
+        LOGGER.debug("Collecting syntax information from store.")
+        return self._get_dataframe("syntax", columns)
+
+    def get_biomass_dataframe(self, columns=None):
+        """Create biomass information data frame."""
+        LOGGER.debug("Collecting biomass information from store.")
+        return self._get_dataframe("biomass", columns)
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Read and write test results.
+
+The format is determined by the file extension:
+
+* ``.json``: Human readable, pretty-printed JSON.
+* ``.json.gz``: Compact, gzip compressed JSON which is much smaller for large
+  models.
+
+Documents are always encoded and decoded incrementally from and to the file
+such that the complete document is never held as one string in memory. They
+are written as ASCII-only JSON in binary mode, which works the same on Python
+2 and 3.
+"""
+
+from __future__ import absolute_import
+
+import gzip
+import io
+import logging
+from os.path import exists
+
+try:
+    import simplejson as json
+except ImportError:
+    import json
+
+__all__ = ("load_result", "dump_result", "find_result")
+
+LOGGER = logging.getLogger(__name__)
+
+#: The supported file extensions in order of preference.
+EXTENSIONS = (".json", ".json.gz")
+
+
+def _is_compressed(filename):
+    """Determine whether a filename denotes a compressed format."""
+    return str(filename).endswith(".gz")
+
+
+def _open(filename, mode):
+    """Open a result file in binary mode irrespective of compression."""
+    if _is_compressed(filename):
+        return gzip.open(str(filename), mode + "b")
+    return io.open(str(filename), mode + "b")
+
+
+def load_result(filename):
+    """
+    Load a test result document.
+
+    Parameters
+    ----------
+    filename : str or pathlib.Path
+        A ``.json`` or ``.json.gz`` file.
+
+    Returns
+    -------
+    dict
+        The nested result structure.
+
+    """
+    with _open(filename, "r") as file_h:
+        return json.load(io.TextIOWrapper(file_h, encoding="utf-8"))
+
+
+def dump_result(result, filename):
+    """
+    Write a test result document.
+
+    Parameters
+    ----------
+    result : dict
+        The nested result structure.
+    filename : str or pathlib.Path
+        A ``.json`` or ``.json.gz`` file.
+
+    """
+    LOGGER.info("Writing result '%s'.", filename)
+    if _is_compressed(filename):
+        kwargs = dict(separators=(",", ":"))
+    else:
+        kwargs = dict(indent=4, separators=(",", ": "))
+    encoder = json.JSONEncoder(sort_keys=True, **kwargs)
+    with _open(filename, "w") as file_h:
+        # ``json.dump`` writes ``str`` chunks which a binary file and, on
+        # Python 2, a text file reject.
+        for chunk in encoder.iterencode(result):
+            file_h.write(chunk.encode("ascii"))
+
+
+def find_result(base, extension=EXTENSIONS[0]):
+    """
+    Return the filename of an existing result in any of the formats.
+
+    Parameters
+    ----------
+    base : str
+        The path and base name of the result without extension, for example,
+        ``results/<commit hash>``.
+    extension : str, optional
+        The extension of a new result, one of ``EXTENSIONS``.
+
+    Returns
+    -------
+    str
+        The filename of the existing result or, if none exists, the filename
+        with the given extension.
+
+    """
+    for ext in EXTENSIONS:
+        filename = base + ext
+        if exists(filename):
+            return filename
+    return base + extension
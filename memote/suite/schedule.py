@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Distribute test cases across worker processes by their expected cost.
+
+Test cases are assigned longest processing time first (LPT): in the order of
+decreasing expected duration, each goes to the worker with the least work so
+far. This keeps all workers busy until the end rather than leaving a single
+expensive check, e.g., a flux variability analysis, to run last. The
+expected durations are the mean durations recorded in previous results.
+Without any history the cost is estimated from the size of the model and
+whether a test case needs a solver.
+
+The workers are forked from the test session like supervised test items
+(see ``memote.suite.supervise``) and inherit the loaded model and fixtures.
+"""
+
+from __future__ import absolute_import, division
+
+import heapq
+import logging
+import os
+import select
+import signal
+import sys
+import traceback
+from builtins import dict
+from collections import OrderedDict
+from copy import copy
+from multiprocessing import Pipe
+
+import pytest
+from six import iteritems, itervalues
+
+from memote.suite.supervise import SUPERVISED
+
+try:
+    from multiprocessing.connection import wait
+except ImportError:
+    # Python 2 lacks it but the pipes of forked workers are file descriptors.
+    def wait(object_list, timeout=None):
+        """Return the connections that are ready to be read."""
+        return select.select(object_list, [], [], timeout)[0]
+
+__all__ = ("durations", "estimate", "lpt", "fork_workers",
+           "WorkerPlugin")
+
+LOGGER = logging.getLogger(__name__)
+
+#: Rough seconds per reaction and metabolite for each test item depending on
+#: whether it needs a solver.
+SECONDS_PER_COMPONENT = {False: 2E-05, True: 2E-03}
+
+
+def _total(duration):
+    """Return the duration of a test case summed over its parameters."""
+    if isinstance(duration, dict):
+        values = [value for value in itervalues(duration)
+                  if isinstance(value, (int, float))]
+        return sum(values) if len(values) > 0 else None
+    if isinstance(duration, (int, float)):
+        return duration
+    return None
+
+
+def durations(results):
+    """
+    Average the recorded durations of each test case.
+
+    Parameters
+    ----------
+    results : iterable
+        Results of previous runs as returned by the test suite.
+
+    Returns
+    -------
+    dict
+        The mean duration in seconds per test case name. The duration of a
+        parametrized test case is the sum over its parameters.
+
+    """
+    totals = dict()
+    for result in results:
+        for name, case in iteritems(result.get("tests", dict())):
+            duration = _total(case.get("duration"))
+            if duration is not None:
+                totals.setdefault(name, list()).append(duration)
+    return dict((name, sum(values) / len(values))
+                for name, values in iteritems(totals))
+
+
+def estimate(model, solver=False, items=1):
+    """
+    Estimate the duration of a test case without any history.
+
+    Parameters
+    ----------
+    model : cobra.Model
+        The metabolic model under investigation.
+    solver : bool, optional
+        Whether the test case solves optimization problems.
+    items : int, optional
+        The number of parameters of the test case.
+
+    Returns
+    -------
+    float
+        The expected duration in seconds.
+
+    """
+    size = len(model.reactions) + len(model.metabolites)
+    return items * size * SECONDS_PER_COMPONENT[bool(solver)]
+
+
+def lpt(costs, workers):
+    """
+    Assign jobs to workers with the longest processing time first.
+
+    Parameters
+    ----------
+    costs : dict
+        The expected cost of each job.
+    workers : int
+        The number of workers.
+
+    Returns
+    -------
+    list
+        One list of jobs per worker. Jobs of equal cost are assigned in the
+        order of their keys such that the schedule is deterministic.
+
+    """
+    bins = [list() for _ in range(workers)]
+    loads = [(0.0, index) for index in range(workers)]
+    for job in sorted(costs, key=lambda key: (-costs[key], key)):
+        load, index = heapq.heappop(loads)
+        bins[index].append(job)
+        heapq.heappush(loads, (load + costs[job], index))
+    return bins
+
+
+def _child(task, run, conn):
+    """Run a task and forward its messages."""
+    try:
+        run(task, lambda message: conn.send(("message", message)))
+    except BaseException:
+        traceback.print_exc()
+        return
+    conn.send(("done", None))
+
+
+def fork_workers(tasks, run, receive):
+    """
+    Run each task in a forked child process.
+
+    Parameters
+    ----------
+    tasks : list
+        One task per worker.
+    run : callable
+        Called in the child with the task and a function that transfers a
+        picklable message to the parent.
+    receive : callable
+        Called in the parent with the index of the task and each message in
+        the order of arrival.
+
+    Returns
+    -------
+    list
+        Whether each task finished without error.
+
+    """
+    pending = dict()
+    pids = dict()
+    for index, task in enumerate(tasks):
+        receiver, sender = Pipe(duplex=False)
+        pid = os.fork()
+        if pid == 0:
+            receiver.close()
+            for other in itervalues(pending):
+                other.close()
+            try:
+                _child(task, run, sender)
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                # Never run the parent's clean up, e.g., pytest's.
+                os._exit(0)
+        sender.close()
+        pending[index] = receiver
+        pids[index] = pid
+    finished = [False] * len(tasks)
+    try:
+        while len(pending) > 0:
+            # Read one message of every ready worker in turn such that none
+            # of them blocks on a full pipe.
+            indices = dict((conn, index) for index, conn in iteritems(pending))
+            for conn in wait(list(indices)):
+                index = indices[conn]
+                try:
+                    kind, message = conn.recv()
+                except EOFError:
+                    conn.close()
+                    del pending[index]
+                    continue
+                if kind == "done":
+                    finished[index] = True
+                else:
+                    receive(index, message)
+    finally:
+        # Only left over if the parent was interrupted.
+        for index, conn in iteritems(pending):
+            conn.close()
+            os.kill(pids[index], signal.SIGKILL)
+        for pid in itervalues(pids):
+            os.waitpid(pid, 0)
+    for index, done in enumerate(finished):
+        if not done:
+            LOGGER.error("Worker %d with process ID %d failed.", index,
+                         pids[index])
+    return finished
+
+
+class WorkerPlugin(object):
+    """
+    Distribute the test cases of a session across worker processes.
+
+    All items of a test case run in the same worker. The workers report
+    back every item such that pytest's output and return code reflect the
+    whole session, and finally the state that the plugins collected (see
+    ``memote.suite.hooks``).
+
+    """
+
+    def __init__(self, collector, model, workers=1, results=(),
+                 incremental=None, **kwargs):
+        """
+        Plan the distribution of test cases.
+
+        Parameters
+        ----------
+        collector : memote.suite.collect.ResultCollectionPlugin
+            Receives the schedule and an error for the test cases of
+            workers that failed.
+        model : cobra.Model
+            The metabolic model under investigation.
+        workers : int, optional
+            The number of processes that run test cases in parallel.
+        results : iterable, optional
+            Results of previous runs. Their recorded durations determine how
+            test cases are distributed across the workers.
+        incremental : memote.suite.incremental.Incremental, optional
+            Test cases that it allows to reuse cost nothing.
+
+        """
+        super(WorkerPlugin, self).__init__(**kwargs)
+        self._collector = collector
+        self._model = model
+        self._workers = workers
+        self._durations = durations(results)
+        self._incremental = incremental
+        self._send = None
+
+    def _cost(self, func, items):
+        """Return the expected duration of a test case in seconds."""
+        depends = getattr(func, "depends", None)
+        if depends is not None and self._incremental is not None and \
+                self._incremental.active and \
+                depends.isdisjoint(self._incremental.parts):
+            return 0.0
+        try:
+            return self._durations[func.__name__]
+        except KeyError:
+            return estimate(self._model, getattr(func, "solver", False),
+                            items)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session):
+        """Run the test cases in worker processes."""
+        if self._workers < 2 or not SUPERVISED or \
+                session.config.option.collectonly or len(session.items) == 0:
+            return None
+        cases = OrderedDict()
+        for item in session.items:
+            cases.setdefault(item.obj.__name__, list()).append(item)
+        costs = dict((name, self._cost(items[0].obj, len(items)))
+                     for name, items in iteritems(cases))
+        schedule = [names for names in lpt(costs, self._workers) if names]
+        self._collector.meta["schedule"] = schedule
+        LOGGER.info("Running %d test cases in %d processes.", len(cases),
+                    len(schedule))
+        hook = session.config.hook
+
+        def run(names, send):
+            # The parent reports the items of all workers.
+            reporter = session.config.pluginmanager.get_plugin(
+                "terminalreporter")
+            if reporter is not None:
+                session.config.pluginmanager.unregister(reporter)
+            self._send = send
+            items = [item for name in names for item in cases[name]]
+            for index, item in enumerate(items):
+                nextitem = items[index + 1] if index + 1 < len(items) else \
+                    None
+                hook.pytest_runtest_protocol(item=item, nextitem=nextitem)
+            state = dict()
+            for part in hook.pytest_memote_worker_state(names=names):
+                state.update(part)
+            send(("state", state))
+
+        finished = fork_workers(
+            schedule, run, lambda index, message: self._receive(
+                session, message))
+        for names, done in zip(schedule, finished):
+            if done:
+                continue
+            for name in names:
+                if "result" not in self._collector.cases.get(name, dict()):
+                    self._collector.record(name, None, "result", "error")
+            session.testsfailed += 1
+        return True
+
+    def _receive(self, session, message):
+        """Replay the report of a worker or merge its final state."""
+        kind, content = message
+        hook = session.config.hook
+        if kind == "report":
+            if content.when == "setup":
+                hook.pytest_runtest_logstart(nodeid=content.nodeid,
+                                             location=content.location)
+            hook.pytest_runtest_logreport(report=content)
+            if content.when == "teardown" and \
+                    hasattr(hook, "pytest_runtest_logfinish"):
+                hook.pytest_runtest_logfinish(nodeid=content.nodeid,
+                                              location=content.location)
+            return
+        hook.pytest_memote_worker_merge(state=content)
+
+    def pytest_runtest_logreport(self, report):
+        """Send the report of an item to the parent of a worker process."""
+        if self._send is None:
+            return
+        report = copy(report)
+        if report.longrepr is not None and \
+                not isinstance(report.longrepr, tuple):
+            report.longrepr = str(report.longrepr)
+        self._send(("report", report))
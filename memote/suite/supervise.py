@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Run test items under a time limit in a supervised child process.
+
+The child is forked from the test session such that it inherits the loaded
+model and all fixtures without copying or pickling them. When the time limit
+is reached, the child is asked to stop with ``SIGTERM``, which raises
+``BudgetExceeded`` in the running test and gives it the chance to hand back
+the data that it collected so far. A child that does not respond within a
+grace period, e.g., because it is stuck in a long solver call, is killed.
+"""
+
+from __future__ import absolute_import
+
+import logging
+import os
+import signal
+import traceback
+from builtins import dict
+from multiprocessing import Pipe
+from time import time
+
+import pytest
+from six import iteritems, itervalues
+from six.moves import cPickle as pickle
+
+__all__ = ("BudgetExceeded", "SUPERVISED", "supervise", "BudgetPlugin")
+
+LOGGER = logging.getLogger(__name__)
+
+#: pytest's outcome exceptions cannot be pickled and are recreated by name.
+OUTCOMES = {"skip": pytest.skip, "fail": pytest.fail, "xfail": pytest.xfail}
+
+#: Whether the platform supports running items in a supervised process.
+SUPERVISED = hasattr(os, "fork")
+
+
+class BudgetExceeded(Exception):
+    """Raised in a test item that exceeded its time budget."""
+
+    pass
+
+
+def _interrupt(signum, frame):
+    """Stop the running test item."""
+    raise BudgetExceeded("The time budget was exceeded.")
+
+
+def _picklable(error):
+    """Return the error if it can be transferred or a substitute."""
+    for name, outcome in iteritems(OUTCOMES):
+        if isinstance(error, outcome.Exception):
+            return name, error.msg
+    try:
+        pickle.dumps(error, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return RuntimeError("".join(traceback.format_exception(
+            type(error), error, getattr(error, "__traceback__", None))))
+    return error
+
+
+def _restore(error):
+    """Recreate pytest's outcome exceptions."""
+    if isinstance(error, tuple):
+        name, msg = error
+        try:
+            OUTCOMES[name](msg)
+        except BaseException as err:
+            return err
+    return error
+
+
+def _child(func, collect, conn):
+    """Run the function and send the error and collected state."""
+    signal.signal(signal.SIGTERM, _interrupt)
+    error = None
+    try:
+        func()
+    except BaseException as err:
+        error = err
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    state = None if collect is None else collect()
+    try:
+        conn.send((_picklable(error), state))
+    except Exception as err:
+        conn.send((RuntimeError("Failed to transfer the results of the "
+                                "supervised process: {}".format(err)), None))
+
+
+def _wait(receiver, pid, timeout, grace):
+    """Receive the outcome of the child and stop it if necessary."""
+    finished = True
+    if not receiver.poll(timeout):
+        finished = False
+        os.kill(pid, signal.SIGTERM)
+        if not receiver.poll(grace):
+            LOGGER.warning("Killing unresponsive process %d.", pid)
+            os.kill(pid, signal.SIGKILL)
+            return False, BudgetExceeded("The time budget was exceeded."), \
+                None
+    try:
+        error, state = receiver.recv()
+    except EOFError:
+        return finished, RuntimeError(
+            "The supervised process died unexpectedly."), None
+    if not finished and error is None:
+        # The function completed just before it was interrupted.
+        finished = True
+    return finished, _restore(error), state
+
+
+def supervise(func, timeout, collect=None, grace=5.0):
+    """
+    Call a function in a child process and stop it after ``timeout``.
+
+    Parameters
+    ----------
+    func : callable
+        A function without arguments. Its return value is ignored; results
+        have to be communicated via ``collect``.
+    timeout : float
+        The time limit in seconds.
+    collect : callable, optional
+        Called in the child after ``func`` returned, raised, or was stopped.
+        Its picklable return value is transferred to the parent.
+    grace : float, optional
+        The time in seconds that a stopped child has to hand back its state
+        before it is killed.
+
+    Returns
+    -------
+    bool
+        Whether the function finished within the time limit.
+    Exception or None
+        The error that the function raised, if any.
+    object
+        The return value of ``collect`` or ``None`` if it is unavailable.
+    resource.struct_rusage
+        The resources that the child process consumed as reported by
+        ``os.wait4``.
+
+    """
+    receiver, sender = Pipe(duplex=False)
+    pid = os.fork()
+    if pid == 0:
+        receiver.close()
+        try:
+            _child(func, collect, sender)
+        finally:
+            # Never run the parent's clean up, e.g., pytest's, in the child.
+            os._exit(0)
+    sender.close()
+    try:
+        finished, error, state = _wait(receiver, pid, timeout, grace)
+    finally:
+        receiver.close()
+        _, _, rusage = os.wait4(pid, 0)
+    return finished, error, state, rusage
+
+
+class BudgetPlugin(object):
+    """
+    Run the test cases of a session within their time budgets.
+
+    A test case with a budget runs in a supervised process. A test case
+    whose budget is zero, or that starts after the total budget is used up,
+    is skipped.
+
+    """
+
+    def __init__(self, collector, budgets=None, monitor=None, profiler=None,
+                 **kwargs):
+        """
+        Combine the configured and the given time budgets.
+
+        Parameters
+        ----------
+        collector : memote.suite.collect.ResultCollectionPlugin
+            Provides the budgets of ``test_config.yml``, which are updated,
+            and receives the results of test cases that ran out of time.
+        budgets : dict, optional
+            Time budgets in seconds that take precedence over the configured
+            ones. The keys "total" and "default" set the budget of the whole
+            session and of each test case while test case names set
+            individual budgets.
+        monitor : memote.suite.monitor.MonitorPlugin, optional
+            Receives the resources of the supervised processes.
+        profiler : memote.suite.profiling.ItemProfiler, optional
+            Profiles each supervised process if given.
+
+        """
+        super(BudgetPlugin, self).__init__(**kwargs)
+        self._collector = collector
+        self._monitor = monitor
+        self._profiler = profiler
+        self._start = time()
+        self._timeouts = set()
+        config = collector.budgets
+        cases = config.get("cases") or dict()
+        for key, value in iteritems(dict() if budgets is None else budgets):
+            if key in ("total", "default"):
+                config[key] = value
+            else:
+                cases[key] = value
+        config["cases"] = cases
+        self._budgets = config
+        if not SUPERVISED and (config.get("total") is not None or
+                               config.get("default") is not None or
+                               any(v is not None for v in itervalues(cases))):
+            LOGGER.warning("Time budgets are not supported on this platform "
+                           "and will be ignored.")
+
+    def _case_budget(self, name):
+        """Return the configured budget of a test case and its origin."""
+        budget = self._budgets["cases"].get(name)
+        if budget is not None:
+            return budget, "The time budget of the test case is zero."
+        return self._budgets.get("default"), \
+            "The default time budget of test cases is zero."
+
+    def _budget(self, name):
+        """Return the remaining time budget of a test case in seconds."""
+        budget, _ = self._case_budget(name)
+        total = self._budgets.get("total")
+        if total is not None:
+            remaining = max(total - (time() - self._start), 0.0)
+            budget = remaining if budget is None else min(budget, remaining)
+        return budget
+
+    def pytest_sessionstart(self):
+        """Start the clock for the total time budget."""
+        self._start = time()
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_call(self, item):
+        """Skip a test case without any remaining time budget."""
+        if self._budget(item.obj.__name__) == 0.0:
+            budget, reason = self._case_budget(item.obj.__name__)
+            pytest.skip(reason if budget == 0.0 else
+                        "The total time budget is exhausted.")
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_pyfunc_call(self, pyfuncitem):
+        """
+        Run a test case with a time budget in a supervised process.
+
+        A test case that exceeds its budget is stopped and fails with
+        whatever data it collected up to that point. The optimizations, CPU
+        time, and peak memory of the process are added to the item's
+        measurements. If a profiler was given, the process profiles the call
+        separately and its statistics are merged.
+
+        """
+        budget = self._budget(pyfuncitem.obj.__name__)
+        if budget is None or not SUPERVISED:
+            return None
+        func = pyfuncitem.obj
+        kwargs = dict((arg, pyfuncitem.funcargs[arg])
+                      for arg in pyfuncitem._fixtureinfo.argnames)
+        usage = None if self._monitor is None else self._monitor.usage
+        profiler = self._profiler
+        keys = ("solves", "solve_time", "copies")
+        profile = dict()
+
+        def counts():
+            return None if usage is None else dict(
+                (key, usage[key]) for key in keys)
+
+        def call():
+            if profiler is None:
+                return func(**kwargs)
+            with profiler.profile(pyfuncitem.nodeid + "::call") as \
+                    profile["functions"]:
+                return func(**kwargs)
+
+        def collect():
+            return getattr(func, "annotation", None), counts(), \
+                profile.get("functions")
+
+        before = counts()
+
+        finished, error, state, rusage = supervise(call, budget, collect)
+        if state is not None:
+            annotation, after, functions = state
+            if annotation is not None:
+                func.annotation.update(annotation)
+            # Add what the child measured in addition to the parent.
+            if after is not None:
+                for key in keys:
+                    usage[key] += after[key] - before[key]
+            if functions is not None:
+                profiler.merge(functions)
+        if usage is not None:
+            self._monitor.add_child(rusage)
+        if not finished:
+            self._timeouts.add(pyfuncitem.nodeid)
+            pytest.fail("The test exceeded its time budget of {:.1f} s."
+                        "".format(budget), pytrace=False)
+        if error is not None:
+            raise error
+        return True
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_runtest_logreport(self, report):
+        """Record the result "timeout" for test items that ran too long."""
+        if report.when != "call" or report.nodeid not in self._timeouts:
+            return
+        item_name, param = self._collector.split_name(report.location[2])
+        self._collector.record(item_name, param, "result", "timeout")
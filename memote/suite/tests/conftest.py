@@ -18,3 +18,27 @@
 """Configuration and fixtures for the test suite."""
 
 from __future__ import absolute_import
+
+import pytest
+
+import memote.support.annotation as annotation
+import memote.support.consistency as consistency
+
+
+@pytest.fixture(scope="session")
+def metabolite_annotation(read_only_model):
+    """Tabulate the metabolite annotation once for all annotation tests."""
+    return annotation.AnnotationMatrix(
+        read_only_model.metabolites, "metabolites")
+
+
+@pytest.fixture(scope="session")
+def reaction_annotation(read_only_model):
+    """Tabulate the reaction annotation once for all annotation tests."""
+    return annotation.AnnotationMatrix(read_only_model.reactions, "reactions")
+
+
+@pytest.fixture(scope="session")
+def connectivity_issues(read_only_model):
+    """Classify orphan, dead-end, and disconnected metabolites once."""
+    return consistency.find_metabolite_connectivity_issues(read_only_model)
@@ -28,12 +28,15 @@ import memote.support.annotation as annotation
 from memote.utils import annotate, truncate, get_ids, wrapper
 
 
-@annotate(title="Metabolites without Annotation", type="length")
-def test_metabolite_annotation_presence(read_only_model):
+@annotate(title="Metabolites without Annotation", type="length",
+          depends=["metabolites.annotation"])
+def test_metabolite_annotation_presence(read_only_model, incremental):
     """Expect all metabolites to have a non-empty annotation attribute."""
     ann = test_metabolite_annotation_presence.annotation
-    ann["data"] = get_ids(annotation.find_components_without_annotation(
-        read_only_model, "metabolites"))
+    ann["data"] = incremental.update(
+        "test_metabolite_annotation_presence", "metabolites",
+        lambda mets: get_ids(annotation.find_components_without_annotation(
+            read_only_model, "metabolites", mets)))
     ann["metric"] = len(ann["data"]) / len(read_only_model.metabolites)
     ann["message"] = wrapper.fill(
         """A total of {} metabolites ({:.2%}) lack any form of annotation:
@@ -41,12 +44,15 @@ def test_metabolite_annotation_presence(read_only_model):
     assert len(ann["data"]) == 0, ann["message"]
 
 
-@annotate(title="Reactions without Annotation", type="length")
-def test_reaction_annotation_presence(read_only_model):
+@annotate(title="Reactions without Annotation", type="length",
+          depends=["reactions.annotation"])
+def test_reaction_annotation_presence(read_only_model, incremental):
     """Expect all reactions to have a non-empty annotation attribute."""
     ann = test_reaction_annotation_presence.annotation
-    ann["data"] = get_ids(annotation.find_components_without_annotation(
-        read_only_model, "reactions"))
+    ann["data"] = incremental.update(
+        "test_reaction_annotation_presence", "reactions",
+        lambda rxns: get_ids(annotation.find_components_without_annotation(
+            read_only_model, "reactions", rxns)))
     ann["metric"] = len(ann["data"]) / len(read_only_model.reactions)
     ann["message"] = wrapper.fill(
         """A total of {} reactions ({:.2%}) lack any form of annotation:
@@ -56,16 +62,17 @@ def test_reaction_annotation_presence(read_only_model):
 
 @pytest.mark.parametrize("db", list(annotation.METABOLITE_ANNOTATIONS))
 @annotate(title="Missing Metabolite Annotations Per Database",
-          type="object", message=dict(), data=dict(), metric=dict())
-def test_metabolite_annotation_overview(read_only_model, db):
+          type="object", message=dict(), data=dict(), metric=dict(),
+          depends=["metabolites.annotation"])
+def test_metabolite_annotation_overview(read_only_model, metabolite_annotation,
+                                        db):
     """
     Expect all metabolites to have annotations from common databases.
 
     The required databases are outlined in `annotation.py`.
     """
     ann = test_metabolite_annotation_overview.annotation
-    ann["data"][db] = get_ids(annotation.generate_component_annotation_overview(
-        read_only_model.metabolites, db))
+    ann["data"][db] = get_ids(metabolite_annotation.missing(db))
     # TODO: metric must also be a dict in this case.
     ann["metric"][db] = len(ann["data"][db]) / len(read_only_model.metabolites)
     ann["message"][db] = wrapper.fill(
@@ -77,16 +84,17 @@ def test_metabolite_annotation_overview(read_only_model, db):
 
 @pytest.mark.parametrize("db", list(annotation.REACTION_ANNOTATIONS))
 @annotate(title="Missing Reaction Annotations Per Database",
-          type="object", message=dict(), data=dict(), metric=dict())
-def test_reaction_annotation_overview(read_only_model, db):
+          type="object", message=dict(), data=dict(), metric=dict(),
+          depends=["reactions.annotation"])
+def test_reaction_annotation_overview(read_only_model, reaction_annotation,
+                                      db):
     """
     Expect all reactions to have annotations from common databases.
 
     The required databases are outlined in `annotation.py`.
     """
     ann = test_reaction_annotation_overview.annotation
-    ann["data"][db] = get_ids(annotation.generate_component_annotation_overview(
-        read_only_model.reactions, db))
+    ann["data"][db] = get_ids(reaction_annotation.missing(db))
     ann["metric"][db] = len(ann["data"][db]) / len(read_only_model.reactions)
     ann["message"][db] = wrapper.fill(
         """The following {} reactions ({:.2%}) lack annotation for {}:
@@ -97,17 +105,17 @@ def test_reaction_annotation_overview(read_only_model, db):
 
 @pytest.mark.parametrize("db", list(annotation.METABOLITE_ANNOTATIONS))
 @annotate(title="Wrong Metabolite Annotations Per Database",
-          type="object", message=dict(), data=dict(), metric=dict())
-def test_metabolite_annotation_wrong_ids(read_only_model, db):
+          type="object", message=dict(), data=dict(), metric=dict(),
+          depends=["metabolites.annotation"])
+def test_metabolite_annotation_wrong_ids(read_only_model,
+                                         metabolite_annotation, db):
     """
     Expect all annotations of metabolites to be in the correct format.
 
     The required formats, i.e., regex patterns are outlined in `annotation.py`.
     """
     ann = test_metabolite_annotation_wrong_ids.annotation
-    ann["data"][db] = get_ids(
-        annotation.generate_component_annotation_miriam_match(
-            read_only_model.metabolites, "metabolites", db))
+    ann["data"][db] = get_ids(metabolite_annotation.faulty(db))
     ann["metric"][db] = len(ann["data"][db]) / len(read_only_model.metabolites)
     ann["message"][db] = wrapper.fill(
         """The provided metabolite annotations for the {} database do not match
@@ -120,17 +128,17 @@ def test_metabolite_annotation_wrong_ids(read_only_model, db):
 
 @pytest.mark.parametrize("db", annotation.REACTION_ANNOTATIONS)
 @annotate(title="Wrong Reaction Annotations Per Database",
-          type="object", message=dict(), data=dict(), metric=dict())
-def test_reaction_annotation_wrong_ids(read_only_model, db):
+          type="object", message=dict(), data=dict(), metric=dict(),
+          depends=["reactions.annotation"])
+def test_reaction_annotation_wrong_ids(read_only_model, reaction_annotation,
+                                       db):
     """
     Expect all annotations of reactions to be in the correct format.
 
     The required formats, i.e., regex patterns are outlined in `annotation.py`.
     """
     ann = test_reaction_annotation_wrong_ids.annotation
-    ann["data"][db] = get_ids(
-        annotation.generate_component_annotation_miriam_match(
-            read_only_model.reactions, "reactions", db))
+    ann["data"][db] = get_ids(reaction_annotation.faulty(db))
     ann["metric"][db] = len(ann["data"][db]) / len(read_only_model.reactions)
     ann["message"][db] = wrapper.fill(
         """The provided reaction annotations for the {} database do not match
@@ -141,7 +149,8 @@ def test_reaction_annotation_wrong_ids(read_only_model, db):
     assert len(ann["data"][db]) == 0, ann["message"][db]
 
 
-@annotate(title="Uniform Metabolite Identifier Namespace", type="length")
+@annotate(title="Uniform Metabolite Identifier Namespace", type="length",
+          depends=["metabolites"])
 def test_metabolite_id_namespace_consistency(read_only_model):
     """Expect metabolite identifiers to be from the same namespace."""
     ann = test_metabolite_id_namespace_consistency.annotation
@@ -165,7 +174,8 @@ def test_metabolite_id_namespace_consistency(read_only_model):
     assert len(ann["data"]) == 0, ann["message"]
 
 
-@annotate(title="Uniform Metabolite Identifier Namespace", type="length")
+@annotate(title="Uniform Metabolite Identifier Namespace", type="length",
+          depends=["reactions"])
 def test_reaction_id_namespace_consistency(read_only_model):
     """Expect reaction identifiers to be from the same namespace."""
     ann = test_reaction_id_namespace_consistency.annotation
@@ -33,7 +33,8 @@ def test_model_id_presence(read_only_model):
     assert bool(read_only_model.id)
 
 
-@annotate(title="Total Number of Genes", type="length")
+@annotate(title="Total Number of Genes", type="length",
+          depends=["genes"])
 def test_genes_presence(read_only_model):
     """Expect that >= 1 genes are defined in the model."""
     ann = test_genes_presence.annotation
@@ -44,7 +45,8 @@ def test_genes_presence(read_only_model):
     assert len(ann["data"]) >= 1, ann["message"]
 
 
-@annotate(title="Total Number of Reactions", type="length")
+@annotate(title="Total Number of Reactions", type="length",
+          depends=["reactions"])
 def test_reactions_presence(read_only_model):
     """Expect that >= 1 reactions are present in the model."""
     ann = test_reactions_presence.annotation
@@ -55,7 +57,8 @@ def test_reactions_presence(read_only_model):
     assert len(ann["data"]) >= 1, ann["message"]
 
 
-@annotate(title="Total Number of Metabolites", type="length")
+@annotate(title="Total Number of Metabolites", type="length",
+          depends=["metabolites"])
 def test_metabolites_presence(read_only_model):
     """Expect that >= 1 metabolites are present in the model."""
     ann = test_metabolites_presence.annotation
@@ -66,7 +69,9 @@ def test_metabolites_presence(read_only_model):
     assert len(ann["data"]) >= 1, ann["message"]
 
 
-@annotate(title="Total Number of Transport Reactions", type="length")
+@annotate(title="Total Number of Transport Reactions", type="length",
+          depends=["reactions.stoichiometry", "metabolites.formula",
+                   "metabolites.compartment", "reactions.annotation"])
 def test_transport_reaction_presence(read_only_model):
     """Expect >= 1 transport reactions are present in the model."""
     ann = test_transport_reaction_presence.annotation
@@ -77,7 +82,8 @@ def test_transport_reaction_presence(read_only_model):
     assert len(ann["data"]) >= 1, ann["message"]
 
 
-@annotate(title="Metabolites without Formula", type="length")
+@annotate(title="Metabolites without Formula", type="length",
+          depends=["metabolites.formula"])
 def test_metabolites_formula_presence(read_only_model):
     """
     Expect all metabolites to have a formula.
@@ -96,7 +102,8 @@ def test_metabolites_formula_presence(read_only_model):
     assert len(ann["data"]) == 0, ann["message"]
 
 
-@annotate(title="Metabolites without Charge", type="length")
+@annotate(title="Metabolites without Charge", type="length",
+          depends=["metabolites.charge"])
 def test_metabolites_charge_presence(read_only_model):
     """
     Expect all metabolites to have charge information.
@@ -115,7 +122,9 @@ def test_metabolites_charge_presence(read_only_model):
     assert len(ann["data"]) == 0, ann["message"]
 
 
-@annotate(title="Reactions without GPR", type="length")
+@annotate(title="Reactions without GPR", type="length",
+          depends=["reactions.gpr", "reactions.stoichiometry",
+                   "metabolites.compartment", "reactions.annotation"])
 def test_gene_protein_reaction_rule_presence(read_only_model):
     """
     Expect all non-exchange reactions to have a GPR rule.
@@ -139,7 +148,8 @@ def test_gene_protein_reaction_rule_presence(read_only_model):
     assert len(ann["data"]) == 0, ann["message"]
 
 
-@annotate(title="Non-Growth Associated Maintenance Reaction", type="length")
+@annotate(title="Non-Growth Associated Maintenance Reaction", type="length",
+          depends=["reactions.stoichiometry", "reactions.bounds"])
 def test_ngam_presence(read_only_model):
     """
     Expect a single non growth-associated maintenance reaction.
@@ -157,7 +167,8 @@ def test_ngam_presence(read_only_model):
     assert len(ann["data"]) == 1, ann["message"]
 
 
-@annotate(title="Metabolic Coverage", type="number")
+@annotate(title="Metabolic Coverage", type="number",
+          depends=["reactions", "genes"])
 def test_metabolic_coverage(read_only_model):
     """
     Expect a model to have a metabolic coverage >= 1.
@@ -177,7 +188,8 @@ def test_metabolic_coverage(read_only_model):
     assert ann["metric"] >= 1, ann["message"]
 
 
-@annotate(title="Total Number of Compartments", type="length")
+@annotate(title="Total Number of Compartments", type="length",
+          depends=["metabolites.compartment"])
 def test_compartments_presence(read_only_model):
     """Expect that >= 3 compartments are defined in the model."""
     ann = test_compartments_presence.annotation
@@ -189,7 +201,8 @@ def test_compartments_presence(read_only_model):
     assert len(ann["data"]) >= 3, ann["message"]
 
 
-@annotate(title="Number of Enzyme Complexes", type="length")
+@annotate(title="Number of Enzyme Complexes", type="length",
+          depends=["reactions.gpr"])
 def test_enzyme_complex_presence(read_only_model):
     """Expect that >= 1 enzyme complexes are present in the model."""
     ann = test_enzyme_complex_presence.annotation
@@ -200,7 +213,9 @@ def test_enzyme_complex_presence(read_only_model):
     assert len(ann["data"]) >= 1, ann["message"]
 
 
-@annotate(title="Number of Purely Metabolic Reactions", type="length")
+@annotate(title="Number of Purely Metabolic Reactions", type="length",
+          depends=["reactions.stoichiometry", "metabolites.formula",
+                   "metabolites.compartment", "reactions.annotation"])
 def test_find_pure_metabolic_reactions(read_only_model):
     """Expect >= 1 pure metabolic reactions are present in the model."""
     ann = test_find_pure_metabolic_reactions.annotation
@@ -214,7 +229,9 @@ def test_find_pure_metabolic_reactions(read_only_model):
     assert len(ann["data"]) >= 1, ann["message"]
 
 
-@annotate(title="Number of Transport Reactions", type="length")
+@annotate(title="Number of Transport Reactions", type="length",
+          depends=["reactions.stoichiometry", "metabolites.formula",
+                   "metabolites.compartment", "reactions.annotation"])
 def test_find_transport_reactions(read_only_model):
     """Expect >= 1 transport reactions are present in the read_only_model."""
     ann = test_find_transport_reactions.annotation
@@ -228,7 +245,8 @@ def test_find_transport_reactions(read_only_model):
     assert len(ann["data"]) >= 1, ann["message"]
 
 
-@annotate(title="Number of Unique Metabolites", type="length")
+@annotate(title="Number of Unique Metabolites", type="length",
+          depends=["metabolites"])
 def test_find_unique_metabolites(read_only_model):
     """Expect there to be less metabolites when removing compartment tag."""
     ann = test_find_unique_metabolites.annotation
@@ -39,7 +39,8 @@ LOGGER = logging.getLogger(__name__)
 BIOMASS_IDS = pytest.memote.biomass_ids
 
 
-@annotate(title="Presence of a Biomass Reaction", type="array")
+@annotate(title="Presence of a Biomass Reaction", type="array",
+          depends=["reactions"])
 def test_biomass_presence():
     """
     Expect the model to contain at least one biomass reaction.
@@ -60,7 +61,8 @@ def test_biomass_presence():
 
 @pytest.mark.parametrize("reaction_id", BIOMASS_IDS)
 @annotate(title="Biomass Consistency", type="object", data=dict(),
-          message=dict())
+          message=dict(),
+          depends=["reactions.stoichiometry", "metabolites.formula"])
 def test_biomass_consistency(read_only_model, reaction_id):
     """Expect biomass components to sum up to 1 g[CDW]."""
     ann = test_biomass_consistency.annotation
@@ -76,7 +78,8 @@ def test_biomass_consistency(read_only_model, reaction_id):
 
 @pytest.mark.parametrize("reaction_id", BIOMASS_IDS)
 @annotate(title="Biomass Production At Default State", type="object",
-          data=dict(), message=dict())
+          data=dict(), message=dict(),
+          depends=["reactions.stoichiometry", "reactions.bounds"], solver=True)
 def test_biomass_default_production(model, reaction_id):
     """Expect biomass production in default medium."""
     ann = test_biomass_default_production.annotation
@@ -90,7 +93,8 @@ def test_biomass_default_production(model, reaction_id):
 
 @pytest.mark.parametrize("reaction_id", BIOMASS_IDS)
 @annotate(title="Blocked Biomass Precursors At Default State", type="object",
-          data=dict(), message=dict())
+          data=dict(), message=dict(),
+          depends=["reactions.stoichiometry", "reactions.bounds"], solver=True)
 def test_biomass_precursors_default_production(read_only_model, reaction_id):
     """Expect production of all biomass precursors in default medium."""
     ann = test_biomass_precursors_default_production.annotation
@@ -108,7 +112,10 @@ def test_biomass_precursors_default_production(read_only_model, reaction_id):
 
 @pytest.mark.parametrize("reaction_id", BIOMASS_IDS)
 @annotate(title="Blocked Biomass Precursors In Complete Medium", type="object",
-          data=dict(), message=dict())
+          data=dict(), message=dict(),
+          depends=["reactions.stoichiometry", "reactions.bounds",
+                   "metabolites.compartment", "reactions.annotation"],
+          solver=True)
 def test_biomass_precursors_open_production(model, reaction_id):
     """Expect precursor production in complete medium."""
     ann = test_biomass_precursors_open_production.annotation
@@ -129,7 +136,8 @@ def test_biomass_precursors_open_production(model, reaction_id):
 
 @pytest.mark.parametrize("reaction_id", BIOMASS_IDS)
 @annotate(title="Growth-associated Maintenance in Biomass Reaction",
-          type="object", data=dict(), message=dict())
+          type="object", data=dict(), message=dict(),
+          depends=["reactions.stoichiometry"])
 def test_gam_in_biomass(model, reaction_id):
     """Expect the biomass reactions to contain atp and adp."""
     ann = test_gam_in_biomass.annotation
@@ -143,7 +151,8 @@ def test_gam_in_biomass(model, reaction_id):
 
 @pytest.mark.parametrize("reaction_id", BIOMASS_IDS)
 @annotate(title="Unrealistic Growth Rate In Default Condition", type='object',
-          data=dict(), message=dict())
+          data=dict(), message=dict(),
+          depends=["reactions.stoichiometry", "reactions.bounds"], solver=True)
 def test_fast_growth_default(model, reaction_id):
     """Expect the predicted growth rate for each BOF to be below 10.3972.
 
@@ -25,7 +25,18 @@ import memote.support.consistency as consistency
 from memote.utils import annotate, truncate, get_ids, wrapper
 
 
-@annotate(title="Stoichiometric Consistency", type="length")
+def _describe_imbalance(rxn_id, imbalance):
+    """Write a reaction identifier with its imbalanced elements."""
+    if imbalance is None:
+        return "{} (unknown formula)".format(rxn_id)
+    return "{} ({})".format(rxn_id, ", ".join(
+        "{}: {:g}".format(element, amount)
+        for element, amount in sorted(imbalance.items())))
+
+
+@annotate(title="Stoichiometric Consistency", type="length",
+          depends=["reactions.stoichiometry", "metabolites.compartment",
+                   "reactions.annotation"], solver=True)
 def test_stoichiometric_consistency(read_only_model):
     """
     Expect that the stoichiometry is mass-balanced.
@@ -51,7 +62,10 @@ def test_stoichiometric_consistency(read_only_model):
 
 @pytest.mark.parametrize("met", [x for x in consistency.ENERGY_COUPLES])
 @annotate(title="Erroneous Energy-generating Cycles", type="object",
-          data=dict(), message=dict())
+          data=dict(), message=dict(),
+          depends=["metabolites", "reactions.stoichiometry",
+                   "reactions.bounds", "metabolites.compartment",
+                   "reactions.annotation"], solver=True)
 def test_detect_energy_generating_cycles(read_only_model, met):
     """Expect that no energy metabolite can be produced out of nothing."""
     ann = test_detect_energy_generating_cycles.annotation
@@ -69,12 +83,16 @@ def test_detect_energy_generating_cycles(read_only_model, met):
     assert len(ann["data"][met]) == 0, ann["message"][met]
 
 
-@annotate(title="Number of Charge-Imbalanced Reactions", type="length")
-def test_reaction_charge_balance(read_only_model):
+@annotate(title="Number of Charge-Imbalanced Reactions", type="length",
+          depends=["reactions.stoichiometry", "metabolites.charge",
+                   "metabolites.compartment", "reactions.annotation"])
+def test_reaction_charge_balance(read_only_model, incremental):
     """Expect all reactions to be charge balanced."""
     ann = test_reaction_charge_balance.annotation
-    ann["data"] = get_ids(
-        consistency.find_charge_imbalanced_reactions(read_only_model))
+    ann["data"] = incremental.update(
+        "test_reaction_charge_balance", "reactions",
+        lambda rxns: get_ids(consistency.find_charge_imbalanced_reactions(
+            read_only_model, rxns)))
     ann["metric"] = len(ann["data"]) / len(read_only_model.reactions)
     ann["message"] = wrapper.fill(
         """A total of {} ({:.2%}) reactions are charge imbalanced with at least
@@ -84,23 +102,35 @@ def test_reaction_charge_balance(read_only_model):
     assert len(ann["data"]) == 0, ann["message"]
 
 
-@annotate(title="Number of Mass-Unbalanced Reactions", type="length")
-def test_reaction_mass_balance(read_only_model):
+@annotate(title="Number of Mass-Unbalanced Reactions", type="length",
+          depends=["reactions.stoichiometry", "metabolites.formula",
+                   "metabolites.compartment", "reactions.annotation"])
+def test_reaction_mass_balance(read_only_model, incremental):
     """Expect all reactions to be mass balanced."""
     ann = test_reaction_mass_balance.annotation
-    ann["data"] = get_ids(
-        consistency.find_mass_imbalanced_reactions(read_only_model)
-    )
+    ann["data"] = incremental.update(
+        "test_reaction_mass_balance", "reactions",
+        lambda rxns: get_ids(consistency.find_mass_imbalanced_reactions(
+            read_only_model, rxns)))
+    # The net amount of each element that the imbalanced reactions produce.
+    ann["imbalance"] = consistency.find_element_imbalances(
+        read_only_model,
+        [read_only_model.reactions.get_by_id(i) for i in ann["data"]])
     ann["metric"] = len(ann["data"]) / len(read_only_model.reactions)
     ann["message"] = wrapper.fill(
         """A total of {} ({:.2%}) reactions are mass imbalanced with at least
         one of the metabolites not having a formula or the overall mass not
         equal to 0: {}""".format(
-            len(ann["data"]), ann["metric"], truncate(ann["data"])))
+            len(ann["data"]), ann["metric"], truncate(
+                [_describe_imbalance(rxn_id, ann["imbalance"][rxn_id])
+                 for rxn_id in ann["data"]])))
     assert len(ann["data"]) == 0, ann["message"]
 
 
-@annotate(title="Number of Blocked Reactions", type="length")
+@annotate(title="Number of Blocked Reactions", type="length",
+          depends=["reactions.stoichiometry", "reactions.bounds",
+                   "metabolites.compartment", "reactions.annotation"],
+          solver=True)
 def test_blocked_reactions(read_only_model):
     """
     Expect all reactions to be able to carry flux.
@@ -120,7 +150,9 @@ def test_blocked_reactions(read_only_model):
     assert len(ann["data"]) == 0, ann["message"]
 
 
-@annotate(title="Stoichiometrically Balanced Cycles", type="length")
+@annotate(title="Stoichiometrically Balanced Cycles", type="length",
+          depends=["reactions.stoichiometry", "reactions.bounds",
+                   "metabolites.compartment"], solver=True)
 def test_find_stoichiometrically_balanced_cycles(read_only_model):
     """
     Expect no stoichiometrically balanced loops to be present.
@@ -143,11 +175,13 @@ def test_find_stoichiometrically_balanced_cycles(read_only_model):
     assert len(ann["data"]) == 0, ann["message"]
 
 
-@annotate(title="Number of Orphan Metabolites", type="length")
-def test_find_orphans(read_only_model):
+@annotate(title="Number of Orphan Metabolites", type="length",
+          depends=["metabolites", "reactions.stoichiometry",
+                   "reactions.bounds"])
+def test_find_orphans(read_only_model, connectivity_issues):
     """Expect no orphans to be present."""
     ann = test_find_orphans.annotation
-    ann["data"] = get_ids(consistency.find_orphans(read_only_model))
+    ann["data"] = get_ids(connectivity_issues["orphans"])
     ann["metric"] = len(ann["data"]) / len(read_only_model.metabolites)
     ann["message"] = wrapper.fill(
         """A total of {} ({:.2%}) metabolites are not produced by any reaction
@@ -156,11 +190,13 @@ def test_find_orphans(read_only_model):
     assert len(ann["data"]) == 0, ann["message"]
 
 
-@annotate(title="Number of Dead-end Metabolites", type="length")
-def test_find_deadends(read_only_model):
+@annotate(title="Number of Dead-end Metabolites", type="length",
+          depends=["metabolites", "reactions.stoichiometry",
+                   "reactions.bounds"])
+def test_find_deadends(read_only_model, connectivity_issues):
     """Expect no deadends to be present."""
     ann = test_find_deadends.annotation
-    ann["data"] = get_ids(consistency.find_deadends(read_only_model))
+    ann["data"] = get_ids(connectivity_issues["deadends"])
     ann["metric"] = len(ann["data"]) / len(read_only_model.metabolites)
     ann["message"] = wrapper.fill(
         """A total of {} ({:.2%}) metabolites are not consumed by any reaction
@@ -169,11 +205,13 @@ def test_find_deadends(read_only_model):
     assert ann["data"] == 0, ann["message"]
 
 
-@annotate(title="Number of Disconnected Metabolites", type="length")
-def test_find_disconnected(read_only_model):
+@annotate(title="Number of Disconnected Metabolites", type="length",
+          depends=["metabolites", "reactions.stoichiometry",
+                   "reactions.bounds"])
+def test_find_disconnected(read_only_model, connectivity_issues):
     """Expect no disconnected metabolites to be present."""
     ann = test_find_disconnected.annotation
-    ann["data"] = get_ids(consistency.find_disconnected(read_only_model))
+    ann["data"] = get_ids(connectivity_issues["disconnected"])
     ann["metric"] = len(ann["data"]) / len(read_only_model.metabolites)
     ann["message"] = wrapper.fill(
         """A total of {} ({:.2%}) metabolites are not associated with any
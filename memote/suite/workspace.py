@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Share one solver instance between the test units of a session."""
+
+from __future__ import absolute_import
+
+import logging
+from builtins import dict
+from contextlib import contextmanager
+from time import time
+
+import pytest
+
+__all__ = ("LPWorkspace", "LPWorkspacePlugin")
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _solver_state(model):
+    """
+    Return the state of a model's solver that a ``with model:`` context keeps.
+
+    The state consists of the names and bounds of all variables and
+    constraints, the objective, and the solver configuration.
+
+    """
+    solver = model.solver
+    config = solver.configuration
+    return (
+        [(var.name, var.lb, var.ub, var.type) for var in solver.variables],
+        [(con.name, con.lb, con.ub) for con in solver.constraints],
+        str(solver.objective.expression),
+        solver.objective.direction,
+        config.__getstate__() if hasattr(config, "__getstate__") else None
+    )
+
+
+class LPWorkspace(object):
+    """
+    Keep one modifiable copy of the model and its solver alive.
+
+    Instead of copying the model for every test unit, which creates a new
+    solver instance each time, all test units modify the same copy within a
+    ``with model:`` context. cobrapy records every change in the context's
+    history and reverts the changes when the unit ends. Since the solver
+    instance persists, GLPK, CPLEX, and Gurobi start each optimization from
+    the basis of the previous one.
+
+    Changes made directly to the solver, for example, to its variables,
+    constraints, or configuration, escape the context. The workspace detects
+    them after each unit and replaces the model by a new copy.
+
+    Attributes
+    ----------
+    model : cobra.Model
+        The shared copy of the model.
+    copy_time : float
+        The time in seconds that it took to copy the model once.
+    units : int
+        The number of test units that used the workspace.
+    solves : int
+        The total number of optimizations.
+    solve_time : float
+        The total time in seconds spent in the solver.
+    copies : int
+        The number of times the model was copied.
+
+    """
+
+    def __init__(self, model, **kwargs):
+        """
+        Copy the model once.
+
+        Parameters
+        ----------
+        model : cobra.Model
+            The metabolic model under investigation.
+
+        """
+        super(LPWorkspace, self).__init__(**kwargs)
+        self._original = model
+        self.units = 0
+        self.solves = 0
+        self.solve_time = 0.0
+        self.copies = 0
+        start = time()
+        self._copy()
+        self.copy_time = time() - start
+
+    def _copy(self):
+        """Replace the shared model by a new copy of the original."""
+        self.model = self._original.copy()
+        self._state = _solver_state(self.model)
+        self.copies += 1
+
+    @contextmanager
+    def track(self, name=None):
+        """
+        Provide the model to a test unit and revert its changes afterwards.
+
+        Parameters
+        ----------
+        name : str, optional
+            The name of the test unit used in the warning about changes that
+            could not be reverted.
+
+        """
+        try:
+            with self.model:
+                yield self.model
+        finally:
+            self.units += 1
+            if _solver_state(self.model) != self._state:
+                LOGGER.warning(
+                    "The test unit '%s' changed the solver in a way that "
+                    "could not be reverted. Copying the model again.", name)
+                self._copy()
+
+    def record(self, usage):
+        """
+        Add the optimizations of a test unit to the totals.
+
+        Parameters
+        ----------
+        usage : dict
+            The resources of the test unit as measured by a
+            ``memote.suite.monitor.ResourceMonitor``.
+
+        """
+        self.solves += usage["solves"]
+        self.solve_time += usage["solve_time"]
+
+    @property
+    def summary(self):
+        """
+        Return statistics on the use of the workspace.
+
+        The time saved is estimated as the time of the model copies that
+        were avoided.
+
+        """
+        return {
+            "units": self.units,
+            "solves": self.solves,
+            "solve_time": self.solve_time,
+            "copies": self.copies,
+            "copy_time": self.copy_time,
+            "time_saved": max(self.units - self.copies, 0) * self.copy_time
+        }
+
+
+class LPWorkspacePlugin(object):
+    """
+    Provide the test units of a session with a shared LP workspace.
+
+    The plugin's ``model`` fixture replaces the one of the
+    ``ResultCollectionPlugin``, which copies the model for every unit, and
+    the summary of the workspace is stored as "lp_workspace" in the meta
+    information of the results.
+
+    """
+
+    def __init__(self, collector, **kwargs):
+        """
+        Share one model and solver between the test units.
+
+        Parameters
+        ----------
+        collector : memote.suite.collect.ResultCollectionPlugin
+            Receives the summary of the workspace.
+
+        """
+        super(LPWorkspacePlugin, self).__init__(**kwargs)
+        self._collector = collector
+        self._workspace = None
+        self._workspaces = list()
+
+    @pytest.fixture(scope="session")
+    def lp_workspace(self, read_only_model):
+        """Provide one modifiable model and solver for the session."""
+        if self._workspace is None:
+            self._workspace = LPWorkspace(read_only_model)
+        return self._workspace
+
+    @pytest.fixture(scope="function")
+    def model(self, request, lp_workspace):
+        """
+        Provide a pristine model for a test unit.
+
+        All changes to the model are reverted after the test unit.
+
+        """
+        with lp_workspace.track(request.node.nodeid) as model:
+            yield model
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_memote_measured(self, item, usage):
+        """Add the optimizations of units that used the workspace."""
+        if self._workspace is not None and \
+                "model" in getattr(item, "fixturenames", ()):
+            self._workspace.record(usage)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_memote_worker_state(self, names):
+        """Hand over the summary of a worker's workspace."""
+        return {"workspace": None if self._workspace is None else
+                self._workspace.summary}
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_memote_worker_merge(self, state):
+        """Keep the summary of a worker's workspace."""
+        if state["workspace"] is not None:
+            self._workspaces.append(state["workspace"])
+
+    def pytest_sessionfinish(self):
+        """Store the summary of the workspace in the results."""
+        if self._workspace is not None:
+            self._collector.meta["lp_workspace"] = self._workspace.summary
+        elif len(self._workspaces) > 0:
+            # Every worker used its own workspace.
+            self._collector.meta["lp_workspace"] = dict(
+                (key, sum(summary[key] for summary in self._workspaces))
+                for key in self._workspaces[0])
@@ -23,7 +23,11 @@ import logging
 import re
 from future.utils import native_str
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from six import iteritems
 
 from collections import OrderedDict
 
@@ -82,7 +86,7 @@ METABOLITE_ANNOTATIONS = OrderedDict([
 ])
 
 
-def find_components_without_annotation(model, components):
+def find_components_without_annotation(model, components, elements=None):
     """
     Find model components with empty annotation attributes.
 
@@ -92,6 +96,8 @@ def find_components_without_annotation(model, components):
         A cobrapy metabolic model.
     components : {"metabolites", "reactions", "genes"}
         A string denoting `cobra.Model` components.
+    elements : iterable, optional
+        Only examine these components of the model.
 
     Returns
     -------
@@ -99,7 +105,9 @@ def find_components_without_annotation(model, components):
         The components without any annotation.
 
     """
-    return [elem for elem in getattr(model, components) if
+    if elements is None:
+        elements = getattr(model, components)
+    return [elem for elem in elements if
             elem.annotation is None or len(elem.annotation) == 0]
 
 
@@ -165,6 +173,229 @@ def generate_component_annotation_miriam_match(elements, component, db):
             if is_faulty(elem.annotation, db, pattern)]
 
 
+#: Whether Arrow's RE2 engine accepts a pattern, by pattern string.
+_RE2_ACCEPTS = dict()
+
+
+def _match_all(values, pattern):
+    """
+    Match many identifiers at once like ``pattern.match`` would.
+
+    The pattern is evaluated by Arrow's vectorized RE2 engine. Patterns using
+    Python-only constructs, such as look-behind assertions, and values that
+    are not strings are evaluated with ``pandas.Series.str.match`` instead.
+    RE2 treats ``\\d``, ``\\w``, and ``$`` differently for non-ASCII
+    characters and a trailing newline, therefore, such values are matched by
+    Python's ``re`` individually.
+
+    """
+    array = None
+    if _RE2_ACCEPTS.get(pattern.pattern, True):
+        try:
+            array = pa.array(values, type=pa.string())
+        except pa.ArrowException:
+            LOGGER.debug("Matching values that are not strings in Python.")
+    if array is not None:
+        try:
+            result = pc.match_substring_regex(
+                array, "^(?:{})".format(pattern.pattern))
+        except pa.ArrowException:
+            LOGGER.debug("RE2 does not support the pattern '%s'.",
+                         pattern.pattern)
+            _RE2_ACCEPTS[pattern.pattern] = False
+        else:
+            result = result.fill_null(False).to_numpy(zero_copy_only=False)
+            regular = pc.and_(
+                pc.string_is_ascii(array),
+                pc.invert(pc.match_substring(array, "\n"))).fill_null(True)
+            for i in np.flatnonzero(~regular.to_numpy(zero_copy_only=False)):
+                result[i] = pattern.match(values[i]) is not None
+            return result
+    return pd.Series(values, dtype=object).str.match(
+        pattern.pattern, na=False).values.astype(bool)
+
+
+class AnnotationMatrix(object):
+    """
+    Tabulate the annotation of all components of one type at once.
+
+    The annotation of every component is visited a single time to record
+    whether it contains an entry for each of the MIRIAM databases (presence)
+    and whether all of the identifiers given for that database match its
+    pattern (validity). Each pattern is evaluated once on all identifiers of
+    its database. Both tables are Boolean with the components as rows and the
+    databases as columns such that per-database results are simple slices.
+
+    Attributes
+    ----------
+    elements : list
+        The tabulated components.
+    presence : pandas.DataFrame
+        Whether a component is annotated with a database.
+    validity : pandas.DataFrame
+        Whether a component is annotated with a database and all identifiers
+        match the database's pattern.
+
+    """
+
+    def __init__(self, elements, component, **kwargs):
+        """
+        Build the presence and validity tables.
+
+        Parameters
+        ----------
+        elements : list
+            Elements of a model, either metabolites or reactions.
+        component : {"metabolites", "reactions"}
+            A string denoting a type of ``cobra.Model`` component.
+
+        """
+        super(AnnotationMatrix, self).__init__(**kwargs)
+        patterns = {
+            "metabolites": METABOLITE_ANNOTATIONS,
+            "reactions": REACTION_ANNOTATIONS
+        }[component]
+        self.elements = list(elements)
+        databases = list(patterns)
+        column = dict((db, j) for j, db in enumerate(databases))
+        presence = np.zeros((len(self.elements), len(databases)), dtype=bool)
+        # For each database the element positions and identifiers.
+        table = dict((db, (list(), list())) for db in databases)
+        for i, elem in enumerate(self.elements):
+            for db, ids in iteritems(elem.annotation):
+                # Ignore annotation for other databases.
+                if db not in column:
+                    continue
+                presence[i, column[db]] = True
+                positions, values = table[db]
+                if isinstance(ids, native_str):
+                    positions.append(i)
+                    values.append(ids)
+                else:
+                    positions.extend(i for _ in ids)
+                    values.extend(ids)
+        validity = presence.copy()
+        for db, (positions, values) in iteritems(table):
+            if len(values) == 0:
+                continue
+            faulty = np.asarray(positions)[~_match_all(values, patterns[db])]
+            validity[faulty, column[db]] = False
+        index = [elem.id for elem in self.elements]
+        self.presence = pd.DataFrame(presence, index=index, columns=databases)
+        self.validity = pd.DataFrame(validity, index=index, columns=databases)
+
+    def _select(self, mask):
+        """Return the elements selected by a Boolean array."""
+        return [self.elements[i] for i in np.flatnonzero(mask)]
+
+    def missing(self, db):
+        """
+        Return the components that lack annotation for a database.
+
+        The result is identical to ``generate_component_annotation_overview``.
+
+        """
+        return self._select(~self.presence[db].values)
+
+    def faulty(self, db):
+        """
+        Return the components whose annotation does not match a database.
+
+        Components without annotation for the database are ignored. The
+        result is identical to ``generate_component_annotation_miriam_match``.
+
+        """
+        return self._select(self.presence[db].values &
+                            ~self.validity[db].values)
+
+
+def generate_component_annotation_miriam_match_overview(elements, component):
+    """
+    Tabulate all elements whose annotation does not match MIRIAM patterns.
+
+    In contrast to ``generate_component_annotation_miriam_match`` which checks
+    a single database, all annotation values are first flattened into one
+    string array per database keyed by element. Each MIRIAM pattern is then
+    evaluated once on all values of its database.
+
+    Parameters
+    ----------
+    elements : list
+        Elements of a model, either metabolites or reactions.
+    component : {"metabolites", "reactions"}
+        A string denoting a type of ``cobra.Model`` component.
+
+    Returns
+    -------
+    collections.OrderedDict
+        A mapping of each MIRIAM database identifier to the list of components
+        whose annotation does not match the pattern for that database.
+
+    """
+    matrix = AnnotationMatrix(elements, component)
+    return OrderedDict((db, matrix.faulty(db)) for db in matrix.presence)
+
+
+class NamespaceMatcher(object):
+    """
+    Match identifiers against several MIRIAM namespace patterns at once.
+
+    Every pattern is evaluated once on all identifiers. The ``biocyc``
+    patterns match very broadly. An identifier that also matches any other
+    pattern is therefore assumed to be a false positive for ``biocyc``, which
+    is resolved directly in the resulting table.
+
+    """
+
+    def __init__(self, patterns, **kwargs):
+        """
+        Prepare a matcher.
+
+        Parameters
+        ----------
+        patterns : collections.OrderedDict
+            A mapping of MIRIAM database identifiers to compiled regular
+            expressions.
+
+        """
+        super(NamespaceMatcher, self).__init__(**kwargs)
+        self.databases = list(patterns)
+        self._patterns = list(patterns.values())
+        try:
+            self._biocyc = self.databases.index("biocyc")
+        except ValueError:
+            self._biocyc = None
+
+    def match(self, identifiers):
+        """
+        Tabulate which namespace patterns the identifiers match.
+
+        Parameters
+        ----------
+        identifiers : list
+            The strings to classify.
+
+        Returns
+        -------
+        numpy.ndarray
+            A Boolean table with one row per identifier and one column per
+            database.
+
+        """
+        identifiers = list(identifiers)
+        result = np.zeros((len(identifiers), len(self.databases)), dtype=bool)
+        for j, pattern in enumerate(self._patterns):
+            result[:, j] = _match_all(identifiers, pattern)
+        if self._biocyc is not None:
+            others = np.delete(result, self._biocyc, axis=1).any(axis=1)
+            result[:, self._biocyc] &= ~others
+        return result
+
+
+METABOLITE_NAMESPACES = NamespaceMatcher(METABOLITE_ANNOTATIONS)
+REACTION_NAMESPACES = NamespaceMatcher(REACTION_ANNOTATIONS)
+
+
 def generate_component_id_namespace_overview(model, components):
     """
     Tabulate which MIRIAM databases the component's identifier matches.
@@ -173,7 +404,7 @@ def generate_component_id_namespace_overview(model, components):
     ----------
     model : cobra.Model
         A cobrapy metabolic model.
-    components : {"metabolites", "reactions", "genes"}
+    components : {"metabolites", "reactions"}
         A string denoting `cobra.Model` components.
 
     Returns
@@ -181,35 +412,15 @@ def generate_component_id_namespace_overview(model, components):
     pandas.DataFrame
         The index of the table is given by the component identifiers. Each
         column corresponds to one MIRIAM database and a Boolean entry
-        determines whether the annotation matches.
+        determines whether the annotation matches. Since the ``biocyc``
+        patterns match broadly, identifiers that match any other database
+        are not counted as ``biocyc``.
 
     """
-    patterns = {
-        "metabolites": METABOLITE_ANNOTATIONS,
-        "reactions": REACTION_ANNOTATIONS
+    matcher = {
+        "metabolites": METABOLITE_NAMESPACES,
+        "reactions": REACTION_NAMESPACES
     }[components]
-    databases = list(patterns)
-    data = list()
-    index = list()
-    for elem in getattr(model, components):
-        index.append(elem.id)
-        data.append(tuple(patterns[db].match(elem.id) is not None
-                          for db in databases))
-    df = pd.DataFrame(data, index=index, columns=databases)
-    if components != "genes":
-        # Clean up of the dataframe. Unfortunately the Biocyc patterns match
-        # broadly. Hence, whenever a Metabolite or Reaction ID matches to any
-        # DB pattern AND the Biocyc pattern we have to assume that this is a
-        # false positive.
-        # First determine all rows in which 'biocyc' and other entries are
-        # True simultaneously and use this Boolean series to create another
-        # column temporarily.
-        df['duplicate'] = df[df['biocyc']].sum(axis=1) >= 2
-        # Replace all nan values with False
-        df['duplicate'].fillna(False, inplace=True)
-        # Use the additional column to index the original dataframe to identify
-        # false positive biocyc hits and set them to False.
-        df.loc[df['duplicate'], 'biocyc'] = False
-        # Delete the additional column
-        del df['duplicate']
-    return df
+    index = [elem.id for elem in getattr(model, components)]
+    return pd.DataFrame(matcher.match(index), index=index,
+                        columns=matcher.databases)
@@ -167,11 +167,16 @@ def find_enzyme_complexes(model):
     """
     enzyme_complexes = set()
     for rxn in model.reactions:
-        if rxn.gene_reaction_rule:
+        if not rxn.gene_reaction_rule:
+            continue
+        try:
             for candidate in helpers.find_functional_units(
                     rxn.gene_reaction_rule):
                 if len(candidate) >= 2:
                     enzyme_complexes.add(tuple(candidate))
+        except ValueError as err:
+            LOGGER.warning("Skipping the rule of reaction '%s': %s",
+                           rxn.id, str(err))
     return enzyme_complexes
 
 
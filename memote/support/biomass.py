@@ -21,9 +21,11 @@ from __future__ import absolute_import
 
 import logging
 
-from six import iteritems
+import numpy as np
 from cobra.exceptions import Infeasible
 
+from memote.support.helpers import get_formula_cache
+
 __all__ = (
     "sum_biomass_weight", "find_biomass_precursors",
     "find_blocked_biomass_precursors")
@@ -35,14 +37,23 @@ def sum_biomass_weight(reaction):
     """
     Compute the sum of all reaction compounds.
 
+    The formula weights are taken from the model's formula cache such that
+    formulas are not parsed repeatedly.
+
     Parameters
     ----------
     reaction : cobra.core.reaction.Reaction
         The biomass reaction of the model under investigation.
 
     """
-    return sum(-coef * met.formula_weight
-               for (met, coef) in iteritems(reaction.metabolites)) / 1000.0
+    metabolites = list(reaction.metabolites)
+    coefficients = np.array([reaction.metabolites[met] for met in metabolites])
+    if reaction.model is None:
+        weights = np.array([met.formula_weight for met in metabolites],
+                           dtype=float)
+    else:
+        weights = get_formula_cache(reaction.model).weights(metabolites)
+    return float(-coefficients.dot(weights)) / 1000.0
 
 
 def find_biomass_precursors(reaction):
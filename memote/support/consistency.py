@@ -28,6 +28,7 @@ from cobra.exceptions import Infeasible
 from cobra.flux_analysis import flux_variability_analysis
 
 import memote.support.consistency_helpers as con_helpers
+import memote.support.helpers as helpers
 
 LOGGER = logging.getLogger(__name__)
 
@@ -352,7 +353,15 @@ def detect_energy_generating_cycles(model, metabolite_id):
             return []
 
 
-def find_mass_imbalanced_reactions(model):
+def _select_internals(model, reactions=None):
+    """Return the internal reactions of the model or of a selection."""
+    internals = con_helpers.get_internals(model)
+    if reactions is None:
+        return list(internals)
+    return [rxn for rxn in reactions if rxn in internals]
+
+
+def find_mass_imbalanced_reactions(model, reactions=None):
     """
     Find metabolic reactions that are not mass balanced.
 
@@ -364,14 +373,52 @@ def find_mass_imbalanced_reactions(model):
     ----------
     model : cobra.Model
         The metabolic model under investigation.
+    reactions : iterable, optional
+        Only examine these reactions of the model.
 
     """
-    internal_rxns = con_helpers.get_internals(model)
-    return [
-        rxn for rxn in internal_rxns if not con_helpers.is_mass_balanced(rxn)]
+    internal_rxns = _select_internals(model, reactions)
+    imbalance, known = con_helpers.mass_imbalance(
+        internal_rxns, helpers.get_formula_cache(model))
+    balanced = known.values & (imbalance.values == 0).all(axis=1)
+    return [rxn for rxn, is_balanced in zip(internal_rxns, balanced)
+            if not is_balanced]
+
+
+def find_element_imbalances(model, reactions):
+    """
+    Determine which elements of reactions are not balanced.
+
+    Parameters
+    ----------
+    model : cobra.Model
+        The metabolic model under investigation.
+    reactions : iterable
+        The reactions to examine, e.g., the ones returned by
+        ``find_mass_imbalanced_reactions``.
+
+    Returns
+    -------
+    dict
+        The net amount of each imbalanced element per reaction identifier.
+        ``None`` for reactions with a metabolite whose formula is unknown.
+
+    """
+    imbalance, known = con_helpers.mass_imbalance(
+        reactions, helpers.get_formula_cache(model))
+    elements = imbalance.columns
+    result = dict()
+    for rxn_id, row, is_known in zip(imbalance.index, imbalance.values,
+                                     known.values):
+        if not is_known:
+            result[rxn_id] = None
+            continue
+        nonzero = np.flatnonzero(row)
+        result[rxn_id] = dict((elements[j], float(row[j])) for j in nonzero)
+    return result
 
 
-def find_charge_imbalanced_reactions(model):
+def find_charge_imbalanced_reactions(model, reactions=None):
     """
     Find metabolic reactions that are not charge balanced.
 
@@ -383,11 +430,14 @@ def find_charge_imbalanced_reactions(model):
     ----------
     model : cobra.Model
         The metabolic model under investigation.
+    reactions : iterable, optional
+        Only examine these reactions of the model.
 
     """
-    internal_rxns = con_helpers.get_internals(model)
-    return [
-        rxn for rxn in internal_rxns if not con_helpers.is_charge_balanced(rxn)]
+    internal_rxns = _select_internals(model, reactions)
+    balanced = (con_helpers.charge_imbalance(internal_rxns) == 0).values
+    return [rxn for rxn, is_balanced in zip(internal_rxns, balanced)
+            if not is_balanced]
 
 
 def find_blocked_reactions(model):
@@ -460,6 +510,51 @@ def find_stoichiometrically_balanced_cycles(model):
     return [model.reactions.get_by_id(id) for id in differential_fluxes]
 
 
+def find_metabolite_connectivity_issues(model):
+    """
+    Classify orphan, dead-end, and disconnected metabolites at once.
+
+    All three classifications are derived from one sparse representation of
+    the stoichiometry and the reversibility of all reactions.
+
+    Parameters
+    ----------
+    model : cobra.Model
+        The metabolic model under investigation.
+
+    Returns
+    -------
+    dict
+        The lists of metabolites that are only consumed ("orphans"), only
+        produced ("deadends"), and not part of any reaction ("disconnected").
+
+    """
+    metabolites = list(model.metabolites)
+    reactions = list(model.reactions)
+    _, rows, columns, coefficients = con_helpers.stoichiometry_coordinates(
+        reactions, metabolites)
+    reversible = np.array([rxn.reversibility for rxn in reactions],
+                          dtype=bool)
+    irreversible = ~reversible[columns]
+    direction = np.sign(coefficients)
+    num_mets = len(metabolites)
+    num_reactions = np.bincount(rows, minlength=num_mets)
+    # Count the reactions in which a metabolite is not strictly consumed or
+    # strictly produced, respectively.
+    not_consumed = np.bincount(
+        rows, weights=~(irreversible & (direction < 0)), minlength=num_mets)
+    not_produced = np.bincount(
+        rows, weights=~(irreversible & (direction > 0)), minlength=num_mets)
+    connected = num_reactions > 0
+    return {
+        "orphans": [metabolites[i] for i in
+                    np.flatnonzero(connected & (not_consumed == 0))],
+        "deadends": [metabolites[i] for i in
+                     np.flatnonzero(connected & (not_produced == 0))],
+        "disconnected": [metabolites[i] for i in np.flatnonzero(~connected)]
+    }
+
+
 def find_orphans(model):
     """
     Return metabolites that are only consumed in reactions.
@@ -470,10 +565,7 @@ def find_orphans(model):
         The metabolic model under investigation.
 
     """
-    return [met for met in model.metabolites
-            if (len(met.reactions) > 0) and all(
-                (not rxn.reversibility) and (rxn.metabolites[met] < 0)
-                for rxn in met.reactions)]
+    return find_metabolite_connectivity_issues(model)["orphans"]
 
 
 def find_deadends(model):
@@ -486,10 +578,7 @@ def find_deadends(model):
         The metabolic model under investigation.
 
     """
-    return [met for met in model.metabolites
-            if (len(met.reactions) > 0) and all(
-                (not rxn.reversibility) and
-                (rxn.metabolites[met] > 0) for rxn in met.reactions)]
+    return find_metabolite_connectivity_issues(model)["deadends"]
 
 
 def find_disconnected(model):
@@ -502,4 +591,4 @@ def find_disconnected(model):
         The metabolic model under investigation.
 
     """
-    return [met for met in model.metabolites if len(met.reactions) == 0]
+    return find_metabolite_connectivity_issues(model)["disconnected"]
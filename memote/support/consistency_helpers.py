@@ -23,16 +23,19 @@ import logging
 from collections import defaultdict
 
 import numpy as np
+import pandas as pd
 import sympy
 from numpy.linalg import svd
 from six import iteritems, itervalues
 from builtins import zip, dict
 
-from memote.support.helpers import find_biomass_reaction
+from memote.support.helpers import find_biomass_reaction, FormulaCache
 
 __all__ = (
     "stoichiometry_matrix",
-    "nullspace"
+    "nullspace",
+    "mass_imbalance",
+    "charge_imbalance"
 )
 
 LOGGER = logging.getLogger(__name__)
@@ -262,3 +265,137 @@ def is_charge_balanced(reaction):
             return False
         charge += coefficient * metabolite.charge
     return charge == 0
+
+
+def stoichiometry_coordinates(reactions, metabolites=None):
+    """
+    Return the sparse coordinate representation of a set of reactions.
+
+    Parameters
+    ----------
+    reactions : list
+        An ordered list of unique reactions.
+    metabolites : list, optional
+        An ordered list of unique metabolites that must contain all
+        metabolites of the reactions. By default, the metabolites are ordered
+        by their first occurrence.
+
+    Returns
+    -------
+    list
+        The metabolites in the order given or in which they first occur.
+    numpy.array
+        The row (metabolite) index of each stoichiometric coefficient.
+    numpy.array
+        The column (reaction) index of each stoichiometric coefficient.
+    numpy.array
+        The stoichiometric coefficients.
+
+    """
+    if metabolites is None:
+        met_index = dict()
+    else:
+        met_index = dict((met, i) for i, met in enumerate(metabolites))
+    rows = list()
+    columns = list()
+    coefficients = list()
+    for j, rxn in enumerate(reactions):
+        for met, coef in iteritems(rxn.metabolites):
+            rows.append(met_index.setdefault(met, len(met_index)))
+            columns.append(j)
+            coefficients.append(coef)
+    if metabolites is None:
+        metabolites = sorted(met_index, key=met_index.get)
+    return (metabolites, np.array(rows, dtype=int),
+            np.array(columns, dtype=int), np.array(coefficients, dtype=float))
+
+
+def element_matrix(metabolites):
+    """
+    Return the elemental composition of metabolites.
+
+    Parameters
+    ----------
+    metabolites : list
+        An ordered list of unique metabolites.
+
+    Returns
+    -------
+    numpy.array
+        The 2D array of the amount of each element (columns) in each
+        metabolite (rows).
+    list
+        The elements in the order in which they first occur.
+    numpy.array
+        Whether the composition of each metabolite is known, i.e., its
+        formula could be parsed.
+
+    """
+    return FormulaCache().composition(metabolites)
+
+
+def mass_imbalance(reactions, cache=None):
+    """
+    Compute the elemental imbalance of many reactions at once.
+
+    The composition of each metabolite is parsed only once. The imbalance is
+    then the product of the stoichiometric coefficients with the element
+    matrix.
+
+    Parameters
+    ----------
+    reactions : iterable
+        Container of `cobra.Reaction` instances.
+    cache : memote.support.helpers.FormulaCache, optional
+        The parsed formulas of the model's metabolites.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The net amount of each element (columns) that a reaction (rows)
+        produces. A balanced reaction has only zero entries.
+    pandas.Series
+        Whether the composition of all metabolites of a reaction is known.
+        Reactions with unknown composition cannot be balanced.
+
+    """
+    reactions = list(reactions)
+    metabolites, rows, columns, coefficients = stoichiometry_coordinates(
+        reactions)
+    if cache is None:
+        composition, elements, has_formula = element_matrix(metabolites)
+    else:
+        composition, elements, has_formula = cache.composition(metabolites)
+    balance = np.zeros((len(reactions), len(elements)))
+    np.add.at(balance, columns, coefficients[:, np.newaxis] * composition[rows])
+    known = np.ones(len(reactions), dtype=bool)
+    known[columns[~has_formula[rows]]] = False
+    index = [rxn.id for rxn in reactions]
+    return (pd.DataFrame(balance, index=index, columns=elements),
+            pd.Series(known, index=index))
+
+
+def charge_imbalance(reactions):
+    """
+    Compute the charge imbalance of many reactions at once.
+
+    Parameters
+    ----------
+    reactions : iterable
+        Container of `cobra.Reaction` instances.
+
+    Returns
+    -------
+    pandas.Series
+        The net charge that each reaction produces. Reactions involving a
+        metabolite without charge are NaN.
+
+    """
+    reactions = list(reactions)
+    metabolites, rows, columns, coefficients = stoichiometry_coordinates(
+        reactions)
+    charges = np.array([np.nan if met.charge is None else met.charge
+                        for met in metabolites], dtype=float)
+    balance = np.zeros(len(reactions))
+    np.add.at(balance, columns, coefficients * charges[rows])
+    return pd.Series(balance, index=[rxn.id for rxn in reactions])
@@ -0,0 +1,444 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compute canonical fingerprints of metabolic models.
+
+Every model component receives one 64-bit hash per aspect, e.g., a reaction
+has separate hashes of its stoichiometry, bounds, gene-protein-reaction rule,
+annotation, and name. The hashes do not depend on the order of metabolites
+in a reaction, of operands in a rule, of entries in an annotation or of
+identifiers in one of its lists, or of components in the model such that
+two models with the same content have the same fingerprint. Callers can thus key caches on only the aspects that a
+computation depends on.
+
+All attributes of a component type are collected in one pass over its
+components and then hashed in bulk with ``pandas.util.hash_array``.
+"""
+
+from __future__ import absolute_import
+
+import ast
+import binascii
+import hashlib
+import logging
+from builtins import dict
+
+import numpy as np
+import pandas as pd
+from six import iteritems, text_type
+
+__all__ = ("ASPECTS", "PARTS", "VERSION", "hash_components",
+           "combine_aspects", "digest", "hash_objective", "fingerprint")
+
+LOGGER = logging.getLogger(__name__)
+
+#: Increases whenever hashes change such that old fingerprints are ignored.
+VERSION = 2
+
+#: The hashed aspects per component type.
+ASPECTS = {
+    "reactions": ("stoichiometry", "bounds", "gpr", "annotation", "name"),
+    "metabolites": ("formula", "charge", "compartment", "annotation",
+                    "name"),
+    "genes": ("name", "annotation")
+}
+
+#: The parts of a model that can be compared between fingerprints: the
+#: identifiers of one component type, e.g., "reactions", one aspect of it,
+#: e.g., "reactions.bounds", or the "objective".
+PARTS = frozenset(
+    list(ASPECTS) + ["objective"] +
+    ["{}.{}".format(kind, aspect) for kind in ASPECTS
+     for aspect in ASPECTS[kind]])
+
+# An odd constant that spreads the bits of one hash before adding another.
+_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _hash_strings(values, repeated=False):
+    """Hash a sequence of strings (or ``None``) into unsigned integers."""
+    # Hashing only the unique values pays off for few distinct values.
+    return pd.util.hash_array(np.array(values, dtype=object),
+                              categorize=repeated)
+
+
+def _chain(*arrays):
+    """Combine hash arrays element-wise such that their order matters."""
+    result = np.zeros(len(arrays[0]), dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for array in arrays:
+            result = pd.util.hash_array(result * _MULTIPLIER + array)
+    return result
+
+
+def _grouped_sum(groups, hashes, size):
+    """Sum hashes per group which makes the result independent of order."""
+    result = np.zeros(size, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        np.add.at(result, groups, hashes)
+    return result
+
+
+def _owners(counts):
+    """Return the position of the owner of each flattened entry."""
+    return np.repeat(np.arange(len(counts), dtype=np.intp),
+                     np.asarray(counts, dtype=np.intp))
+
+
+def _annotation_text(value):
+    """Write an annotation value as text with lists in sorted order."""
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return text_type(sorted(text_type(elem) for elem in value))
+    return text_type(value)
+
+
+def _hash_annotations(counts, keys, values):
+    """Hash the flattened key-value pairs of annotations and sum them up."""
+    if len(keys) == 0:
+        return np.zeros(len(counts), dtype=np.uint64)
+    # Values other than strings, e.g., lists of identifiers, are hashed by
+    # their text.
+    return _grouped_sum(_owners(counts), _chain(
+        _hash_strings(keys, repeated=True),
+        _hash_strings(list(map(_annotation_text, values)))), len(counts))
+
+
+def _hexadecimal(values):
+    """Format unsigned 64-bit integers with 16 hexadecimal digits each."""
+    text = binascii.hexlify(
+        np.asarray(values, dtype=">u8").tobytes()).decode("ascii")
+    return [text[pos:pos + 16] for pos in range(0, len(text), 16)]
+
+
+def _canonical_rule(node):
+    """Write a rule with operands in sorted order and nesting flattened."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.BoolOp):
+        operands = list()
+        stack = list(node.values)
+        while stack:
+            child = stack.pop()
+            if isinstance(child, ast.Name):
+                operands.append(child.id)
+            elif isinstance(child, ast.BoolOp) and \
+                    type(child.op) is type(node.op):
+                stack.extend(child.values)
+            else:
+                operands.append(_canonical_rule(child))
+        joint = " and " if isinstance(node.op, ast.And) else " or "
+        return "(" + joint.join(sorted(operands)) + ")"
+    if isinstance(node, ast.Expression):
+        return _canonical_rule(node.body)
+    raise TypeError("Unexpected element '{}' in a gene-protein-reaction "
+                    "rule.".format(type(node).__name__))
+
+
+def _rule(rxn):
+    """Return the canonical rule of a reaction."""
+    gpr = getattr(rxn, "gpr", None)
+    if gpr is None:
+        # cobrapy < 0.24 stores rules as plain strings.
+        return rxn.gene_reaction_rule
+    body = gpr.body
+    if isinstance(body, list):
+        body = body[0] if len(body) > 0 else None
+    return "" if body is None else _canonical_rule(body)
+
+
+def _hash_reactions(model, aspects, met_hashes=None):
+    """Hash the requested aspects of all reactions."""
+    stoichiometry = "stoichiometry" in aspects
+    bounds = "bounds" in aspects
+    gpr = "gpr" in aspects
+    annotation = "annotation" in aspects
+    name = "name" in aspects
+    if stoichiometry:
+        metabolites = model.metabolites
+        index = dict(zip(metabolites, range(len(metabolites))))
+        if met_hashes is None:
+            met_hashes = _hash_strings([met.id for met in metabolites])
+    ids = list()
+    stoich_counts = list()
+    participants = list()
+    coefficients = list()
+    lower = list()
+    upper = list()
+    rules = list()
+    ann_counts = list()
+    keys = list()
+    values = list()
+    names = list()
+    for rxn in model.reactions:
+        ids.append(rxn.id)
+        if stoichiometry:
+            # Avoid the copy that the public property returns.
+            coefs = rxn._metabolites
+            stoich_counts.append(len(coefs))
+            participants.extend(coefs)
+            coefficients.extend(coefs.values())
+        if bounds:
+            lower.append(rxn.lower_bound)
+            upper.append(rxn.upper_bound)
+        if gpr:
+            rules.append(_rule(rxn))
+        if annotation:
+            ann = rxn.annotation
+            ann_counts.append(len(ann))
+            keys.extend(ann)
+            values.extend(ann.values())
+        if name:
+            names.append(rxn.name)
+    columns = dict()
+    if stoichiometry:
+        if len(participants) == 0:
+            columns["stoichiometry"] = np.zeros(len(ids), dtype=np.uint64)
+        else:
+            positions = np.fromiter(
+                map(index.__getitem__, participants), dtype=np.intp,
+                count=len(participants))
+            columns["stoichiometry"] = _grouped_sum(
+                _owners(stoich_counts), _chain(
+                    met_hashes[positions],
+                    pd.util.hash_array(np.array(coefficients, dtype=float))),
+                len(ids))
+    if bounds:
+        columns["bounds"] = _chain(
+            pd.util.hash_array(np.array(lower, dtype=float)),
+            pd.util.hash_array(np.array(upper, dtype=float)))
+    if gpr:
+        columns["gpr"] = _hash_strings(rules)
+    if annotation:
+        columns["annotation"] = _hash_annotations(ann_counts, keys, values)
+    if name:
+        columns["name"] = _hash_strings(names)
+    return ids, columns
+
+
+def _hash_metabolites(model, aspects):
+    """Hash the requested aspects of all metabolites."""
+    formula = "formula" in aspects
+    charge = "charge" in aspects
+    compartment = "compartment" in aspects
+    annotation = "annotation" in aspects
+    name = "name" in aspects
+    ids = list()
+    formulae = list()
+    charges = list()
+    compartments = list()
+    ann_counts = list()
+    keys = list()
+    values = list()
+    names = list()
+    for met in model.metabolites:
+        ids.append(met.id)
+        if formula:
+            formulae.append(met.formula)
+        if charge:
+            charges.append(met.charge)
+        if compartment:
+            compartments.append(met.compartment)
+        if annotation:
+            ann = met.annotation
+            ann_counts.append(len(ann))
+            keys.extend(ann)
+            values.extend(ann.values())
+        if name:
+            names.append(met.name)
+    columns = dict()
+    if formula:
+        columns["formula"] = _hash_strings(formulae, repeated=True)
+    if charge:
+        columns["charge"] = pd.util.hash_array(
+            np.array(charges, dtype=float))
+    if compartment:
+        columns["compartment"] = _hash_strings(compartments, repeated=True)
+    if annotation:
+        columns["annotation"] = _hash_annotations(ann_counts, keys, values)
+    if name:
+        columns["name"] = _hash_strings(names)
+    return ids, columns
+
+
+def _hash_genes(model, aspects):
+    """Hash the requested aspects of all genes."""
+    annotation = "annotation" in aspects
+    name = "name" in aspects
+    ids = list()
+    ann_counts = list()
+    keys = list()
+    values = list()
+    names = list()
+    for gene in model.genes:
+        ids.append(gene.id)
+        if annotation:
+            ann = gene.annotation
+            ann_counts.append(len(ann))
+            keys.extend(ann)
+            values.extend(ann.values())
+        if name:
+            names.append(gene.name)
+    columns = dict()
+    if name:
+        columns["name"] = _hash_strings(names)
+    if annotation:
+        columns["annotation"] = _hash_annotations(ann_counts, keys, values)
+    return ids, columns
+
+
+_HASHERS = {
+    "reactions": _hash_reactions,
+    "metabolites": _hash_metabolites,
+    "genes": _hash_genes
+}
+
+
+def hash_components(model, kind, aspects=None):
+    """
+    Hash aspects of one type of model components.
+
+    Parameters
+    ----------
+    model : cobra.Model
+        The metabolic model under investigation.
+    kind : {"reactions", "metabolites", "genes"}
+        The type of components.
+    aspects : iterable, optional
+        A subset of ``ASPECTS[kind]`` (default all).
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per component identifier and one column of unsigned 64-bit
+        hashes per aspect.
+
+    """
+    if kind not in ASPECTS:
+        raise ValueError("Unknown component type '{}'.".format(kind))
+    aspects = ASPECTS[kind] if aspects is None else tuple(aspects)
+    unknown = set(aspects).difference(ASPECTS[kind])
+    if len(unknown) > 0:
+        raise ValueError("Unknown aspects of {}: {}.".format(
+            kind, ", ".join(sorted(unknown))))
+    ids, columns = _HASHERS[kind](model, aspects)
+    return pd.DataFrame(
+        dict((aspect, columns[aspect]) for aspect in aspects),
+        index=pd.Index(ids, dtype=object), columns=list(aspects),
+        dtype=np.uint64)
+
+
+def combine_aspects(hashes):
+    """
+    Combine the aspect hashes of each component into a single hash.
+
+    Parameters
+    ----------
+    hashes : pandas.DataFrame
+        As returned by ``hash_components``.
+
+    Returns
+    -------
+    pandas.Series
+        One unsigned 64-bit hash per component.
+
+    """
+    if len(hashes.columns) == 0:
+        return pd.Series(np.zeros(len(hashes), dtype=np.uint64),
+                         index=hashes.index)
+    return pd.Series(_chain(*[hashes[col].values for col in hashes.columns]),
+                     index=hashes.index)
+
+
+def digest(hashes):
+    """
+    Summarize component hashes regardless of the order of the components.
+
+    Parameters
+    ----------
+    hashes : pandas.Series
+        Unsigned 64-bit hashes indexed by component identifiers.
+
+    Returns
+    -------
+    str
+        A hexadecimal digest.
+
+    """
+    return _digest(_hash_strings(list(hashes.index)), hashes.values)
+
+
+def _digest(id_hashes, values):
+    """Sum the pairs of identifier and value hashes."""
+    paired = _chain(id_hashes, values)
+    with np.errstate(over="ignore"):
+        return "{:016x}".format(int(paired.sum(dtype=np.uint64)))
+
+
+def hash_objective(model):
+    """Return a hexadecimal digest of the objective and its direction."""
+    # The terms of the objective are much cheaper to obtain than the
+    # coefficients of all reactions and name the same variables.
+    terms = model.objective.expression.as_coefficients_dict()
+    coefficients = sorted((getattr(var, "name", str(var)), float(coef))
+                          for var, coef in iteritems(terms))
+    return hashlib.sha1(repr((coefficients, model.objective_direction))
+                        .encode("utf-8")).hexdigest()[:16]
+
+
+def fingerprint(model):
+    """
+    Compute the complete fingerprint of a model.
+
+    Parameters
+    ----------
+    model : cobra.Model
+        The metabolic model under investigation.
+
+    Returns
+    -------
+    dict
+        The "version" of the hashes; one hexadecimal hash per component
+        identifier for "reactions", "metabolites", and "genes"; a digest per
+        aspect of each component type in "aspects"; and digests of the
+        "stoichiometry", the "bounds", and the "objective" of the model.
+
+    """
+    result = {"version": VERSION, "aspects": dict()}
+    # Hash the metabolite identifiers once for their digests and for the
+    # stoichiometry of the reactions.
+    met_ids, met_columns = _hash_metabolites(model, ASPECTS["metabolites"])
+    met_hashes = _hash_strings(met_ids)
+    components = {
+        "metabolites": (met_ids, met_columns, met_hashes),
+        "reactions": _hash_reactions(
+            model, ASPECTS["reactions"], met_hashes) + (None,),
+        "genes": _hash_genes(model, ASPECTS["genes"]) + (None,)
+    }
+    for kind, (ids, columns, id_hashes) in iteritems(components):
+        if id_hashes is None:
+            id_hashes = _hash_strings(ids)
+        aspects = ASPECTS[kind]
+        result[kind] = dict(zip(ids, _hexadecimal(_chain(
+            *[columns[aspect] for aspect in aspects]))))
+        result["aspects"][kind] = dict(
+            (aspect, _digest(id_hashes, columns[aspect]))
+            for aspect in aspects)
+    result["stoichiometry"] = result["aspects"]["reactions"]["stoichiometry"]
+    result["bounds"] = result["aspects"]["reactions"]["bounds"]
+    result["objective"] = hash_objective(model)
+    return result
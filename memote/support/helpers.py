@@ -23,18 +23,35 @@ import logging
 import re
 from builtins import dict
 from collections import defaultdict
+from weakref import WeakKeyDictionary
 import numpy as np
+try:
+    from functools import lru_cache
+except ImportError:
+    from backports.functools_lru_cache import lru_cache
 import warnings
 with warnings.catch_warnings():
     warnings.simplefilter("ignore", UserWarning)
     # ignore Gurobi warning
     from cobra.exceptions import Infeasible
+    from cobra.core.formula import elements_and_molecular_weights
 
 from six import iteritems, itervalues
-from sympy import expand
 
 LOGGER = logging.getLogger(__name__)
 
+#: The maximum number of functional units that a single gene-protein-reaction
+#: rule may expand to.
+MAX_GPR_TERMS = 10000
+
+#: The number of distinct rules whose functional units are kept in memory.
+GPR_CACHE_SIZE = 65536
+
+GPR_TOKENS = re.compile(r"\(|\)|[^\s()]+")
+
+# One formula cache per model.
+_FORMULA_CACHES = WeakKeyDictionary()
+
 
 def find_transported_elements(rxn):
     """
@@ -293,27 +310,277 @@ def find_exchange_rxns(model):
             if any(c in rxn.get_compartments() for c in ['e'])]
 
 
-def find_functional_units(gpr_str):
+def _parse_gpr_atom(tokens, pos):
+    """Parse a gene identifier or a parenthesized rule."""
+    if pos == len(tokens):
+        raise ValueError("Unexpected end of the rule.")
+    token = tokens[pos]
+    if token == "(":
+        node, pos = _parse_gpr_or(tokens, pos + 1)
+        if pos == len(tokens) or tokens[pos] != ")":
+            raise ValueError("Missing closing parenthesis.")
+        return node, pos + 1
+    if token == ")" or token.lower() in ("and", "or"):
+        raise ValueError("Unexpected '{}' at position {:d}.".format(
+            token, pos))
+    return token, pos + 1
+
+
+def _parse_gpr_and(tokens, pos):
+    """Parse a conjunction of atoms."""
+    node, pos = _parse_gpr_atom(tokens, pos)
+    children = [node]
+    while pos < len(tokens) and tokens[pos].lower() == "and":
+        node, pos = _parse_gpr_atom(tokens, pos + 1)
+        children.append(node)
+    if len(children) == 1:
+        return node, pos
+    return ("and", tuple(children)), pos
+
+
+def _parse_gpr_or(tokens, pos):
+    """Parse a disjunction of conjunctions."""
+    node, pos = _parse_gpr_and(tokens, pos)
+    children = [node]
+    while pos < len(tokens) and tokens[pos].lower() == "or":
+        node, pos = _parse_gpr_and(tokens, pos + 1)
+        children.append(node)
+    if len(children) == 1:
+        return node, pos
+    return ("or", tuple(children)), pos
+
+
+def parse_gpr(gpr_str):
+    """
+    Parse a gene-protein-reaction rule into an abstract syntax tree.
+
+    Parameters
+    ----------
+    gpr_str : string
+        A string consisting of gene ids, the boolean operators 'and' and 'or',
+        and parentheses.
+
+    Returns
+    -------
+    str or tuple
+        Either a single gene identifier or a pair of the operator ('and' or
+        'or') and a tuple of its operands.
+
+    Raises
+    ------
+    ValueError
+        If the rule is malformed.
+
+    """
+    tokens = GPR_TOKENS.findall(gpr_str)
+    node, pos = _parse_gpr_or(tokens, 0)
+    if pos != len(tokens):
+        raise ValueError("Unexpected '{}' at position {:d} in '{}'.".format(
+            tokens[pos], pos, gpr_str))
+    return node
+
+
+def _gpr_to_dnf(node, max_terms):
+    """Expand a rule tree into a set of gene sets (disjunctive normal form)."""
+    if not isinstance(node, tuple):
+        return frozenset([frozenset([node])])
+    operator, children = node
+    operands = [_gpr_to_dnf(child, max_terms) for child in children]
+    if operator == "or":
+        terms = frozenset().union(*operands)
+    else:
+        terms = frozenset([frozenset()])
+        for operand in operands:
+            # Stop as soon as the product exceeds the limit instead of
+            # building all of it first.
+            product = set()
+            for left in terms:
+                product.update(left | right for right in operand)
+                if len(product) > max_terms:
+                    break
+            terms = frozenset(product)
+            if len(terms) > max_terms:
+                break
+    if len(terms) > max_terms:
+        raise ValueError(
+            "The rule expands to more than {:d} functional units.".format(
+                max_terms))
+    return terms
+
+
+@lru_cache(maxsize=GPR_CACHE_SIZE)
+def _functional_units(gpr_str, max_terms):
+    """Return the sorted functional units of a rule."""
+    return tuple(sorted(
+        tuple(sorted(term)) for term in
+        _gpr_to_dnf(parse_gpr(gpr_str), max_terms)))
+
+
+def find_functional_units(gpr_str, max_terms=MAX_GPR_TERMS):
     """
     Return an iterator of gene IDs grouped by boolean rules from the gpr_str.
 
-    The gpr_str is first transformed into an algebraic expression, replacing
-    the boolean operators 'or' with '+' and 'and' with '*'. Treating the
-    gene IDs as sympy.symbols this allows a mathematical expansion of the
-    algebraic expression. The expanded form is then split again producing sets
-    of gene IDs that in the gpr_str had an 'and' relationship.
+    The gpr_str is parsed into a tree of 'and' and 'or' operations which is
+    then expanded into its disjunctive normal form. Each resulting conjunction
+    is a set of gene IDs that in the gpr_str had an 'and' relationship. The
+    expansions of the ``GPR_CACHE_SIZE`` most recently used rules are cached.
 
     Parameters
     ----------
     gpr_str : string
             A string consisting of gene ids and the boolean expressions 'and'
             and 'or'
+    max_terms : int, optional
+            The maximum number of functional units that the rule may expand to.
+
+    Raises
+    ------
+    ValueError
+        If the rule is malformed or expands to more than `max_terms` units.
+
+    """
+    for unit in _functional_units(gpr_str, max_terms):
+        yield list(unit)
+
+
+class FormulaCache(object):
+    """
+    Keep the parsed formulas of a model's metabolites.
+
+    Each metabolite's formula is parsed once into its elemental composition
+    and its molecular weight. A formula is parsed again only if it differs
+    from the one seen before. The compositions and weights are provided as
+    arrays for any list of metabolites. Metabolites are identified by their
+    ID such that the cache does not keep the model alive.
+
+    """
+
+    def __init__(self, **kwargs):
+        """Create an empty cache."""
+        super(FormulaCache, self).__init__(**kwargs)
+        self._rows = dict()
+        self._formulas = list()
+        self._compositions = list()
+        self._matrix = None
+        self._elements = None
+        self._known = None
+        self._weights = None
+
+    def _parse(self, row, met):
+        """Store the composition of a metabolite's formula."""
+        self._formulas[row] = met.formula
+        self._compositions[row] = met.elements
+
+    def _build(self):
+        """Create the arrays from the parsed compositions."""
+        element_index = dict()
+        entries = list()
+        weights = np.zeros(len(self._compositions))
+        known = np.ones(len(self._compositions), dtype=bool)
+        for row, composition in enumerate(self._compositions):
+            if composition is None:
+                known[row] = False
+                weights[row] = np.nan
+                continue
+            for element, amount in iteritems(composition):
+                entries.append(
+                    (row, element_index.setdefault(element,
+                                                   len(element_index)),
+                     amount))
+            try:
+                weights[row] = sum([
+                    amount * elements_and_molecular_weights[element]
+                    for element, amount in iteritems(composition)])
+            except KeyError:
+                weights[row] = np.nan
+        matrix = np.zeros((len(self._compositions), len(element_index)))
+        if len(entries) > 0:
+            rows, columns, amounts = zip(*entries)
+            matrix[list(rows), list(columns)] = amounts
+        self._matrix = matrix
+        self._elements = sorted(element_index, key=element_index.get)
+        self._known = known
+        self._weights = weights
+
+    def _update(self, metabolites):
+        """Parse new or changed formulas and return the metabolites' rows."""
+        rows = np.zeros(len(metabolites), dtype=int)
+        changed = self._matrix is None
+        for i, met in enumerate(metabolites):
+            row = self._rows.get(met.id)
+            if row is None:
+                row = self._rows[met.id] = len(self._formulas)
+                self._formulas.append(None)
+                self._compositions.append(None)
+                self._parse(row, met)
+                changed = True
+            elif self._formulas[row] != met.formula:
+                self._parse(row, met)
+                changed = True
+            rows[i] = row
+        if changed:
+            self._build()
+        return rows
+
+    def composition(self, metabolites):
+        """
+        Return the elemental composition of metabolites.
+
+        Parameters
+        ----------
+        metabolites : list
+            An ordered list of metabolites.
+
+        Returns
+        -------
+        numpy.array
+            The 2D array of the amount of each element (columns) in each
+            metabolite (rows).
+        list
+            The elements.
+        numpy.array
+            Whether the composition of each metabolite is known, i.e., its
+            formula could be parsed.
+
+        """
+        rows = self._update(metabolites)
+        return self._matrix[rows], list(self._elements), self._known[rows]
+
+    def weights(self, metabolites):
+        """
+        Return the molecular weights of metabolites.
+
+        Parameters
+        ----------
+        metabolites : list
+            An ordered list of metabolites.
+
+        Returns
+        -------
+        numpy.array
+            The formula weight of each metabolite. Weights of formulas that
+            cannot be parsed or contain unknown elements are NaN.
+
+        """
+        rows = self._update(metabolites)
+        return self._weights[rows]
+
+
+def get_formula_cache(model):
+    """
+    Return the formula cache of a model.
+
+    Parameters
+    ----------
+    model : cobra.Model
+        The metabolic model under investigation.
 
     """
-    algebraic_form = re.sub('[Oo]r', '+', re.sub('[Aa]nd', '*', gpr_str))
-    expanded = str(expand(algebraic_form))
-    for unit in expanded.replace('+', ',').split(' , '):
-        yield unit.split('*')
+    try:
+        return _FORMULA_CACHES[model]
+    except KeyError:
+        cache = _FORMULA_CACHES[model] = FormulaCache()
+        return cache
 
 
 def run_fba(model, rxn_id, direction="max", single_value=True):
@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Generate synthetic metabolic models of arbitrary size.
+
+The models resemble genome-scale reconstructions in their composition, i.e.,
+they contain exchange, transport, metabolic, and biomass reactions, gene-
+protein-reaction rules, chemical formulae, charges, and annotations. They are
+not meant to be biologically meaningful but to expose how memote scales with
+the size of a model. The same arguments always generate the same model.
+"""
+
+from __future__ import absolute_import, division
+
+import logging
+from builtins import dict, range
+from string import ascii_uppercase
+
+import numpy as np
+from cobra import Metabolite, Model, Reaction
+
+__all__ = ("generate_model",)
+
+LOGGER = logging.getLogger(__name__)
+
+#: Compartment identifiers and names in the order in which they are used.
+COMPARTMENTS = (
+    ("c", "cytosol"),
+    ("e", "extracellular space"),
+    ("p", "periplasm"),
+    ("m", "mitochondria"),
+    ("x", "peroxisome"),
+    ("r", "endoplasmic reticulum"),
+    ("v", "vacuole"),
+    ("n", "nucleus"),
+    ("g", "golgi apparatus"),
+    ("l", "lysosome")
+)
+
+#: The elements of the formulae and their maximum count per metabolite.
+ELEMENTS = (("C", 30), ("H", 60), ("N", 5), ("O", 15), ("P", 3), ("S", 2))
+
+#: Fraction of metabolic and transport reactions that have a GPR rule.
+GPR_COVERAGE = 0.9
+
+#: Fraction of metabolic reactions that are reversible.
+REVERSIBLE = 0.4
+
+#: Fraction of exchange reactions that allow uptake.
+UPTAKE = 0.2
+
+
+def _letters(number, length):
+    """Encode a number as a fixed length string of capital letters."""
+    chars = list()
+    for _ in range(length):
+        number, rest = divmod(number, 26)
+        chars.append(ascii_uppercase[rest])
+    return "".join(reversed(chars))
+
+
+def _ec_number(index):
+    """Return a valid EC number derived from an index."""
+    return "{}.{}.{}.{}".format(
+        index % 6 + 1, index // 6 % 20 + 1, index // 120 % 30 + 1,
+        index // 3600 + 1)
+
+
+#: Functions that return a valid identifier per database given an index.
+METABOLITE_IDENTIFIERS = (
+    ("pubchem.compound", lambda i: str(i + 1)),
+    ("kegg.compound", lambda i: "C{:05d}".format(i + 1)),
+    ("seed.compound", lambda i: "cpd{:05d}".format(i + 1)),
+    ("inchikey", lambda i: "{}-{}-N".format(
+        _letters(i, 14), _letters(i * 7919, 10))),
+    ("chebi", lambda i: "CHEBI:{}".format(i + 1)),
+    ("hmdb", lambda i: "HMDB{:05d}".format(i % 100000)),
+    ("reactome", lambda i: "R-ALL-{}".format(i + 1)),
+    ("metanetx.chemical", lambda i: "MNXM{}".format(i + 1)),
+    ("bigg.metabolite", lambda i: "m{}".format(i)),
+    ("biocyc", lambda i: "META:M{}".format(i))
+)
+
+REACTION_IDENTIFIERS = (
+    ("rhea", lambda i: "{:05d}".format(10000 + i % 90000)),
+    ("kegg.reaction", lambda i: "R{:05d}".format(i + 1)),
+    ("metanetx.reaction", lambda i: "MNXR{}".format(i + 1)),
+    ("bigg.reaction", lambda i: "R{}".format(i)),
+    ("ec-code", _ec_number),
+    ("brenda", _ec_number),
+    ("biocyc", lambda i: "META:RXN-{}".format(i))
+)
+
+
+def _annotations(rand, identifiers, num, density):
+    """Draw the annotation of ``num`` components with the given density."""
+    present = rand.random_sample((num, len(identifiers))) < density
+    result = list()
+    for index in range(num):
+        result.append(dict(
+            (db, make(index)) for (db, make), has in zip(
+                identifiers, present[index]) if has))
+    return result
+
+
+def _formulae(rand, num):
+    """Draw ``num`` chemical formulae."""
+    counts = np.column_stack([
+        rand.randint(1 if elem == "C" else 0, high + 1, size=num)
+        for elem, high in ELEMENTS])
+    return ["".join("{}{}".format(elem, count) if count > 1 else elem
+                    for (elem, _), count in zip(ELEMENTS, row) if count > 0)
+            for row in counts]
+
+
+def _gene_rule(rand, genes, complexity):
+    """Draw a rule of isozymes that may consist of several subunits."""
+    isozymes = list()
+    for _ in range(rand.randint(1, complexity + 1)):
+        subunits = [next(genes) for _ in range(rand.randint(
+            1, complexity + 1))]
+        if len(subunits) == 1:
+            isozymes.append(subunits[0])
+        else:
+            isozymes.append("({})".format(" and ".join(subunits)))
+    if len(isozymes) == 1:
+        return isozymes[0].strip("()")
+    return " or ".join(isozymes)
+
+
+def _gene_pool(rand, num):
+    """Yield gene identifiers such that each is used before any repeats."""
+    identifiers = np.array(["g{:05d}".format(i) for i in range(num)])
+    while True:
+        for gene in identifiers[rand.permutation(num)]:
+            yield str(gene)
+
+
+def generate_model(num_reactions=1000, num_metabolites=None,
+                   num_compartments=3, num_genes=None, gpr_complexity=2,
+                   annotation_density=0.5, biomass_size=50, seed=0):
+    """
+    Generate a synthetic metabolic model deterministically.
+
+    Every metabolite is part of a cytosolic pool. A fraction of the pools is
+    also present in one or more of the other compartments and connected to
+    the cytosol by a transport reaction. Each extracellular metabolite has an
+    exchange reaction. One biomass reaction consumes cytosolic precursors and
+    is the objective. Precursors are preferably chosen among the metabolites
+    that can be taken up such that the biomass reaction can carry flux. All
+    remaining reactions are metabolic reactions that convert one to three
+    substrates into one to three products within a compartment. Since the
+    chemical formulae are random, most metabolic reactions are not mass
+    balanced.
+
+    Parameters
+    ----------
+    num_reactions : int, optional
+        The exact number of reactions.
+    num_metabolites : int, optional
+        The exact number of metabolites (default three quarters of the
+        reactions).
+    num_compartments : int, optional
+        The number of compartments, at most 10. The first two are the cytosol
+        and the extracellular space.
+    num_genes : int, optional
+        The number of genes (default four fifths of the reactions). All genes
+        are used once before any gene is assigned to a second reaction, so
+        the model contains all of them unless there are fewer rules than
+        genes.
+    gpr_complexity : int, optional
+        The maximum number of isozymes per rule and of subunits per isozyme.
+        A value of 1 means that each reaction is catalyzed by a single gene.
+    annotation_density : float, optional
+        The probability that a component is annotated with any one of the
+        databases that memote checks.
+    biomass_size : int, optional
+        The number of precursors consumed by the biomass reaction.
+    seed : int, optional
+        The seed of the random number generator.
+
+    Returns
+    -------
+    cobra.Model
+        The synthetic model.
+
+    Raises
+    ------
+    ValueError
+        If the requested number of reactions cannot accommodate all
+        exchange, transport, and biomass reactions or if metabolic reactions
+        are requested without two metabolites in one compartment.
+
+    """
+    if num_metabolites is None:
+        num_metabolites = num_reactions * 3 // 4
+    if num_genes is None:
+        num_genes = num_reactions * 4 // 5
+    if not 1 <= num_compartments <= len(COMPARTMENTS):
+        raise ValueError("The number of compartments must be between 1 and "
+                         "{}.".format(len(COMPARTMENTS)))
+    rand = np.random.RandomState(seed)
+    compartments = COMPARTMENTS[:num_compartments]
+    # Distribute the metabolites over the cytosolic pools and the other
+    # compartments.
+    if num_compartments == 1:
+        num_pools = num_metabolites
+    else:
+        num_pools = int(np.ceil(num_metabolites / 1.3))
+    extra = np.array_split(np.arange(num_metabolites - num_pools),
+                           max(num_compartments - 1, 1))
+    located = [("c", np.arange(num_pools))]
+    for (comp, _), part in zip(compartments[1:], extra):
+        located.append((comp, np.sort(
+            rand.permutation(num_pools)[:len(part)])))
+    if biomass_size > num_pools:
+        raise ValueError("The biomass reaction cannot consume more precursors "
+                         "than there are cytosolic metabolites.")
+    num_transport = num_metabolites - num_pools
+    num_exchange = len(located[1][1]) if num_compartments > 1 else 0
+    num_metabolic = num_reactions - num_transport - num_exchange - 1
+    if num_metabolic < 0:
+        raise ValueError(
+            "At least {} reactions are needed for the exchange, transport, "
+            "and biomass reactions.".format(num_reactions - num_metabolic))
+    LOGGER.debug("Generating %d metabolic, %d transport, and %d exchange "
+                 "reactions.", num_metabolic, num_transport, num_exchange)
+    # Metabolites share their formula, charge, and annotation among
+    # compartments.
+    formulae = _formulae(rand, num_pools)
+    charges = rand.randint(-3, 2, size=num_pools)
+    met_annotation = _annotations(
+        rand, METABOLITE_IDENTIFIERS, num_pools, annotation_density)
+    metabolites = dict()
+    for comp, pools in located:
+        metabolites[comp] = list()
+        for pool in pools:
+            met = Metabolite(
+                "m{}_{}".format(pool, comp), formula=formulae[pool],
+                name="metabolite {}".format(pool), charge=int(charges[pool]),
+                compartment=comp)
+            met.annotation = dict(met_annotation[pool])
+            metabolites[comp].append(met)
+    # Prefer biomass precursors that can be taken up from the medium such
+    # that the biomass reaction can carry flux.
+    if num_compartments > 1:
+        external = located[1][1]
+        candidates = np.concatenate([
+            rand.permutation(external),
+            rand.permutation(np.setdiff1d(np.arange(num_pools), external))])
+    else:
+        candidates = rand.permutation(num_pools)
+    precursors = np.sort(candidates[:biomass_size])
+    genes = _gene_pool(rand, num_genes)
+    reactions = list()
+    # Exchange reactions.
+    if num_compartments > 1:
+        uptake = (rand.random_sample(num_exchange) < UPTAKE) | \
+            np.isin(external, precursors)
+        for met, allowed in zip(metabolites["e"], uptake):
+            rxn = Reaction("EX_{}".format(met.id),
+                           name="{} exchange".format(met.name),
+                           lower_bound=-10.0 if allowed else 0.0,
+                           upper_bound=1000.0)
+            rxn.add_metabolites({met: -1})
+            reactions.append(rxn)
+    # Transport reactions from the cytosol.
+    cytosol = metabolites["c"]
+    for comp, pools in located[1:]:
+        for pool, met in zip(pools, metabolites[comp]):
+            rxn = Reaction("T_m{}_{}".format(pool, comp),
+                           name="{} transport".format(met.name),
+                           lower_bound=-1000.0, upper_bound=1000.0)
+            rxn.add_metabolites({cytosol[pool]: -1, met: 1})
+            reactions.append(rxn)
+    # Metabolic reactions distributed over the compartments by size. Small
+    # compartments are only used if no compartment holds enough metabolites
+    # for three substrates and three products.
+    sizes = np.array([len(metabolites[comp]) for comp, _ in compartments])
+    weights = np.where(sizes >= 6, sizes, 0)
+    if weights.sum() == 0:
+        weights = np.where(sizes >= 2, sizes, 0)
+    if weights.sum() > 0:
+        location = rand.choice(len(compartments), size=num_metabolic,
+                               p=weights / weights.sum())
+    elif num_metabolic > 0:
+        raise ValueError("Metabolic reactions need at least two metabolites "
+                         "in one compartment.")
+    else:
+        location = np.zeros(0, dtype=int)
+    num_substrates = np.minimum(rand.randint(1, 4, size=num_metabolic),
+                                sizes[location] - 1)
+    num_products = np.minimum(rand.randint(1, 4, size=num_metabolic),
+                              sizes[location] - num_substrates)
+    reversible = rand.random_sample(num_metabolic) < REVERSIBLE
+    for index in range(num_metabolic):
+        pool = metabolites[compartments[location[index]][0]]
+        chosen = set()
+        while len(chosen) < num_substrates[index] + num_products[index]:
+            chosen.add(rand.randint(len(pool)))
+        chosen = sorted(chosen, key=lambda _: rand.random_sample())
+        stoichiometry = dict()
+        for pos, met_index in enumerate(chosen):
+            coef = 2 if rand.random_sample() < 0.1 else 1
+            stoichiometry[pool[met_index]] = \
+                -coef if pos < num_substrates[index] else coef
+        rxn = Reaction("R{}".format(index), name="reaction {}".format(index),
+                       lower_bound=-1000.0 if reversible[index] else 0.0,
+                       upper_bound=1000.0)
+        rxn.add_metabolites(stoichiometry)
+        reactions.append(rxn)
+    # Gene-protein-reaction rules and annotations of all but the exchanges.
+    rxn_annotation = _annotations(
+        rand, REACTION_IDENTIFIERS, num_metabolic, annotation_density)
+    has_rule = rand.random_sample(len(reactions)) < GPR_COVERAGE
+    for index, rxn in enumerate(reactions[num_exchange:], num_exchange):
+        if num_genes > 0 and has_rule[index]:
+            rxn.gene_reaction_rule = _gene_rule(rand, genes, gpr_complexity)
+    for rxn, annotation in zip(reactions[-num_metabolic:], rxn_annotation):
+        rxn.annotation = annotation
+    # The biomass reaction.
+    biomass = Reaction("BIOMASS_synthetic", name="biomass",
+                       lower_bound=0.0, upper_bound=1000.0)
+    coefficients = np.round(rand.uniform(0.01, 2.0, size=biomass_size), 4)
+    biomass.add_metabolites(dict(
+        (cytosol[pool], -float(coef))
+        for pool, coef in zip(precursors, coefficients)))
+    reactions.append(biomass)
+    model = Model("synthetic_{}_{}".format(num_reactions, seed),
+                  name="synthetic model")
+    # Adding all metabolites at once is much faster than letting
+    # `add_reactions` add them one by one.
+    model.add_metabolites([met for comp, _ in compartments
+                           for met in metabolites[comp]])
+    model.add_reactions(reactions)
+    model.compartments = dict(compartments)
+    model.objective = biomass.id
+    return model
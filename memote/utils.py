@@ -22,6 +22,8 @@ from __future__ import absolute_import
 from builtins import dict
 from textwrap import TextWrapper
 
+from memote.support.fingerprint import PARTS
+
 __all__ = ("register_with", "annotate", "get_ids", "truncate")
 
 
@@ -52,8 +54,41 @@ def register_with(registry):
     return decorator
 
 
-def annotate(title, type, message=None, data=None, metric=1.0):
-    """Annotate a test case."""
+def annotate(title, type, message=None, data=None, metric=1.0, depends=None,
+             solver=False):
+    """
+    Annotate a test case.
+
+    Parameters
+    ----------
+    title : str
+        The title of the test case in reports.
+    type : str
+        The type of the data that the test case stores.
+    message : str or dict, optional
+        The default message.
+    data : object, optional
+        The default data.
+    metric : float or dict, optional
+        The default metric.
+    depends : iterable, optional
+        The parts of the model that the test case reads, e.g.,
+        "reactions.stoichiometry" or "metabolites.formula" (see
+        ``memote.support.fingerprint.PARTS``). The result of a previous run
+        is reused if none of them changed. Without it, the test case is
+        always run.
+    solver : bool, optional
+        Whether the test case solves optimization problems. Test cases that
+        do not are run first.
+
+    """
+    if depends is not None:
+        depends = frozenset(depends)
+        unknown = depends - PARTS
+        if len(unknown) > 0:
+            raise ValueError("Unknown model parts: {}.".format(
+                ", ".join(sorted(unknown))))
+
     def decorator(func):
         func.annotation = dict(
             title=title,
@@ -62,6 +97,8 @@ def annotate(title, type, message=None, data=None, metric=1.0):
             data=data,
             type=type,
             metric=metric)
+        func.depends = depends
+        func.solver = solver
         return func
     return decorator
 
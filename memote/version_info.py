@@ -10,12 +10,24 @@ from __future__ import absolute_import, print_function
 
 from builtins import dict
 
+import hashlib
+import io
+import json
+import logging
+import os
 import platform
+import sys
+from os.path import dirname, expanduser, isdir, join
 
-import pip
+try:
+    from importlib import metadata
+except ImportError:
+    import importlib_metadata as metadata
 
 __all__ = ("show_versions",)
 
+LOGGER = logging.getLogger(__name__)
+
 SYS_ORDER = [
     "OS",
     "OS-release",
@@ -40,6 +52,7 @@ PKG_ORDER = [
     "pytest",
     "gitpython",
     "dask",
+    "pyarrow",
     "cloudpickle",
     "toolz",
     "Jinja2",
@@ -58,19 +71,87 @@ def get_sys_info():
     return blob
 
 
-def get_pkg_info():
-    """Return Python package information as a dict."""
-    # TODO: Basically copying the requirements from setup.py is brittle,
-    # should come up with a better way in future, for example,
-    # using requirements files that can be read in.
-    dependencies = frozenset(PKG_ORDER)
+def _cache_filename():
+    """Return the location of the package information for this interpreter."""
+    base = os.environ.get("XDG_CACHE_HOME", join(expanduser("~"), ".cache"))
+    digest = hashlib.sha1(sys.executable.encode("utf-8")).hexdigest()
+    return join(base, "memote", "packages-{}.json".format(digest[:16]))
+
+
+def _environment_key():
+    """Summarize the import paths, their modification times and packages."""
+    parts = list(PKG_ORDER)
+    for path in sys.path:
+        if not path:
+            continue
+        try:
+            parts.append(u"{}:{!r}".format(path, os.stat(path).st_mtime))
+        except OSError:
+            continue
+    return hashlib.sha1(u"\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def _read_pkg_info():
+    """Look up the installed versions of memote's dependencies."""
     blob = dict()
-    for dist in pip.get_installed_distributions():
-        if dist.project_name in dependencies:
-            blob[dist.project_name] = dist.version
+    for name in PKG_ORDER:
+        try:
+            blob[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            continue
     return blob
 
 
+def _load_cached_pkg_info(filename, key):
+    """Return cached package information if it is still valid."""
+    try:
+        with io.open(filename, encoding="utf-8") as file_h:
+            cache = json.load(file_h)
+    except (IOError, OSError, ValueError):
+        return None
+    if cache.get("key") != key:
+        return None
+    return cache.get("packages")
+
+
+def _store_cached_pkg_info(filename, key, packages):
+    """Write package information to the cache (if possible)."""
+    try:
+        if not isdir(dirname(filename)):
+            os.makedirs(dirname(filename))
+        with io.open(filename, "w", encoding="utf-8") as file_h:
+            file_h.write(json.dumps({"key": key, "packages": packages},
+                                    ensure_ascii=False))
+    except (IOError, OSError) as err:
+        LOGGER.debug("Could not cache package information: %s", str(err))
+
+
+# Package information that was looked up in this process.
+_PKG_INFO = dict()
+
+
+def get_pkg_info():
+    """
+    Return Python package information as a dict.
+
+    Only memote's dependencies are looked up. The result is memoized per
+    process and on disk per interpreter. The disk cache is invalidated
+    whenever one of the import paths is modified, for example, by installing
+    a package.
+
+    """
+    key = _environment_key()
+    if key not in _PKG_INFO:
+        filename = _cache_filename()
+        packages = _load_cached_pkg_info(filename, key)
+        if packages is None:
+            packages = _read_pkg_info()
+            _store_cached_pkg_info(filename, key, packages)
+        _PKG_INFO.clear()
+        _PKG_INFO[key] = packages
+    return dict(_PKG_INFO[key])
+
+
 def show_versions():
     """Print the formatted information to standard out."""
     info = get_sys_info()
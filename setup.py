@@ -39,16 +39,18 @@ if set(['pytest', 'test', 'ptr']).intersection(sys.argv):
     setup_requirements.append("pytest-runner")
 
 requirements = [
-    "pip",
     "click",
     "click-configfile",
     "click-log",
     "six",
     "future",
+    "importlib_metadata; python_version < '3.8'",
+    "backports.functools_lru_cache; python_version < '3'",
     "pytest>=3.1",
     "gitpython",
     "pandas>=0.20.1",
-    "dask>=0.14.3",
+    "dask>=0.18",
+    "pyarrow",
     "cloudpickle",
     "toolz",
     "Jinja2",
@@ -82,6 +84,9 @@ setup(
     include_package_data=True,
     setup_requires=setup_requirements,
     install_requires=requirements,
+    extras_require={
+        "profile": ["pyinstrument"]
+    },
     tests_require=test_requirements,
     dependency_links=[],
     entry_points="""
@@ -19,18 +19,42 @@
 
 from __future__ import absolute_import
 
-from os.path import exists
+import pstats
+from glob import glob
+from os.path import exists, join
 from builtins import str
 
 import cobra
 import pytest
+from six import iteritems
 
 import memote.suite.api as api
+from memote.support.fingerprint import fingerprint
 from memote.utils import register_with
 
 MODEL_REGISTRY = dict()
 
 
+SUPERVISED_CASES = ["test_fast_growth_default", "test_blocked_reactions"]
+
+
+def _solves(result, name):
+    """Return the number of optimizations of all items of a test case."""
+    profile = result["tests"][name]["profile"]
+    if "solves" in profile:
+        return profile["solves"]
+    return sum(usage["solves"] for usage in profile.values())
+
+
+def _approx(data):
+    """Compare optimal values only up to the tolerance of the solver."""
+    if isinstance(data, float):
+        return pytest.approx(data)
+    if isinstance(data, dict):
+        return dict((key, _approx(value)) for key, value in iteritems(data))
+    return data
+
+
 @register_with(MODEL_REGISTRY)
 def complete_failure(base):
     met_a = cobra.Metabolite("atp_c")
@@ -86,6 +110,62 @@ def test_basic_report_file(model, tmpdir):
     # TODO: Perform some content checks here.
 
 
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_test_model_budgets(model, tmpdir):
+    """Expect supervised test cases to report what their process used."""
+    _, expected = api.test_model(model, results=True,
+                                 exclusive=SUPERVISED_CASES)
+    directory = str(tmpdir.join("profiles"))
+    _, result = api.test_model(
+        model, results=True, exclusive=SUPERVISED_CASES,
+        budgets={"default": 60}, profile="cprofile", profile_out=directory)
+    for name in SUPERVISED_CASES:
+        assert _solves(result, name) == _solves(expected, name) > 0
+    assert result["meta"]["lp_workspace"]["solves"] >= \
+        _solves(result, "test_fast_growth_default")
+    usage = result["tests"]["test_blocked_reactions"]["profile"]
+    assert usage["cpu_time"] > 0.25 * usage["wall_time"]
+    filenames = glob(join(directory, "*test_blocked_reactions.call.prof"))
+    assert len(filenames) == 1
+    assert any(func == "find_blocked_reactions"
+               for _, _, func in pstats.Stats(filenames[0]).stats)
+    # Only the supervised processes call the support functions.
+    with open(join(directory, "hot_functions.txt")) as file_h:
+        assert "memote.support" in file_h.read()
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_test_model_previous(model):
+    """Expect reused failures to determine the return code, too."""
+    expected_code, previous = api.test_model(model, results=True)
+    code, result = api.test_model(model, results=True, previous=previous)
+    assert code == expected_code
+    reused = result["meta"]["incremental"]["reused"]
+    assert len(reused) > 0
+    assert any(previous["tests"][name]["result"] == "failed"
+               for name in reused)
+    for name in reused:
+        for key in ("result", "data"):
+            assert result["tests"][name].get(key) == \
+                previous["tests"][name].get(key)
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_test_model_workers(model):
+    """Expect parallel workers to report the same as a serial run."""
+    expected_code, expected = api.test_model(model, results=True)
+    code, result = api.test_model(model, results=True, workers=2)
+    assert code == expected_code
+    assert len(result["meta"]["schedule"]) == 2
+    assert result["meta"]["lp_workspace"]["units"] == \
+        expected["meta"]["lp_workspace"]["units"]
+    assert set(result["tests"]) == set(expected["tests"])
+    for name, case in iteritems(expected["tests"]):
+        assert result["tests"][name].get("result") == case.get("result")
+        # The solvers of the workers start from other solutions.
+        assert result["tests"][name].get("data") == _approx(case.get("data"))
+
+
 @pytest.fixture(scope="module", params=["complete-failure"])
 def history_directory(request, tmpdir_factory):
     model = model_builder(request.param)
@@ -104,6 +184,9 @@ def test_history_report_file(history_directory, tmpdir):
     # TODO: Perform some content checks here.
 
 
-@pytest.mark.xfail(reason="TODO: Function not implemented yet.")
-def test_diff_report_file():
-    api.diff_report()
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_diff_report_file(model, tmpdir):
+    filename = str(tmpdir.join("index.html"))
+    results = {"fingerprints": fingerprint(model), "tests": dict()}
+    api.diff_report([results, results], filename)
+    assert exists(filename)
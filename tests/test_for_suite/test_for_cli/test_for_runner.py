@@ -19,12 +19,16 @@
 
 from __future__ import absolute_import
 
+import json
 from builtins import str
-from os.path import exists
+from os.path import exists, join
+from shutil import copyfile
 
+import git
 import pytest
 
-from memote.suite.cli.runner import cli
+from memote.suite.cli.runner import cli, _load_blob_model
+from memote.suite.results import load_result
 
 
 def test_cli(runner):
@@ -60,3 +64,71 @@ def test_run_output(runner, tmpdir):
     assert result.exit_code == 0
     assert exists(output)
     # TODO: Check complete template structure.
+
+
+@pytest.fixture(scope="function")
+def model_repo(model_file, tmpdir, monkeypatch):
+    """Provide a git repository whose second commit leaves the model alone."""
+    directory = str(tmpdir.mkdir("repo"))
+    repo = git.Repo.init(directory)
+    author = git.Actor("memote", "memote@example.com")
+    copyfile(model_file, join(directory, "model.xml.gz"))
+    repo.index.add(["model.xml.gz"])
+    first = repo.index.commit("feat: add model", author=author,
+                              committer=author)
+    with open(join(directory, "README"), "w") as file_h:
+        file_h.write("Nothing to see here.")
+    repo.index.add(["README"])
+    second = repo.index.commit("docs: add readme", author=author,
+                               committer=author)
+    results = tmpdir.mkdir("results")
+    with open(str(results.join("{}.json".format(first.hexsha))), "w") as \
+            file_h:
+        json.dump({"meta": {"commit_hash": first.hexsha}, "tests": {}},
+                  file_h)
+    monkeypatch.chdir(directory)
+    return repo, first, second, str(results)
+
+
+def test_history_reuse_unchanged(runner, model_repo):
+    """Expect results for an unchanged model file to be re-used."""
+    repo, first, second, results = model_repo
+    result = runner.invoke(cli, [
+        "history", "--yes", "--directory", results, "model.xml.gz"])
+    assert result.exit_code == 0
+    filename = join(results, "{}.json".format(second.hexsha))
+    assert exists(filename)
+    with open(filename) as file_h:
+        meta = json.load(file_h)["meta"]
+    assert meta["commit_hash"] == second.hexsha
+    assert repo.active_branch.commit == second
+
+
+def test_history_extension(runner, model_repo):
+    """Expect new results in the chosen format."""
+    repo, first, second, results = model_repo
+    result = runner.invoke(cli, [
+        "history", "--yes", "--directory", results, "--extension",
+        ".json.gz", "model.xml.gz"])
+    assert result.exit_code == 0
+    assert exists(join(results, "{}.json".format(first.hexsha)))
+    filename = join(results, "{}.json.gz".format(second.hexsha))
+    assert load_result(filename)["meta"]["commit_hash"] == second.hexsha
+
+
+def test_history_explicit_commits(runner, model_repo):
+    """Expect only the given commits to be considered."""
+    repo, first, second, results = model_repo
+    result = runner.invoke(cli, [
+        "history", "--yes", "--directory", results, "model.xml.gz",
+        first.hexsha])
+    assert result.exit_code == 0
+    assert not exists(join(results, "{}.json".format(second.hexsha)))
+
+
+def test_load_blob_model(model_repo):
+    """Expect the model to be read from git without a checkout."""
+    repo, first, second, results = model_repo
+    model = _load_blob_model(repo, first.hexsha, "model.xml.gz")
+    assert len(model.reactions) == 95
+    assert not repo.is_dirty()
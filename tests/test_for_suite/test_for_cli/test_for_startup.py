@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ensure that the command line interface starts up quickly."""
+
+from __future__ import absolute_import
+
+import subprocess
+import sys
+
+import pytest
+
+#: Packages that only individual subcommands need.
+HEAVY = ("cobra", "pytest", "git", "github", "travispy", "travis",
+         "cookiecutter", "ruamel", "memote.suite.api")
+
+
+def import_times(module):
+    """Return the cumulative import time in microseconds per module."""
+    process = subprocess.Popen(
+        [sys.executable, "-X", "importtime", "-c",
+         "import {}".format(module)],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    _, err = process.communicate()
+    assert process.returncode == 0, err.decode("utf-8")
+    times = dict()
+    for line in err.decode("utf-8").splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split(":", 1)[1].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7),
+                    reason="Requires '-X importtime'.")
+@pytest.mark.parametrize("module", [
+    "memote",
+    "memote.suite.cli.runner"
+])
+def test_lazy_imports(module):
+    """Expect heavy dependencies to be imported only by their subcommands."""
+    times = import_times(module)
+    assert module in times
+    loaded = [name for name in times
+              if any(name == pkg or name.startswith(pkg + ".")
+                     for pkg in HEAVY)]
+    assert loaded == []
@@ -17,6 +17,13 @@
 
 """Test the result collection plugin."""
 
+from __future__ import absolute_import
+
+import pytest
+
+from memote.suite import TEST_DIRECTORY
+from memote.suite.collect import ResultCollectionPlugin
+
 
 def test_store(testdir):
     """Make sure that the store fixture in the collect plugin works."""
@@ -35,3 +42,15 @@ def test_store(testdir):
 
     # check that the test passes
     result.assert_outcomes(passed=0)
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_collect_alone(model):
+    """Expect the suite to run without any of the other plugins."""
+    plugin = ResultCollectionPlugin(model, exclusive=["test_gam_in_biomass"])
+    pytest.main(["-q", "-p", "no:cacheprovider", TEST_DIRECTORY],
+                plugins=[plugin])
+    case = plugin.results["tests"]["test_gam_in_biomass"]
+    assert set(case["result"].values()) == {"passed"}
+    assert "profile" not in case
+    assert "lp_workspace" not in plugin.results["meta"]
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ensure the expected functioning of ``memote.suite.incremental``."""
+
+from __future__ import absolute_import
+
+import pytest
+
+import memote.support.consistency as consistency
+from memote.suite.incremental import Incremental, changed_parts, environment
+from memote.support.fingerprint import fingerprint
+from memote.utils import get_ids
+
+#: The parts of the model that ``test_blocked_reactions`` reads.
+BLOCKED = frozenset(["reactions.stoichiometry", "reactions.bounds",
+                     "metabolites.compartment", "reactions.annotation"])
+
+def mass_balance(model, incremental):
+    """Run the mass balance check like the test suite does."""
+    return incremental.update(
+        "test_reaction_mass_balance", "reactions",
+        lambda rxns: get_ids(consistency.find_mass_imbalanced_reactions(
+            model, rxns)))
+
+
+def previous_result(model):
+    """Return a result of a complete run of the mass balance check."""
+    fingerprints = fingerprint(model)
+    data = mass_balance(model, Incremental(model, fingerprints))
+    return {
+        "meta": environment(model),
+        "fingerprints": fingerprints,
+        "tests": {
+            "test_reaction_mass_balance": {"data": data, "result": "passed"},
+            "test_blocked_reactions": {"data": ["PFK"], "result": "failed"},
+            "test_fast_growth_default": {
+                "data": {"Biomass": 0.87}, "result": {"Biomass": "passed"}}
+        }
+    }
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_incremental_inactive(model):
+    """Expect everything to be computed without a previous result."""
+    incremental = Incremental(model, fingerprint(model))
+    assert not incremental.active
+    assert incremental.summary is None
+    assert incremental.reuse("test_blocked_reactions", BLOCKED) is None
+    assert mass_balance(model, incremental) == [
+        rxn.id for rxn in model.reactions
+        if rxn in consistency.find_mass_imbalanced_reactions(model)]
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_incremental_unchanged(model):
+    """Expect all previous data to be reused for the same model."""
+    previous = previous_result(model)
+    incremental = Incremental(model, fingerprint(model), previous)
+    assert incremental.active
+    assert not incremental.structure_changed
+    assert incremental.summary == dict(reactions=0, metabolites=0, genes=0,
+                                       structure_changed=False)
+    assert incremental.reuse("test_blocked_reactions", BLOCKED) == \
+        previous["tests"]["test_blocked_reactions"]
+    case = incremental.reuse(
+        "test_fast_growth_default",
+        frozenset(["reactions.stoichiometry", "reactions.bounds"]))
+    assert case["data"] == {"Biomass": 0.87}
+
+    def fail(components):
+        raise AssertionError("Nothing should be recomputed.")
+
+    assert incremental.update("test_reaction_mass_balance", "reactions",
+                              lambda rxns: fail(rxns) if rxns else []) == \
+        previous["tests"]["test_reaction_mass_balance"]["data"]
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_incremental_formula_change(model):
+    """Expect only reactions of a changed metabolite to be examined."""
+    previous = previous_result(model)
+    assert "PGI" not in previous["tests"]["test_reaction_mass_balance"]["data"]
+    met = model.metabolites.get_by_id("g6p_c")
+    met.formula = "C6H11O9P2"
+    incremental = Incremental(model, fingerprint(model), previous)
+    assert incremental.changed["metabolites"] == {"g6p_c"}
+    assert incremental.changed["reactions"] == set()
+    # Formulae do not affect the checks based on optimization.
+    assert not incremental.structure_changed
+    examined = list()
+
+    def compute(rxns):
+        examined.extend(rxns)
+        return get_ids(consistency.find_mass_imbalanced_reactions(
+            model, rxns))
+
+    data = incremental.update("test_reaction_mass_balance", "reactions",
+                              compute)
+    assert set(examined) == set(met.reactions)
+    assert "PGI" in data
+    assert data == mass_balance(model, Incremental(model, fingerprint(model)))
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_incremental_bounds_change(model):
+    """Expect global checks to be recomputed when bounds change."""
+    previous = previous_result(model)
+    model.reactions.PFK.bounds = (0, 10)
+    incremental = Incremental(model, fingerprint(model), previous)
+    assert incremental.changed["reactions"] == {"PFK"}
+    assert incremental.structure_changed
+    assert incremental.reuse("test_blocked_reactions", BLOCKED) is None
+
+
+def change_compartment(model):
+    """Move the metabolite of an exchange reaction into the cytosol."""
+    met = model.exchanges[0].metabolites.popitem()[0]
+    met.compartment = "c"
+
+
+def change_sbo_term(model):
+    """Annotate an exchange reaction as a transport reaction."""
+    model.exchanges[0].annotation["sbo"] = "SBO:0000185"
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+@pytest.mark.parametrize("change", [change_compartment, change_sbo_term])
+def test_incremental_boundary_change(model, change):
+    """Expect global checks to be recomputed when exchanges may differ."""
+    previous = previous_result(model)
+    change(model)
+    incremental = Incremental(model, fingerprint(model), previous)
+    assert not incremental.structure_changed
+    assert incremental.reuse("test_blocked_reactions", BLOCKED) is None
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_incremental_incompatible_version(model):
+    """Expect fingerprints of another version to be ignored."""
+    previous = previous_result(model)
+    previous["fingerprints"]["version"] = 0
+    incremental = Incremental(model, fingerprint(model), previous)
+    assert not incremental.active
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+@pytest.mark.parametrize("meta", [
+    {},
+    {"memote_version": "0.0.1"},
+    {"solver": "unknown"}
+], ids=["older", "version", "solver"])
+def test_incremental_different_environment(model, meta):
+    """Expect results of another memote version or solver to be ignored."""
+    previous = previous_result(model)
+    if meta:
+        previous["meta"].update(meta)
+    else:
+        del previous["meta"]
+    incremental = Incremental(model, fingerprint(model), previous)
+    assert not incremental.active
+    assert incremental.reuse("test_blocked_reactions", BLOCKED) is None
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_changed_parts(model):
+    """Expect only the parts that a change touches to be reported."""
+    before = fingerprint(model)
+    assert changed_parts(before, before) == set()
+    model.metabolites.get_by_id("g6p_c").formula = "C6H11O9P2"
+    assert changed_parts(before, fingerprint(model)) == {
+        "metabolites.formula"}
+    model.reactions.PFK.bounds = (0, 10)
+    assert changed_parts(before, fingerprint(model)) == {
+        "metabolites.formula", "reactions.bounds"}
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_incremental_reuse(model):
+    """Expect complete results to be reused if their dependencies hold."""
+    previous = previous_result(model)
+    model.metabolites.get_by_id("g6p_c").formula = "C6H11O9P2"
+    incremental = Incremental(model, fingerprint(model), previous)
+    assert incremental.reuse(
+        "test_blocked_reactions",
+        frozenset(["reactions.stoichiometry", "reactions.bounds"])) == \
+        previous["tests"]["test_blocked_reactions"]
+    assert incremental.reuse(
+        "test_reaction_mass_balance",
+        frozenset(["reactions.stoichiometry", "metabolites.formula"])) is None
+    # Only passed or failed results are reused.
+    previous["tests"]["test_blocked_reactions"]["result"] = "skipped"
+    assert incremental.reuse("test_blocked_reactions",
+                             frozenset(["reactions.bounds"])) is None
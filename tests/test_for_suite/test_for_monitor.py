@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ensure the expected functioning of ``memote.suite.monitor``."""
+
+from __future__ import absolute_import
+
+from collections import namedtuple
+
+import pytest
+from cobra import Model
+
+from memote.suite.monitor import ResourceMonitor
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_monitor_counts(model):
+    """Expect solves of the model and of its copies to be counted."""
+    interface = type(model.solver)
+    before = (vars(interface).get("optimize"), Model.copy)
+    monitor = ResourceMonitor(model)
+    with monitor.measure() as usage:
+        copy = model.copy()
+        model.slim_optimize()
+        copy.optimize()
+    assert usage["solves"] == 2
+    assert usage["copies"] == 1
+    assert usage["solve_time"] <= usage["wall_time"]
+    assert usage["cpu_time"] >= 0.0
+    assert usage["peak_rss_delta"] is None or usage["peak_rss_delta"] >= 0
+    assert (vars(interface).get("optimize"), Model.copy) == before
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_monitor_restores_on_error(model):
+    """Expect the original methods to be restored after an exception."""
+    interface = type(model.solver)
+    before = (vars(interface).get("optimize"), Model.copy)
+    with pytest.raises(RuntimeError):
+        with ResourceMonitor(model).measure():
+            raise RuntimeError("Test failed.")
+    assert (vars(interface).get("optimize"), Model.copy) == before
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_monitor_add_child(model):
+    """Expect the CPU time and peak memory of a child to be included."""
+    rusage = namedtuple("rusage", "ru_utime ru_stime ru_maxrss")
+    with ResourceMonitor(model).measure() as usage:
+        ResourceMonitor.add_child(usage, rusage(2.0, 1.0, 2 ** 40))
+    assert usage["cpu_time"] >= 3.0
+    assert "child_peak_rss" not in usage
+    assert usage["peak_rss_delta"] is None or \
+        usage["peak_rss_delta"] >= 2 ** 40
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ensure the expected functioning of ``memote.suite.profiling``."""
+
+from __future__ import absolute_import
+
+import pstats
+from os.path import exists, join
+
+import pytest
+
+import memote.support.consistency as consistency
+from memote.suite.profiling import ItemProfiler, categorize
+
+
+@pytest.mark.parametrize("location, category", [
+    ("/site-packages/memote/support/helpers.py:10(find_biomass_reaction)",
+     "memote.support"),
+    ("/site-packages/memote/suite/collect.py:10(results)", "memote"),
+    ("/site-packages/cobra/core/model.py:10(copy)", "cobra"),
+    ("/site-packages/optlang/interface.py:10(optimize)", "optlang"),
+    ("/site-packages/swiglpk/swiglpk.py:10(glp_simplex)", "solver"),
+    ("<built-in method builtins.sorted>", "other")
+])
+def test_categorize(location, category):
+    """Expect functions to be attributed to their package."""
+    assert categorize(location) == category
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_item_profiler(model, tmpdir):
+    """Expect one profile per item and a summary of hot functions."""
+    directory = str(tmpdir.join("profiles"))
+    profiler = ItemProfiler("cprofile", directory, top=5)
+    with profiler.profile("test_consistency.py::test_stoichiometric[model]"):
+        consistency.check_stoichiometric_consistency(model)
+    filename = join(directory, "test_consistency.test_stoichiometric[model]"
+                               ".prof")
+    assert exists(filename)
+    assert pstats.Stats(filename).total_calls > 0
+    rows, categories = profiler.summary()
+    assert len(rows) == 5
+    assert categories["memote.support"] > 0
+    summary = profiler.write_summary()
+    with open(summary) as file_h:
+        assert "memote.support" in file_h.read()
+
+
+def test_item_profiler_merge(tmpdir):
+    """Expect the statistics of another profiler to be added."""
+    first = ItemProfiler("cprofile", str(tmpdir))
+    second = ItemProfiler("cprofile", str(tmpdir))
+    with second.profile("test_sum"):
+        sum(range(10))
+    first.merge(second.functions)
+    first.merge(second.functions)
+    assert set(first.functions) == set(second.functions)
+    assert all(stats[0] == 2 * second.functions[location][0]
+               for location, stats in first.functions.items())
+
+
+def test_item_profiler_functions(tmpdir):
+    """Expect each profile to yield its own statistics."""
+    profiler = ItemProfiler("cprofile", str(tmpdir))
+    with profiler.profile("test_first") as first:
+        sum(range(10))
+    with profiler.profile("test_second") as second:
+        sorted(range(10))
+    assert len(first) > 0
+    assert not any("sorted" in location for location in first)
+    assert any("sorted" in location for location in second)
+    assert set(profiler.functions) == set(first) | set(second)
+
+
+def test_item_profiler_unknown(tmpdir):
+    """Expect an unknown profiler to be rejected."""
+    with pytest.raises(ValueError):
+        ItemProfiler("yappi", str(tmpdir))
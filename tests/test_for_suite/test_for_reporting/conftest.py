@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import
+
+from builtins import str
+from copy import deepcopy
+from os.path import dirname, join, pardir
+
+import pytest
+from cobra.io import read_sbml_model
+
+import memote.suite.api as api
+from memote.suite.results import dump_result
+
+#: Inexpensive test cases whose results the reports use.
+SUITE_CASES = ["test_genes_presence", "test_metabolites_formula_presence",
+               "test_reaction_mass_balance", "test_biomass_presence",
+               "test_biomass_consistency", "test_gam_in_biomass",
+               "test_enzyme_complex_presence"]
+
+
+@pytest.fixture(scope="session")
+def suite_result():
+    """Collect the results of a few test cases for the textbook model."""
+    model = read_sbml_model(join(dirname(__file__), pardir, pardir, "data",
+                                 "EcoliCore.xml.gz"))
+    _, result = api.test_model(model, results=True, exclusive=SUITE_CASES)
+    return result
+
+
+def result_document(result, num, commit):
+    """Vary a result of the suite as if it was found in a history."""
+    doc = deepcopy(result)
+    doc["meta"]["commit_hash"] = commit
+    doc["meta"]["timestamp"] = "2017-11-{:02d} 12:00:00".format(num + 1)
+    tests = doc["tests"]
+    tests["test_genes_presence"]["data"] = \
+        tests["test_genes_presence"]["data"][:num]
+    tests["test_metabolites_formula_presence"]["data"] = [
+        "M{}".format(i) for i in range(num)]
+    tests["test_reaction_mass_balance"]["data"] = [
+        "R{}".format(i) for i in range(num)]
+    return doc
+
+
+@pytest.fixture(scope="function")
+def result_files(tmpdir, suite_result):
+    """Provide a directory of result files from a fake history."""
+    directory = tmpdir.mkdir("results")
+    files = list()
+    for num in range(3):
+        commit = "{:040x}".format(num)
+        filename = str(directory.join("{}.json".format(commit)))
+        dump_result(result_document(suite_result, num, commit), filename)
+        files.append(filename)
+    return files
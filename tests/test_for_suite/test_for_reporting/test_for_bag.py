@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ensure the expected functioning of ``memote.suite.reporting.bag``."""
+
+from __future__ import absolute_import
+
+import pytest
+
+from memote.suite.reporting.bag import ResultBagWrapper
+
+
+@pytest.mark.parametrize("npartitions", [1, 3])
+def test_get_basic_dataframe(result_files, npartitions):
+    """Expect the same result regardless of the number of partitions."""
+    bag = ResultBagWrapper(result_files, npartitions=npartitions)
+    bag.build_index()
+    df = bag.get_basic_dataframe()
+    assert df["num_genes"].tolist() == [0, 1, 2]
+    assert df["num_metabolites_no_formula"].tolist() == [0, 1, 2]
+
+
+@pytest.mark.parametrize("scheduler", ["sync", "processes"])
+def test_scheduler(result_files, scheduler):
+    """Expect worker processes to extract the same data as one thread."""
+    bag = ResultBagWrapper(result_files, npartitions=2, scheduler=scheduler)
+    bag.build_index()
+    df = bag.get_consistency_dataframe()
+    assert df["imbalanced_reactions"].tolist() == [0, 1, 2]
+    assert df.index.tolist() == ["{:040x}".format(num) for num in range(3)]
+    assert len(bag.get_model_ids()) == 1
+
+
+@pytest.mark.parametrize("npartitions", [1, 3])
+def test_get_biomass_dataframe(result_files, npartitions):
+    """Expect one row per biomass reaction and commit."""
+    bag = ResultBagWrapper(result_files, npartitions=npartitions)
+    bag.build_index()
+    df = bag.get_biomass_dataframe()
+    assert len(df) == 3
+
+
+def test_missing_files(tmpdir):
+    """Expect an error if none of the files exist."""
+    with pytest.raises(RuntimeError):
+        ResultBagWrapper([str(tmpdir.join("missing.json"))])
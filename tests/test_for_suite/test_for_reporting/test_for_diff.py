@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ensure the expected functioning of the diff report."""
+
+from __future__ import absolute_import
+
+from builtins import str
+from copy import deepcopy
+
+import pytest
+
+from memote.suite.results import dump_result, load_result
+from memote.support.fingerprint import fingerprint
+from memote.suite.reporting.reports import DiffReport
+
+
+def result(model, unbalanced, growth):
+    """Create a minimal result document of a model."""
+    return {
+        "fingerprints": fingerprint(model),
+        "tests": {
+            "test_reaction_mass_balance": {
+                "title": "Mass Balance", "data": unbalanced,
+                "metric": len(unbalanced) / len(model.reactions),
+                "result": "failed" if unbalanced else "passed"},
+            "test_fast_growth_default": {
+                "title": "Growth", "data": {"Biomass": growth},
+                "result": {"Biomass": "passed"}},
+            "test_model_id_presence": {
+                "title": "Model ID", "data": True, "result": "passed"}
+        }
+    }
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_diff_report(model):
+    """Expect only changed components and test results to be reported."""
+    first = result(model, ["PGI"], 0.87)
+    other = model.copy()
+    other.reactions.PFK.bounds = (0, 10)
+    other.remove_reactions([other.reactions.PGK])
+    second = result(other, ["PGI", "PFK"], 0.5)
+    report = DiffReport([first, second], labels=["a.xml", "b.xml"])
+    assert report.components["reactions"] == {
+        "added": [], "removed": ["PGK"], "changed": ["PFK"]}
+    assert report.components["metabolites"]["changed"] == []
+    assert report.components["bounds"]
+    assert not report.components["objective"]
+    assert [entry["test"] for entry in report.tests] == [
+        "test_fast_growth_default", "test_reaction_mass_balance"]
+    balance = report.tests[1]
+    assert balance["added"] == ["PFK"]
+    assert balance["removed"] == []
+    html = report.render_html()
+    assert "PGK" in html
+    assert "Model ID" not in html
+
+
+def test_diff_report_loaded_results(suite_result, tmpdir):
+    """Expect results loaded from files to be compared."""
+    first = deepcopy(suite_result)
+    first["tests"]["test_genes_presence"]["metric"] = float("nan")
+    second = deepcopy(first)
+    complexes = second["tests"]["test_enzyme_complex_presence"]["data"]
+    second["tests"]["test_enzyme_complex_presence"]["data"] = complexes[1:]
+    loaded = list()
+    for index, res in enumerate([first, second]):
+        filename = str(tmpdir.join("{}.json".format(index)))
+        dump_result(res, filename)
+        loaded.append(load_result(filename))
+    complexes = loaded[0]["tests"]["test_enzyme_complex_presence"]["data"]
+    assert isinstance(complexes[0], list)
+    report = DiffReport(loaded)
+    assert [entry["test"] for entry in report.tests] == [
+        "test_enzyme_complex_presence"]
+    assert report.tests[0]["removed"] == [complexes[0]]
+    assert report.tests[0]["added"] == []
+    assert "Enzyme Complexes" in report.render_html()
+
+
+def test_diff_report_without_fingerprints():
+    """Expect test results to be compared even without fingerprints."""
+    report = DiffReport([{"tests": {}}, {"tests": {}}])
+    assert report.components is None
+    assert report.tests == []
+    assert "lacks a compatible model fingerprint" in report.render_html()
+
+
+def test_diff_report_two_results():
+    """Expect exactly two results to be required."""
+    with pytest.raises(ValueError):
+        DiffReport([{}])
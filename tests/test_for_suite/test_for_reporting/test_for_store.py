@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ensure the expected functioning of ``memote.suite.reporting.store``."""
+
+from __future__ import absolute_import
+
+import os
+from builtins import str
+
+import pytest
+
+from memote.suite.results import load_result, dump_result
+from memote.suite.reporting.store import ResultStore
+
+
+@pytest.fixture(scope="function")
+def store(tmpdir):
+    return ResultStore(str(tmpdir.join("store")), batch_size=2)
+
+
+def test_ingest_once(store, result_files):
+    """Expect each result file to be ingested exactly once."""
+    assert store.ingest(result_files) == 3
+    assert store.ingest(result_files) == 0
+
+
+def test_ingest_changed(store, result_files):
+    """Expect rewritten result files to be ingested again and take over."""
+    store.ingest(result_files)
+    result = load_result(result_files[1])
+    biomass_ids = result["tests"]["test_biomass_presence"]["data"]
+    result["tests"]["test_genes_presence"]["data"] = [
+        "G{}".format(i) for i in range(42)]
+    result["tests"]["test_biomass_presence"]["data"] = ["BIOMASS2"]
+    dump_result(result, result_files[1])
+    info = os.stat(result_files[1])
+    os.utime(result_files[1], (info.st_atime, info.st_mtime + 10))
+    assert store.ingest(result_files) == 1
+    store.build_index()
+    assert store.get_basic_dataframe(["num_genes"])["num_genes"].tolist() == \
+        [0, 42, 2]
+    assert store.get_biomass_dataframe(["biomass_ids"])[
+        "biomass_ids"].tolist() == biomass_ids + ["BIOMASS2"] + biomass_ids
+
+
+def test_ingest_missing(store, result_files):
+    """Expect missing files to be ignored."""
+    assert store.ingest(result_files + ["missing.json"]) == 3
+
+
+def test_get_basic_dataframe(store, result_files):
+    """Expect only the requested columns joined with the index."""
+    store.ingest(result_files)
+    store.build_index()
+    df = store.get_basic_dataframe(["num_genes"])
+    assert list(df.columns) == ["timestamp", "commit_hash", "num_genes"]
+    assert df["num_genes"].tolist() == [0, 1, 2]
+
+
+def test_get_biomass_dataframe(store, result_files):
+    """Expect one row per biomass reaction and commit."""
+    store.ingest(result_files)
+    store.build_index()
+    df = store.get_biomass_dataframe()
+    assert len(df) == 3
+    assert df["biomass_ids"].unique().tolist() == load_result(
+        result_files[0])["tests"]["test_biomass_presence"]["data"]
+    assert df["gam_in_biomass"].all()
+
+
+def test_build_index_subset(store, result_files):
+    """Expect the index to be restricted to the given commits."""
+    store.ingest(result_files)
+    store.build_index(["{:040x}".format(1)])
+    df = store.get_consistency_dataframe(["imbalanced_reactions"])
+    assert df["imbalanced_reactions"].tolist() == [1]
+
+
+def test_missing_index(store):
+    """Expect an error when the index was not built."""
+    with pytest.raises(ValueError):
+        store.get_basic_dataframe()
+
+
+def test_ingest_compressed(store, result_files):
+    """Expect compressed results to be ingested."""
+    compressed = list()
+    for filename in result_files:
+        compressed.append(filename + ".gz")
+        dump_result(load_result(filename), compressed[-1])
+    assert store.ingest(compressed) == 3
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ensure the expected functioning of ``memote.suite.results``."""
+
+from __future__ import absolute_import
+
+from builtins import str
+from os.path import getsize
+
+import pytest
+
+import memote.suite.results as results
+
+RESULT = {
+    "meta": {"commit_hash": "abc", "commit_author": u"Jos\u00e9"},
+    "tests": {"test_reactions_presence": {
+        "data": ["R{}".format(i) for i in range(1000)]}}
+}
+
+
+@pytest.mark.parametrize("extension", [".json", ".json.gz"])
+def test_round_trip(tmpdir, extension):
+    """Expect a result to be read back unchanged."""
+    filename = str(tmpdir.join("result" + extension))
+    results.dump_result(RESULT, filename)
+    assert results.load_result(filename) == RESULT
+
+
+@pytest.mark.parametrize("extension", [".json", ".json.gz"])
+def test_dump_ascii(tmpdir, extension):
+    """Expect non-ASCII characters to be escaped in the written bytes."""
+    filename = str(tmpdir.join("result" + extension))
+    results.dump_result(RESULT, filename)
+    with results._open(filename, "r") as file_h:
+        content = file_h.read()
+    assert b"Jos\\u00e9" in content
+
+
+def test_compression(tmpdir):
+    """Expect the compressed format to be smaller."""
+    plain = str(tmpdir.join("result.json"))
+    compressed = str(tmpdir.join("result.json.gz"))
+    results.dump_result(RESULT, plain)
+    results.dump_result(RESULT, compressed)
+    assert getsize(compressed) < getsize(plain)
+
+
+@pytest.mark.parametrize("existing, expected", [
+    (None, "result.json"),
+    ("result.json.gz", "result.json.gz"),
+    ("result.json", "result.json")
+])
+def test_find_result(tmpdir, existing, expected):
+    """Expect existing results to be found in either format."""
+    if existing is not None:
+        results.dump_result(RESULT, str(tmpdir.join(existing)))
+    assert results.find_result(str(tmpdir.join("result"))) == str(
+        tmpdir.join(expected))
+
+
+def test_find_result_extension(tmpdir):
+    """Expect the given extension for a new result."""
+    assert results.find_result(str(tmpdir.join("result")), ".json.gz") == \
+        str(tmpdir.join("result.json.gz"))
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ensure the expected functioning of ``memote.suite.schedule``."""
+
+from __future__ import absolute_import
+
+import os
+
+import pytest
+
+from memote.suite.schedule import durations, estimate, fork_workers, lpt
+from memote.suite.supervise import SUPERVISED
+
+
+def test_durations():
+    """Expect mean durations summed over parameters."""
+    results = [
+        {"tests": {"test_a": {"duration": 2.0},
+                   "test_b": {"duration": {"x": 1.0, "y": 2.0}}}},
+        {"tests": {"test_a": {"duration": 4.0},
+                   "test_c": {"result": "skipped"}}},
+        {}
+    ]
+    assert durations(results) == {"test_a": 3.0, "test_b": 3.0}
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_estimate(model):
+    """Expect tests with a solver and more parameters to cost more."""
+    local = estimate(model)
+    assert local > 0.0
+    assert estimate(model, solver=True) > local
+    assert estimate(model, items=3) == pytest.approx(3 * local)
+
+
+@pytest.mark.parametrize("costs, workers, expected", [
+    ({"a": 7, "b": 5, "c": 4, "d": 3, "e": 1}, 2, [["a", "d"],
+                                                   ["b", "c", "e"]]),
+    ({"a": 1, "b": 1, "c": 1}, 3, [["a"], ["b"], ["c"]]),
+    ({"a": 1}, 3, [["a"], [], []]),
+    ({}, 2, [[], []])
+])
+def test_lpt(costs, workers, expected):
+    """Expect the longest jobs to go to the least busy worker first."""
+    assert lpt(costs, workers) == expected
+
+
+@pytest.mark.skipif(not SUPERVISED, reason="Requires forking processes.")
+def test_fork_workers():
+    """Expect the messages of all workers and their status."""
+    received = list()
+
+    def run(task, send):
+        if task == "fail":
+            raise RuntimeError("Expected failure.")
+        for number in task:
+            send((number, os.getpid()))
+
+    finished = fork_workers([[1, 2], [3], "fail"], run,
+                            lambda index, msg: received.append((index, msg)))
+    assert finished == [True, True, False]
+    assert sorted((index, msg[0]) for index, msg in received) == [
+        (0, 1), (0, 2), (1, 3)]
+    # The tasks ran in other processes.
+    assert os.getpid() not in set(msg[1] for _, msg in received)
+
+
+@pytest.mark.skipif(not SUPERVISED, reason="Requires forking processes.")
+def test_fork_workers_interleaved():
+    """Expect a streaming worker not to hold up the messages of others."""
+    received = list()
+
+    def run(task, send):
+        for number in range(task):
+            send((number, "x" * 100000))
+
+    finished = fork_workers([200, 1], run,
+                            lambda index, msg: received.append(index))
+    assert finished == [True, True]
+    assert received.count(0) == 200
+    assert received.index(1) < len(received) - 1
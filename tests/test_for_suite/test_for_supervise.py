@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ensure the expected functioning of ``memote.suite.supervise``."""
+
+from __future__ import absolute_import
+
+import os
+import time
+from collections import namedtuple
+
+import pytest
+
+from memote.suite.collect import ResultCollectionPlugin
+from memote.suite.supervise import (
+    SUPERVISED, BudgetExceeded, BudgetPlugin, supervise)
+
+pytestmark = pytest.mark.skipif(not SUPERVISED,
+                                reason="Requires forking processes.")
+
+Item = namedtuple("Item", ["obj", "nodeid"])
+
+
+def dummy():
+    """Stand in for a test case of the suite."""
+    pass
+
+
+def test_supervise_finished():
+    """Expect the collected state of a finished function."""
+    state = dict()
+    finished, error, result, _ = supervise(
+        lambda: state.update(data=[1, 2]), 10.0, lambda: state)
+    assert finished
+    assert error is None
+    assert result == {"data": [1, 2]}
+    # The function ran in a child process.
+    assert state == {}
+
+
+def test_supervise_error():
+    """Expect the error of a failing function to be transferred."""
+    def fail():
+        assert False, "Expected failure."
+
+    finished, error, _, _ = supervise(fail, 10.0)
+    assert finished
+    assert isinstance(error, AssertionError)
+    assert "Expected failure." in str(error)
+
+
+def test_supervise_skip():
+    """Expect a skipped function to be recognized as such."""
+    finished, error, _, _ = supervise(lambda: pytest.skip("Skipped."), 10.0)
+    assert finished
+    with pytest.raises(pytest.skip.Exception):
+        raise error
+
+
+def test_supervise_timeout():
+    """Expect a stopped function to hand back its partial state."""
+    state = dict(data=list())
+
+    def count():
+        while True:
+            state["data"].append(len(state["data"]))
+            time.sleep(0.01)
+
+    start = time.time()
+    finished, error, result, _ = supervise(count, 0.3, lambda: state)
+    assert time.time() - start < 5.0
+    assert not finished
+    assert isinstance(error, BudgetExceeded)
+    assert len(result["data"]) > 0
+
+
+def test_supervise_unresponsive():
+    """Expect an unresponsive child to be killed after the grace period."""
+    def ignore():
+        while True:
+            try:
+                time.sleep(0.01)
+            except BudgetExceeded:
+                pass
+
+    finished, error, result, _ = supervise(ignore, 0.1, grace=0.2)
+    assert not finished
+    assert isinstance(error, BudgetExceeded)
+    assert result is None
+
+
+
+def test_supervise_rusage():
+    """Expect the CPU time of the child process to be reported."""
+    def spin():
+        end = sum(os.times()[:2]) + 0.2
+        while sum(os.times()[:2]) < end:
+            pass
+
+    finished, _, _, rusage = supervise(spin, 10.0)
+    assert finished
+    assert rusage.ru_utime + rusage.ru_stime > 0.1
+    assert rusage.ru_maxrss > 0
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+@pytest.mark.parametrize("budgets, reason", [
+    ({"dummy": 0}, "The time budget of the test case is zero."),
+    ({"default": 0}, "The default time budget of test cases is zero."),
+    ({"total": 0}, "The total time budget is exhausted."),
+    ({"total": 0, "dummy": 0}, "The time budget of the test case is zero.")
+])
+def test_budget_skip(model, budgets, reason):
+    """Expect a zero budget to skip a test case with its origin."""
+    plugin = BudgetPlugin(ResultCollectionPlugin(model), budgets)
+    with pytest.raises(pytest.skip.Exception) as err:
+        plugin.pytest_runtest_call(Item(dummy, "test_for_supervise.py::dummy"))
+    assert str(err.value) == reason
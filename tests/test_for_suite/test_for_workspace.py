@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ensure the expected functioning of ``memote.suite.workspace``."""
+
+from __future__ import absolute_import
+
+import pytest
+
+from memote.suite.workspace import LPWorkspace
+
+GLUCOSE = "EX_glc_LPAREN_e_RPAREN_"
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_workspace_reverts_changes(model):
+    """Expect every test unit to see the unchanged model."""
+    workspace = LPWorkspace(model)
+    growth = workspace.model.slim_optimize()
+    with workspace.track() as shared:
+        shared.reactions.get_by_id(GLUCOSE).lower_bound = 0
+        shared.objective = "ATPM"
+        shared.slim_optimize()
+    with workspace.track() as shared:
+        assert shared is workspace.model
+        assert shared.reactions.get_by_id(GLUCOSE).lower_bound < 0
+        assert shared.slim_optimize() == pytest.approx(growth)
+    summary = workspace.summary
+    assert summary["units"] == 2
+    assert summary["copies"] == 1
+    assert summary["time_saved"] == pytest.approx(workspace.copy_time)
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_workspace_records_usage(model):
+    """Expect the totals to add up the measured optimizations."""
+    workspace = LPWorkspace(model)
+    workspace.record({"solves": 2, "solve_time": 0.5})
+    workspace.record({"solves": 1, "solve_time": 0.25})
+    assert workspace.summary["solves"] == 3
+    assert workspace.summary["solve_time"] == pytest.approx(0.75)
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+@pytest.mark.parametrize("change", [
+    lambda solver: setattr(
+        solver.variables[GLUCOSE], "ub", 0),
+    lambda solver: solver.remove(solver.constraints[0]),
+    lambda solver: setattr(solver.objective, "direction", "min"),
+    lambda solver: setattr(solver.configuration, "presolve", True)
+], ids=["variable", "constraint", "direction", "configuration"])
+def test_workspace_copies_after_leak(model, change):
+    """Expect a new copy when a unit changes the solver directly."""
+    workspace = LPWorkspace(model)
+    growth = workspace.model.slim_optimize()
+    leaky = workspace.model
+    with workspace.track("leaky") as shared:
+        change(shared.solver)
+    assert workspace.model is not leaky
+    assert workspace.summary["copies"] == 2
+    with workspace.track() as shared:
+        assert shared.slim_optimize() == pytest.approx(growth)
+    assert workspace.summary["copies"] == 2
@@ -23,6 +23,7 @@ from builtins import dict
 
 import cobra
 import pytest
+from six import iteritems
 
 import memote.support.annotation as annotation
 from memote.utils import register_with
@@ -283,3 +284,81 @@ def test_generate_component_id_namespace_overview(model, namespace, num,
         model, components)
     distribution = overview.sum()
     assert distribution[namespace] == num
+
+
+@pytest.mark.parametrize("model, components", [
+    ("met_each_present", "metabolites"),
+    ("met_broken_id", "metabolites"),
+    ("met_each_absent", "metabolites"),
+    ("rxn_each_present", "reactions"),
+    ("rxn_broken_id", "reactions"),
+    ("no_annotations", "reactions")
+], indirect=["model"])
+def test_generate_component_annotation_miriam_match_overview(model,
+                                                             components):
+    """Expect the same faulty components as when checking each database."""
+    elements = getattr(model, components)
+    overview = annotation.generate_component_annotation_miriam_match_overview(
+        elements, components)
+    for db, faulty in iteritems(overview):
+        assert faulty == annotation.generate_component_annotation_miriam_match(
+            elements, components, db)
+
+
+@pytest.mark.parametrize("model, components", [
+    ("met_each_present", "metabolites"),
+    ("met_broken_id", "metabolites"),
+    ("met_each_absent", "metabolites"),
+    ("met_annotations", "metabolites"),
+    ("rxn_each_present", "reactions"),
+    ("rxn_broken_id", "reactions"),
+    ("rxn_each_absent", "reactions"),
+    ("no_annotations", "reactions")
+], indirect=["model"])
+def test_annotation_matrix(model, components):
+    """Expect the matrix slices to equal the per-database results."""
+    elements = getattr(model, components)
+    matrix = annotation.AnnotationMatrix(elements, components)
+    assert matrix.presence.shape == matrix.validity.shape
+    assert matrix.presence.shape[0] == len(elements)
+    assert not (matrix.validity & ~matrix.presence).any().any()
+    for db in matrix.presence.columns:
+        assert matrix.missing(db) == \
+            annotation.generate_component_annotation_overview(elements, db)
+        assert matrix.faulty(db) == \
+            annotation.generate_component_annotation_miriam_match(
+                elements, components, db)
+
+
+@pytest.mark.parametrize("identifier, expected", [
+    ("META:PYRUVATE", ["biocyc"]),
+    ("MNXM23", ["metanetx.chemical", "bigg.metabolite"]),
+    ("pyr", ["bigg.metabolite"]),
+    ("CHEBI:15361", ["chebi"]),
+    ("", [])
+])
+def test_namespace_matcher(identifier, expected):
+    """Expect biocyc to only match when no other namespace does."""
+    matcher = annotation.METABOLITE_NAMESPACES
+    row = matcher.match([identifier])[0]
+    assert [db for db, hit in zip(matcher.databases, row) if hit] == expected
+
+
+@pytest.mark.parametrize("patterns", [
+    annotation.METABOLITE_ANNOTATIONS,
+    annotation.REACTION_ANNOTATIONS
+])
+def test_match_all(patterns):
+    """Expect the vectorized match to equal Python's for every pattern."""
+    values = [
+        u"12345", u"12345\n", u"١٢٣٤٥", u"R00200",
+        u"MNXR12", u"MNXM23", u"ACALD_c", u"acaldé", u"1.1.1.1",
+        u"1.-.-.-", u"1.2.3.n4", u"1.1.1.1\n", u"C00022", u"cpd00020",
+        u"BQJCRHHNABKAKU-KBQPJGBKSA-N", u"CHEBI:15361", u"CHEBI:15361\n",
+        u"HMDB00243", u"R-HSA-12345-1", u"REACT_12.1", u"META:PYRUVATE",
+        u"CHEBI", u"", u" 123", u"123 "
+    ]
+    for db, pattern in iteritems(patterns):
+        expected = [pattern.match(value) is not None for value in values]
+        assert annotation._match_all(values, pattern).tolist() == expected, \
+            db
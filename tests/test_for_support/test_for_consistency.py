@@ -20,9 +20,11 @@
 from __future__ import absolute_import
 
 import cobra
+import pandas as pd
 import pytest
 
 import memote.support.consistency as consistency
+import memote.support.consistency_helpers as con_helpers
 from memote.utils import register_with
 
 MODEL_REGISTRY = dict()
@@ -566,6 +568,42 @@ def test_find_mass_imbalanced_reactions(model, num):
     assert len(reactions) == num
 
 
+@pytest.mark.parametrize("model, imbalance", [
+    ("all_balanced", {}),
+    ("mass_imbalanced", {"C": 1, "H": 1, "O": 1, "P": 1, "N": 1, "S": 1})
+], indirect=["model"])
+def test_find_element_imbalances(model, imbalance):
+    """Expect only the imbalanced elements per reaction."""
+    result = consistency.find_element_imbalances(model, model.reactions)
+    assert result == {"RA1": imbalance}
+
+
+@pytest.mark.parametrize("model, imbalance", [
+    ("all_balanced", {}),
+    ("mass_imbalanced", {"C": 1, "H": 1, "O": 1, "P": 1, "N": 1, "S": 1}),
+    ("met_no_formula", {"C": 2, "H": 2, "O": 2, "P": 2, "N": 2, "S": 2})
+], indirect=["model"])
+def test_mass_imbalance(model, imbalance):
+    """Expect the net amount of each element to be computed."""
+    table, known = con_helpers.mass_imbalance(model.reactions)
+    assert known.all()
+    assert table.loc["RA1"][table.loc["RA1"] != 0].to_dict() == imbalance
+
+
+@pytest.mark.parametrize("model, charge", [
+    ("all_balanced", 0),
+    ("charge_imbalanced", -1),
+    ("met_no_charge", None)
+], indirect=["model"])
+def test_charge_imbalance(model, charge):
+    """Expect the net charge to be computed."""
+    result = con_helpers.charge_imbalance(model.reactions)["RA1"]
+    if charge is None:
+        assert pd.isnull(result)
+    else:
+        assert result == charge
+
+
 @pytest.mark.parametrize("model, num", [
     ("free_reactions", 0),
     ("blocked_reactions", 2),
@@ -619,3 +657,17 @@ def test_find_disconnected(model, num):
     """Expect the appropriate amount of disconnected to be found."""
     disconnected = consistency.find_disconnected(model)
     assert len(disconnected) == num
+
+
+@pytest.mark.parametrize("model, orphans, deadends, disconnected", [
+    ("gap_model", ["a_c"], ["b_c", "c_c"], ["a_e"]),
+    ("gapfilled_model", [], [], []),
+    ("reversible_gap", [], ["c_c"], [])
+], indirect=["model"])
+def test_find_metabolite_connectivity_issues(model, orphans, deadends,
+                                             disconnected):
+    """Expect all three classifications to be computed together."""
+    issues = consistency.find_metabolite_connectivity_issues(model)
+    assert sorted(met.id for met in issues["orphans"]) == orphans
+    assert sorted(met.id for met in issues["deadends"]) == deadends
+    assert sorted(met.id for met in issues["disconnected"]) == disconnected
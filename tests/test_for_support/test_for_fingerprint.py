@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ensure the expected functioning of ``memote.support.fingerprint``."""
+
+from __future__ import absolute_import
+
+import cobra
+import pytest
+from cobra.util.solver import linear_reaction_coefficients
+from six import iteritems
+
+import memote.support.fingerprint as fp
+
+
+def reordered(model):
+    """Return a copy with components and annotations in reverse order."""
+    copy = cobra.Model(model.id)
+    for met in reversed(model.metabolites):
+        new = met.copy()
+        new.annotation = dict(reversed(list(iteritems(met.annotation))))
+        copy.add_metabolites([new])
+    reactions = list()
+    for rxn in reversed(model.reactions):
+        new = cobra.Reaction(rxn.id, name=rxn.name,
+                             lower_bound=rxn.lower_bound,
+                             upper_bound=rxn.upper_bound)
+        new.annotation = dict(reversed(list(iteritems(rxn.annotation))))
+        reactions.append((new, rxn))
+    copy.add_reactions([new for new, _ in reactions])
+    for new, rxn in reactions:
+        new.add_metabolites(dict(
+            (copy.metabolites.get_by_id(met.id), coef)
+            for met, coef in reversed(list(iteritems(rxn.metabolites)))))
+        new.gene_reaction_rule = rxn.gene_reaction_rule
+    copy.objective = dict(
+        (copy.reactions.get_by_id(rxn.id), coef) for rxn, coef in
+        iteritems(linear_reaction_coefficients(model)))
+    return copy
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_fingerprint_stable(model):
+    """Expect the fingerprint to only depend on the model content."""
+    assert fp.fingerprint(model) == fp.fingerprint(model.copy())
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_fingerprint_order_independent(model):
+    """Expect the order of components and their entries not to matter."""
+    expected = fp.fingerprint(model)
+    result = fp.fingerprint(reordered(model))
+    for kind in fp.ASPECTS:
+        assert result[kind] == expected[kind]
+    assert result["aspects"] == expected["aspects"]
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_fingerprint_annotation_lists(model):
+    """Expect the order of identifiers in an annotation not to matter."""
+    met = model.metabolites.g6p_c
+    met.annotation["kegg.compound"] = ["C00092", "C00668"]
+    expected = fp.fingerprint(model)
+    met.annotation["kegg.compound"] = ["C00668", "C00092"]
+    assert fp.fingerprint(model) == expected
+    met.annotation["kegg.compound"] = ["C00668"]
+    assert fp.fingerprint(model) != expected
+
+
+@pytest.mark.parametrize("rule_a, rule_b, equal", [
+    ("b1 and b2", "b2 and b1", True),
+    ("(b1 or b2) or b3", "b3 or (b2 or b1)", True),
+    ("b1 and (b2 or b3)", "(b3 or b2) and b1", True),
+    ("b1 and b2", "b1 or b2", False),
+    ("b1 and (b2 or b3)", "(b1 and b2) or b3", False)
+])
+def test_rule_canonical(rule_a, rule_b, equal):
+    """Expect equivalent orderings of rules to share a hash."""
+    hashes = list()
+    for rule in (rule_a, rule_b):
+        model = cobra.Model()
+        rxn = cobra.Reaction("R1")
+        model.add_reactions([rxn])
+        rxn.gene_reaction_rule = rule
+        hashes.append(fp.hash_components(model, "reactions", ["gpr"])
+                      .at["R1", "gpr"])
+    assert bool(hashes[0] == hashes[1]) is equal
+
+
+@pytest.mark.parametrize("model, kind, aspect, change", [
+    ("textbook", "reactions", "stoichiometry",
+     lambda m: m.reactions.PGI.add_metabolites({m.metabolites.h_c: 1})),
+    ("textbook", "reactions", "bounds",
+     lambda m: setattr(m.reactions.PGI, "upper_bound", 10)),
+    ("textbook", "reactions", "gpr",
+     lambda m: setattr(m.reactions.PGI, "gene_reaction_rule", "b0351")),
+    ("textbook", "reactions", "name",
+     lambda m: setattr(m.reactions.PGI, "name", "isomerase")),
+    ("textbook", "metabolites", "formula",
+     lambda m: setattr(m.metabolites.g6p_c, "formula", "C6H11O9P2")),
+    ("textbook", "metabolites", "charge",
+     lambda m: setattr(m.metabolites.g6p_c, "charge", 0)),
+    ("textbook", "metabolites", "annotation",
+     lambda m: m.metabolites.g6p_c.annotation.update(kegg="C00092")),
+    ("textbook", "genes", "name",
+     lambda m: setattr(m.genes.b4025, "name", "pgi"))
+], indirect=["model"])
+def test_aspect_sensitive(model, kind, aspect, change):
+    """Expect only the hash of the changed aspect to change."""
+    before = fp.fingerprint(model)
+    change(model)
+    after = fp.fingerprint(model)
+    for other in fp.ASPECTS[kind]:
+        assert (before["aspects"][kind][other] !=
+                after["aspects"][kind][other]) is (other == aspect)
+    changed = [key for key, value in iteritems(after[kind])
+               if before[kind][key] != value]
+    assert len(changed) == 1
+    assert after["objective"] == before["objective"]
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_objective(model):
+    """Expect the objective hash to reflect coefficients and direction."""
+    before = fp.hash_objective(model)
+    model.objective_direction = "min"
+    assert fp.hash_objective(model) != before
+    model.objective_direction = "max"
+    assert fp.hash_objective(model) == before
+    model.objective = "PGI"
+    assert fp.hash_objective(model) != before
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+@pytest.mark.parametrize("kind", sorted(fp.ASPECTS))
+def test_fingerprint_matches_components(model, kind):
+    """Expect the fingerprint to agree with the hashes of each aspect."""
+    result = fp.fingerprint(model)
+    hashes = fp.hash_components(model, kind)
+    assert result[kind] == dict(
+        (key, "{:016x}".format(value)) for key, value in
+        zip(hashes.index, fp.combine_aspects(hashes).values.tolist()))
+    for aspect in fp.ASPECTS[kind]:
+        assert (fp.hash_components(model, kind, [aspect])[aspect] ==
+                hashes[aspect]).all()
+        assert result["aspects"][kind][aspect] == fp.digest(hashes[aspect])
+
+
+@pytest.mark.parametrize("model", ["textbook"], indirect=["model"])
+def test_hash_components_unknown(model):
+    """Expect unknown component types or aspects to be rejected."""
+    with pytest.raises(ValueError):
+        fp.hash_components(model, "compartments")
+    with pytest.raises(ValueError):
+        fp.hash_components(model, "genes", ["formula"])
@@ -20,6 +20,7 @@
 from __future__ import absolute_import
 
 import cobra
+import numpy as np
 import pytest
 
 import memote.support.helpers as helpers
@@ -139,13 +140,56 @@ def test_find_transport_reactions(model, num):
 @pytest.mark.parametrize("gpr_str, expected", [
     ("gene1 and gene2", [["gene1", "gene2"]]),
     ("gene1 or gene2", [["gene1"], ["gene2"]]),
-    ("gene1 and (gene2 or gene3)", [["gene1", "gene2"], ["gene1", "gene3"]])
+    ("gene1 and (gene2 or gene3)", [["gene1", "gene2"], ["gene1", "gene3"]]),
+    ("(gene1 OR gene2) AND (gene3 OR gene4)",
+     [["gene1", "gene3"], ["gene1", "gene4"], ["gene2", "gene3"],
+      ["gene2", "gene4"]]),
+    ("gene1 or (gene1 and gene1)", [["gene1"]]),
+    ("orf1 and gene_and", [["gene_and", "orf1"]])
 ])
 def test_find_functional_units(gpr_str, expected):
     """Expect type of enzyme complexes to be identified correctly."""
     assert list(helpers.find_functional_units(gpr_str)) == expected
 
 
+@pytest.mark.parametrize("gpr_str", [
+    "gene1 and",
+    "(gene1 or gene2",
+    "gene1 gene2",
+    "or gene1",
+    ""
+])
+def test_find_functional_units_malformed(gpr_str):
+    """Expect malformed rules to be rejected."""
+    with pytest.raises(ValueError):
+        list(helpers.find_functional_units(gpr_str))
+
+
+def test_find_functional_units_max_terms():
+    """Expect rules that expand to too many units to be rejected."""
+    gpr_str = " and ".join("(a{0:d} or b{0:d})".format(i) for i in range(4))
+    assert len(list(helpers.find_functional_units(gpr_str))) == 16
+    with pytest.raises(ValueError):
+        list(helpers.find_functional_units(gpr_str, max_terms=15))
+
+
+def test_find_functional_units_large_product():
+    """Expect a huge product to be rejected before it is built."""
+    gpr_str = " and ".join(
+        "(" + " or ".join("{}{:d}".format(gene, i) for i in range(5000)) + ")"
+        for gene in "ab")
+    with pytest.raises(ValueError):
+        list(helpers.find_functional_units(gpr_str))
+
+
+def test_find_functional_units_cache_size():
+    """Expect the cache of functional units to be bounded."""
+    list(helpers.find_functional_units("a and b"))
+    info = helpers._functional_units.cache_info()
+    assert info.maxsize == helpers.GPR_CACHE_SIZE
+    assert info.currsize <= helpers.GPR_CACHE_SIZE
+
+
 @pytest.mark.parametrize("model, met_pair, expected", [
     ("converting_reactions", ("a", "b"), 2),
     ("converting_reactions", ("c", "c"), 1)
@@ -153,3 +197,22 @@ def test_find_functional_units(gpr_str, expected):
 def test_find_converting_reactions(model, met_pair, expected):
     """Expect amount of converting reactions to be identified correctly."""
     assert len(helpers.find_converting_reactions(model, met_pair)) == expected
+
+
+def test_formula_cache():
+    """Expect formulas to be parsed again only when they change."""
+    model = cobra.Model()
+    met_a = cobra.Metabolite("a_c", formula="CH4")
+    met_b = cobra.Metabolite("b_c", formula="H2O")
+    model.add_metabolites([met_a, met_b])
+    cache = helpers.get_formula_cache(model)
+    assert cache is helpers.get_formula_cache(model)
+    matrix, elements, known = cache.composition([met_b, met_a])
+    assert known.all()
+    assert dict(zip(elements, matrix[0])) == {"C": 0, "H": 2, "O": 1}
+    assert np.allclose(cache.weights([met_a, met_b]),
+                       [met_a.formula_weight, met_b.formula_weight])
+    met_b.formula = "CO2"
+    matrix, elements, known = cache.composition([met_b])
+    assert dict(zip(elements, matrix[0])) == {"C": 1, "H": 0, "O": 2}
+    assert np.isclose(cache.weights([met_b])[0], met_b.formula_weight)
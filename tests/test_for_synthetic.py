@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ensure the expected functioning of ``memote.synthetic``."""
+
+from __future__ import absolute_import
+
+import pytest
+
+import memote.support.annotation as annotation
+from memote.synthetic import generate_model
+
+
+def describe(model):
+    """Return a comparable description of all reactions."""
+    return [(rxn.id, rxn.reaction, rxn.gene_reaction_rule, rxn.bounds,
+             sorted(rxn.annotation.items())) for rxn in model.reactions]
+
+
+@pytest.mark.parametrize("kwargs, num_mets, num_genes, num_comps", [
+    (dict(num_reactions=500), 375, 400, 3),
+    (dict(num_reactions=800, num_metabolites=500, num_genes=100,
+          num_compartments=5), 500, 100, 5),
+    (dict(num_reactions=300, num_compartments=1, biomass_size=10), 225, 240,
+     1)
+])
+def test_generate_model_size(kwargs, num_mets, num_genes, num_comps):
+    """Expect the model to have the requested size."""
+    model = generate_model(**kwargs)
+    assert len(model.reactions) == kwargs["num_reactions"]
+    assert len(model.metabolites) == num_mets
+    assert len(model.genes) == num_genes
+    assert len(model.compartments) == num_comps
+
+
+def test_generate_model_deterministic():
+    """Expect the same seed to generate the same model."""
+    assert describe(generate_model(300, seed=1)) == \
+        describe(generate_model(300, seed=1))
+    assert describe(generate_model(300, seed=1)) != \
+        describe(generate_model(300, seed=2))
+
+
+def test_generate_model_growth():
+    """Expect the biomass reaction to be the objective and carry flux."""
+    model = generate_model(500, biomass_size=20)
+    biomass = model.reactions.get_by_id("BIOMASS_synthetic")
+    assert len(biomass.metabolites) == 20
+    assert model.slim_optimize() > 0
+
+
+@pytest.mark.parametrize("num_reactions", [3, 5, 8])
+def test_generate_model_small(num_reactions):
+    """Expect tiny models to use their small compartments."""
+    model = generate_model(num_reactions, biomass_size=1)
+    assert len(model.reactions) == num_reactions
+    assert all(len(rxn.metabolites) >= 2 for rxn in model.reactions
+               if rxn.id.startswith("R"))
+
+
+@pytest.mark.parametrize("complexity", [1, 3])
+def test_generate_model_gpr_complexity(complexity):
+    """Expect rules to have at most ``complexity`` squared genes."""
+    model = generate_model(300, gpr_complexity=complexity)
+    sizes = [len(rxn.genes) for rxn in model.reactions]
+    assert max(sizes) <= complexity ** 2
+    if complexity > 1:
+        assert max(sizes) > 1
+
+
+@pytest.mark.parametrize("density", [0.0, 1.0])
+def test_generate_model_annotation_density(density):
+    """Expect the annotations to be valid and to have the given density."""
+    model = generate_model(300, annotation_density=density)
+    expected = len(annotation.METABOLITE_ANNOTATIONS) if density else 0
+    assert all(len(met.annotation) == expected for met in model.metabolites)
+    overview = annotation.generate_component_annotation_miriam_match_overview(
+        model.metabolites, "metabolites")
+    assert all(len(faulty) == 0 for faulty in overview.values())
+    overview = annotation.generate_component_annotation_miriam_match_overview(
+        model.reactions, "reactions")
+    assert all(len(faulty) == 0 for faulty in overview.values())
+
+
+@pytest.mark.parametrize("kwargs", [
+    dict(num_reactions=10, num_metabolites=100),
+    dict(num_reactions=100, biomass_size=1000),
+    dict(num_reactions=100, num_compartments=11),
+    dict(num_reactions=4, num_metabolites=1, num_compartments=1,
+         biomass_size=1)
+])
+def test_generate_model_invalid(kwargs):
+    """Expect impossible requests to be rejected."""
+    with pytest.raises(ValueError):
+        generate_model(**kwargs)
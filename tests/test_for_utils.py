@@ -99,3 +99,19 @@ def test_annotate(notes, func, summary):
     assert res.annotation["message"] is None
     assert res.annotation["type"] == notes["type"]
     assert res.annotation["metric"] == 1.0
+    assert res.depends is None
+    assert res.solver is False
+
+
+def test_annotate_depends():
+    res = utils.annotate(title="One", type="length",
+                         depends=["reactions.bounds", "objective"],
+                         solver=True)(one)
+    assert res.depends == frozenset(["reactions.bounds", "objective"])
+    assert res.solver is True
+
+
+def test_annotate_unknown_depends():
+    with pytest.raises(ValueError):
+        utils.annotate(title="One", type="length",
+                       depends=["reactions.formula"])
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2017 Novo Nordisk Foundation Center for Biosustainability,
+# Technical University of Denmark.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ensure the expected functioning of ``memote.version_info``."""
+
+from __future__ import absolute_import
+
+from os.path import exists
+
+import memote.version_info as version_info
+
+
+def test_get_pkg_info(tmpdir, monkeypatch):
+    """Expect only dependencies to be reported and cached on disk."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmpdir))
+    monkeypatch.setattr(version_info, "_PKG_INFO", dict())
+    info = version_info.get_pkg_info()
+    assert "pandas" in info
+    assert set(info).issubset(version_info.PKG_ORDER)
+    assert exists(version_info._cache_filename())
+
+    def fail():
+        raise AssertionError("The cache was not used.")
+
+    # Neither the in-process nor the disk cache should look up packages.
+    monkeypatch.setattr(version_info, "_read_pkg_info", fail)
+    assert version_info.get_pkg_info() == info
+    monkeypatch.setattr(version_info, "_PKG_INFO", dict())
+    assert version_info.get_pkg_info() == info
+
+
+def test_get_pkg_info_invalidated(tmpdir, monkeypatch):
+    """Expect a changed environment to trigger a new lookup."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmpdir))
+    monkeypatch.setattr(version_info, "_PKG_INFO", dict())
+    version_info.get_pkg_info()
+    monkeypatch.setattr(version_info, "_environment_key", lambda: "changed")
+    monkeypatch.setattr(version_info, "_read_pkg_info",
+                        lambda: {"memote": "0.0.0"})
+    assert version_info.get_pkg_info() == {"memote": "0.0.0"}